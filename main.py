@@ -7,33 +7,104 @@ Un juego de Pong espacial con naves, meteoritos y mallas láser.
 
 Ejecutar:
     python main.py
+    python main.py --headless --matches 100   (simulación Bot vs Bot sin ventana)
 
 Controles:
     Jugador 1: W/S (arriba/abajo)
     Jugador 2: Flechas arriba/abajo
     ESC: Pausar/Salir
     F11: Pantalla completa
-    F3: Mostrar/ocultar FPS
+    F3: Mostrar/ocultar FPS y profiler por fases
 
 Autor: Generado con Claude Code
 """
 
 import sys
+import time
+import argparse
 from pathlib import Path
 
+# Inicio del proceso (para --profile-startup)
+_START_TIME = time.perf_counter()
+
 # Asegurar que el directorio src está en el path
 src_path = Path(__file__).parent / 'src'
 if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
 
 
+def parse_args(argv=None) -> argparse.Namespace:
+    """Procesa los argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Space Pong - Tenis Espacial")
+    parser.add_argument(
+        '--headless', action='store_true',
+        help="Simular partidas Bot vs Bot sin ventana ni render"
+    )
+    parser.add_argument(
+        '--matches', type=int, default=100,
+        help="Número de partidas a simular en modo headless (default: 100)"
+    )
+    parser.add_argument(
+        '--seed', type=int, default=None,
+        help="Semilla base para partidas reproducibles en modo headless"
+    )
+    parser.add_argument(
+        '--difficulty', choices=['easy', 'medium', 'hard'], default='medium',
+        help="Dificultad de los bots en modo headless (default: medium)"
+    )
+    parser.add_argument(
+        '--tick-rate', type=int, default=None,
+        help="Pasos de simulación por segundo en modo headless (menos = más rápido)"
+    )
+    parser.add_argument(
+        '--measure-latency', action='store_true',
+        help="Medir la latencia input -> pantalla y mostrar p50/p99 al salir"
+    )
+    parser.add_argument(
+        '--low-latency', action='store_true',
+        help="Input de baja latencia: movimiento resuelto solo desde eventos, justo antes de simular"
+    )
+    parser.add_argument(
+        '--vsync', action='store_true',
+        help="Ventana con vsync (renderer SCALED): el lienzo se escala en ventana y pantalla completa"
+    )
+    parser.add_argument(
+        '--profile-startup', action='store_true',
+        help="Mostrar el tiempo de arranque por fase: importaciones, ventana, menú y primer frame"
+    )
+    parser.add_argument(
+        '--profile-csv', type=Path, default=None, metavar='RUTA',
+        help="Guardar al salir el perfil de tiempo por fase de los últimos frames en un CSV"
+    )
+    return parser.parse_args(argv)
+
+
 def main():
     """Punto de entrada principal del juego"""
+    args = parse_args()
+
     try:
+        if args.headless:
+            from src.core.headless import run_headless
+            run_headless(args.matches, args.difficulty, args.seed, args.tick_rate)
+            return
+
         from src.core.game import Game
+        from src.core.startup import StartupProfile
+
+        startup = None
+        if args.profile_startup:
+            startup = StartupProfile(_START_TIME)
+            startup.mark('importaciones')
 
         # Crear e iniciar el juego
-        game = Game()
+        game = Game(
+            profile_csv=args.profile_csv,
+            measure_latency=args.measure_latency,
+            low_latency_input=args.low_latency,
+            vsync=args.vsync,
+            startup=startup
+        )
         game.run()
 
     except ImportError as e:
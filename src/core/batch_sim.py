@@ -0,0 +1,638 @@
+"""
+Space Pong - Batch Match Simulator
+Simula miles de partidas Bot vs Bot a la vez con arrays de NumPy
+"""
+
+import math
+import time
+from dataclasses import dataclass
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from .constants import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, SIMULATION_TICK_RATE,
+    SHIP_WIDTH, SHIP_HEIGHT, SHIP_SPEED, SHIP_P1_X, SHIP_P2_X,
+    BALL_SIZE, BALL_INITIAL_SPEED, BALL_MAX_SPEED, BALL_SPEED_INCREMENT,
+    BALL_ROTATION_STEP, MAX_BOUNCE_ANGLE, WALL_BOUNCE_VARIATION,
+    WINNING_SCORE, AI_DIFFICULTY
+)
+
+# Parámetros que replican PlayState, Ball, Ship y AIController
+BALL_ROTATION_SPEED = 180  # Ball.rotation_speed (grados por segundo)
+SHIP_EDGE_MARGIN = 10  # Ship.min_y / max_y: margen extra al borde
+PADDLE_PADDING = 5  # Ship.get_paddle_rect
+PADDLE_SEPARATION = 5  # PhysicsSystem.bounce_off_paddle
+AI_MISTAKE_RANGE = 100  # AIController: desvío de un error grande
+
+
+@dataclass
+class BatchReport:
+    """Resultado de una simulación por lotes"""
+    matches: int = 0
+    wins: tuple[int, int] = (0, 0)
+    unfinished: int = 0
+    mean_match_seconds: float = 0.0  # solo partidas terminadas
+    mean_paddle_hits: float = 0.0  # golpes de nave por partida
+    points: tuple[int, int] = (0, 0)  # puntos anotados por cada lado (todas las partidas)
+    simulated_seconds: float = 0.0  # suma de todas las partidas
+    wall_seconds: float = 0.0
+
+    @property
+    def matches_per_second(self) -> float:
+        """Partidas simuladas por segundo real"""
+        return self.matches / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    @property
+    def point_share_p1(self) -> float:
+        """Fracción de los puntos anotados por el jugador 1"""
+        total = self.points[0] + self.points[1]
+        return self.points[0] / total if total else 0.0
+
+    @property
+    def points_per_minute(self) -> float:
+        """Puntos por minuto de juego simulado (informativo aunque no terminen)"""
+        minutes = self.simulated_seconds / 60.0
+        return (self.points[0] + self.points[1]) / minutes if minutes > 0 else 0.0
+
+    def summary(self) -> str:
+        """Retorna un resumen legible del resultado"""
+        return "\n".join([
+            f"Partidas:            {self.matches}",
+            f"Victorias P1/P2:     {self.wins[0]}/{self.wins[1]}",
+            f"Sin terminar:        {self.unfinished}",
+            f"Puntos P1/P2:        {self.points[0]}/{self.points[1]} "
+            f"({self.point_share_p1:.1%} P1)",
+            f"Puntos/minuto:       {self.points_per_minute:.2f}",
+            f"Duración media:      {self.mean_match_seconds:.1f} s",
+            f"Golpes por partida:  {self.mean_paddle_hits:.1f}",
+            f"Tiempo simulado:     {self.simulated_seconds:.1f} s",
+            f"Tiempo real:         {self.wall_seconds:.2f} s",
+            f"Partidas/segundo:    {self.matches_per_second:.2f}",
+        ])
+
+
+class BatchMatchSimulator:
+    """
+    Simula N partidas Bot vs Bot en paralelo.
+
+    El estado de meteoritos, naves, marcadores e IAs se guarda en arrays de
+    longitud N y cada paso avanza todas las partidas con operaciones
+    vectorizadas, en el mismo orden que PlayState.update:
+    IA -> naves -> meteorito (paredes) -> rebotes en naves (barridos) -> puntuación.
+
+    Reproduce los rectángulos enteros de pygame (centro truncado con int) y el
+    tamaño del meteorito según su frame de rotación, así que con la misma
+    secuencia aleatoria los resultados coinciden con el camino de objetos.
+    Los números aleatorios salen de un np.random.Generator por lotes, por lo
+    que con ruido real las partidas son estadísticamente equivalentes, no
+    idénticas a las de HeadlessRunner con la misma semilla.
+
+    El láser no se modela: las naves solo se mueven en vertical y nunca lo tocan.
+    """
+
+    def __init__(
+        self,
+        count: int,
+        difficulty_p1: Union[str, dict] = 'medium',
+        difficulty_p2: Union[str, dict] = 'medium',
+        rng: Optional[np.random.Generator] = None,
+        seed: Optional[int] = None,
+        ball_rect_sizes: Optional[Sequence[tuple[int, int]]] = None,
+        ship_sizes: Optional[Sequence[tuple[int, int]]] = None
+    ):
+        """
+        Inicializa el simulador.
+
+        Args:
+            count: Número de partidas simultáneas
+            difficulty_p1: Dificultad (clave de AI_DIFFICULTY) o parámetros de la IA izquierda
+            difficulty_p2: Igual para la IA derecha
+            rng: Generador aleatorio (solo se usa rng.random(n))
+            seed: Semilla si no se pasa rng
+            ball_rect_sizes: (ancho, alto) del meteorito por frame de rotación
+                (None = cuadrado de BALL_SIZE fijo)
+            ship_sizes: (ancho, alto) de la nave izquierda y derecha
+                (None = SHIP_WIDTH x SHIP_HEIGHT)
+        """
+        self.count = count
+        self.rng = rng if rng is not None else np.random.default_rng(seed)
+
+        self.ai = [self._ai_settings(difficulty_p1), self._ai_settings(difficulty_p2)]
+
+        # Rectángulo del meteorito por frame de rotación
+        sizes = np.array(ball_rect_sizes or [(BALL_SIZE, BALL_SIZE)], dtype=np.int64)
+        self._ball_w = sizes[:, 0]
+        self._ball_h = sizes[:, 1]
+        self.rotation_step = BALL_ROTATION_STEP
+
+        # Naves: X fija (centro), tamaño del sprite y límites verticales
+        ship_sizes = ship_sizes or [(SHIP_WIDTH, SHIP_HEIGHT)] * 2
+        self.ship_x = (float(SHIP_P1_X + SHIP_WIDTH // 2), float(SHIP_P2_X + SHIP_WIDTH // 2))
+        self.ship_w = (int(ship_sizes[0][0]), int(ship_sizes[1][0]))
+        self.ship_h = (int(ship_sizes[0][1]), int(ship_sizes[1][1]))
+        self.ship_min_y = SHIP_HEIGHT // 2 + SHIP_EDGE_MARGIN
+        self.ship_max_y = SCREEN_HEIGHT - SHIP_HEIGHT // 2 - SHIP_EDGE_MARGIN
+        self.ship_speed = tuple(SHIP_SPEED * ai['speed_multiplier'] for ai in self.ai)
+
+        shape = (count,)
+        f64 = np.float64
+
+        # Meteorito
+        self.ball_x = np.zeros(shape, f64)
+        self.ball_y = np.zeros(shape, f64)
+        self.ball_vx = np.zeros(shape, f64)
+        self.ball_vy = np.zeros(shape, f64)
+        self.ball_speed = np.zeros(shape, f64)
+        self.ball_rotation = np.zeros(shape, f64)
+
+        # Último rebote (clave de la predicción, como Ball.bounce_event)
+        self.event_x = np.zeros(shape, f64)
+        self.event_y = np.zeros(shape, f64)
+        self.event_vx = np.zeros(shape, f64)
+        self.event_vy = np.zeros(shape, f64)
+
+        # Naves e IAs (índice 0 = jugador 1, 1 = jugador 2)
+        self.ship_y = [np.zeros(shape, f64) for _ in range(2)]
+        self.ship_dir = [np.zeros(shape, np.int64) for _ in range(2)]
+        self.target_y = [np.zeros(shape, f64) for _ in range(2)]
+        self.reaction_timer = [np.zeros(shape, f64) for _ in range(2)]
+        self.last_ball_dir = [np.zeros(shape, np.int64) for _ in range(2)]
+        self.drift_offset = [np.zeros(shape, f64) for _ in range(2)]
+        self.drift_timer = [np.zeros(shape, f64) for _ in range(2)]
+        self.drift_target = [np.zeros(shape, f64) for _ in range(2)]
+
+        # Partida
+        self.score = [np.zeros(shape, np.int64) for _ in range(2)]
+        self.active = np.zeros(shape, bool)
+        self.winner = np.zeros(shape, np.int64)
+        self.steps = np.zeros(shape, np.int64)
+        self.paddle_hits = np.zeros(shape, np.int64)
+
+        self.reset()
+
+    @staticmethod
+    def _ai_settings(difficulty: Union[str, dict]) -> dict:
+        """Parámetros de IA a partir de una dificultad o un diccionario propio"""
+        if isinstance(difficulty, dict):
+            return {**AI_DIFFICULTY['medium'], **difficulty}
+        return AI_DIFFICULTY.get(difficulty, AI_DIFFICULTY['medium'])
+
+    def _uniform(self, low, high, n: int) -> np.ndarray:
+        """Equivalente por lotes de random.uniform (a + (b - a) * random())"""
+        return low + (high - low) * self.rng.random(n)
+
+    # -------------------------------------------------------------------------
+    # Reinicios
+    # -------------------------------------------------------------------------
+
+    def reset(self):
+        """Empieza todas las partidas desde cero (PlayState._reset_game)"""
+        everything = np.ones(self.count, bool)
+
+        for side in range(2):
+            self.score[side][:] = 0
+            self.target_y[side][:] = SCREEN_HEIGHT // 2
+            self.reaction_timer[side][:] = 0
+            self.last_ball_dir[side][:] = 0
+            self.drift_offset[side][:] = 0
+            self.drift_timer[side][:] = 0
+            self.drift_target[side][:] = 0
+
+        self._reset_ships(everything)
+        self._reset_ball(everything, towards_player=None)
+
+        self.active[:] = True
+        self.winner[:] = 0
+        self.steps[:] = 0
+        self.paddle_hits[:] = 0
+
+    def _reset_ships(self, mask: np.ndarray):
+        """Naves al centro y quietas (Ship.reset_position)"""
+        for side in range(2):
+            self.ship_y[side][mask] = SCREEN_HEIGHT // 2
+            self.ship_dir[side][mask] = 0
+
+    def _reset_ball(self, mask: np.ndarray, towards_player: Optional[int]):
+        """
+        Meteorito al centro con dirección aleatoria (Ball.reset).
+
+        Args:
+            mask: Partidas a reiniciar
+            towards_player: 1 o 2 para dirigirlo hacia ese jugador, None = al azar
+        """
+        n = int(np.count_nonzero(mask))
+        if n == 0:
+            return
+
+        self.ball_x[mask] = SCREEN_WIDTH // 2
+        self.ball_y[mask] = SCREEN_HEIGHT // 2
+        self.ball_speed[mask] = BALL_INITIAL_SPEED
+        self.ball_rotation[mask] = 0
+
+        angle = self._uniform(-math.pi / 4, math.pi / 4, n)
+        if towards_player is None:
+            direction = np.where(self.rng.random(n) < 0.5, -1, 1)
+        else:
+            direction = -1 if towards_player == 1 else 1
+
+        self.ball_vx[mask] = np.cos(angle) * BALL_INITIAL_SPEED * direction
+        self.ball_vy[mask] = np.sin(angle) * BALL_INITIAL_SPEED
+        self._record_bounce(mask)
+
+    def _record_bounce(self, mask: np.ndarray):
+        """Guarda el estado del meteorito como inicio de trayectoria"""
+        self.event_x[mask] = self.ball_x[mask]
+        self.event_y[mask] = self.ball_y[mask]
+        self.event_vx[mask] = self.ball_vx[mask]
+        self.event_vy[mask] = self.ball_vy[mask]
+
+    def set_ball(self, x, y, vx, vy):
+        """
+        Fija el estado del meteorito (p.ej. para partir de condiciones dadas).
+
+        Args:
+            x, y: Posición (escalares o arrays de longitud N)
+            vx, vy: Velocidad
+        """
+        self.ball_x[:] = x
+        self.ball_y[:] = y
+        self.ball_vx[:] = vx
+        self.ball_vy[:] = vy
+        self.ball_speed[:] = np.hypot(self.ball_vx, self.ball_vy)
+        self._record_bounce(np.ones(self.count, bool))
+
+    # -------------------------------------------------------------------------
+    # Paso de simulación
+    # -------------------------------------------------------------------------
+
+    def step(self, dt: float):
+        """
+        Avanza un paso fijo todas las partidas en juego.
+
+        Tras un punto la ronda sigue sin pausa, como en PlayState
+        (_reset_round pone reset_timer a 0 justo después de fijarlo).
+
+        Args:
+            dt: Paso de simulación en segundos
+        """
+        live = self.active.copy()
+        if not live.any():
+            return
+        self.steps[live] += 1
+
+        # Mismo orden que PlayState.update (IA derecha primero)
+        self._update_ai(1, live, dt)
+        self._update_ai(0, live, dt)
+        self._update_ships(live, dt)
+        start_x = self.ball_x.copy()
+        start_y = self.ball_y.copy()
+        self._update_ball(live, dt)
+        self._check_paddles(live, start_x, start_y, dt)
+        self._check_scoring(live)
+
+    def _update_ai(self, side: int, live: np.ndarray, dt: float):
+        """
+        AIController.update vectorizado.
+
+        Args:
+            side: 0 (jugador 1) o 1 (jugador 2)
+            live: Partidas en juego
+            dt: Paso de simulación
+        """
+        ai = self.ai[side]
+
+        # Desenfoque (drift)
+        drift_timer = self.drift_timer[side]
+        drift_target = self.drift_target[side]
+        drift_timer[live] -= dt
+        expired = live & (drift_timer <= 0)
+        n = int(np.count_nonzero(expired))
+        if n:
+            max_drift = SCREEN_HEIGHT * ai.get('focus_drift', 0.3) * 0.5
+            drift_target[expired] = self._uniform(-max_drift, max_drift, n)
+            drift_timer[expired] = self._uniform(0.5, 2.0, n)
+
+        drift_offset = self.drift_offset[side]
+        drift_offset[live] += (
+            (drift_target[live] - drift_offset[live]) * ai.get('drift_speed', 1.0) * dt
+        )
+
+        # Reacción: recalcular al expirar el timer o al cambiar la dirección
+        reaction_timer = self.reaction_timer[side]
+        reaction_timer[live] -= dt
+
+        ball_dir = np.where(self.ball_vx > 0, 1, -1)
+        changed = live & (ball_dir != self.last_ball_dir[side])
+        self.last_ball_dir[side][changed] = ball_dir[changed]
+        reaction_timer[changed] = 0
+
+        coming = self.ball_vx < 0 if side == 0 else self.ball_vx > 0
+        target_y = self.target_y[side]
+
+        predict = live & coming & (reaction_timer <= 0)
+        n = int(np.count_nonzero(predict))
+        if n:
+            error = ai['prediction_error']
+            target = self._predict(predict, self.ship_x[side]) + self._uniform(-error, error, n)
+            reaction_timer[predict] = ai['reaction_delay']
+
+            mistakes = self.rng.random(n) < ai['mistake_chance']
+            m = int(np.count_nonzero(mistakes))
+            if m:
+                target[mistakes] += self._uniform(-AI_MISTAKE_RANGE, AI_MISTAKE_RANGE, m)
+            target_y[predict] = target
+
+        target_y[live & ~coming] = SCREEN_HEIGHT // 2
+
+        # Dirección con zona muerta
+        effective = target_y + drift_offset
+        ship_y = self.ship_y[side]
+        threshold = SHIP_HEIGHT // 4
+        direction = np.where(
+            effective < ship_y - threshold, -1,
+            np.where(effective > ship_y + threshold, 1, 0)
+        )
+        self.ship_dir[side][live] = direction[live]
+
+    def _predict(self, mask: np.ndarray, target_x: float) -> np.ndarray:
+        """
+        predict_intercept_y vectorizado desde el último rebote (InterceptCache).
+
+        Args:
+            mask: Partidas a predecir
+            target_x: X objetivo
+
+        Returns:
+            Y predicha por partida de la máscara
+        """
+        x = self.event_x[mask]
+        y = self.event_y[mask]
+        vx = self.event_vx[mask]
+        vy = self.event_vy[mask]
+
+        half_size = BALL_SIZE // 2
+        low = half_size
+        span = SCREEN_HEIGHT - 2 * half_size
+
+        moving = vx != 0
+        safe_vx = np.where(moving, vx, 1.0)
+        t = np.maximum(0.0, (target_x - x) / safe_vx)
+
+        offset = np.mod(np.clip(y, low, low + span) - low + vy * t, 2 * span)
+        offset = np.where(offset > span, 2 * span - offset, offset)
+
+        return np.where(moving, low + offset, SCREEN_HEIGHT // 2)
+
+    def _update_ships(self, live: np.ndarray, dt: float):
+        """Ship.update vectorizado"""
+        for side in range(2):
+            velocity = self.ship_dir[side] * self.ship_speed[side]
+            new_y = np.clip(self.ship_y[side] + velocity * dt, self.ship_min_y, self.ship_max_y)
+            self.ship_y[side][live] = new_y[live]
+
+    def _update_ball(self, live: np.ndarray, dt: float):
+        """Ball.update vectorizado: movimiento, rotación y rebotes en paredes"""
+        self.ball_x[live] += self.ball_vx[live] * dt
+        self.ball_y[live] += self.ball_vy[live] * dt
+
+        rotation_dir = np.where(self.ball_vx[live] > 0, 1, -1)
+        rotation = self.ball_rotation[live] + BALL_ROTATION_SPEED * dt * rotation_dir
+        self.ball_rotation[live] = np.mod(rotation, 360)
+
+        half_size = BALL_SIZE // 2
+        top = live & (self.ball_y - half_size <= 0)
+        bottom = live & ~top & (self.ball_y + half_size >= SCREEN_HEIGHT)
+
+        for mask, y, sign in ((top, half_size, 1), (bottom, SCREEN_HEIGHT - half_size, -1)):
+            n = int(np.count_nonzero(mask))
+            if n:
+                self.ball_y[mask] = y
+                self.ball_vy[mask] = sign * np.abs(self.ball_vy[mask]) + self._uniform(
+                    -WALL_BOUNCE_VARIATION, WALL_BOUNCE_VARIATION, n
+                )
+                self._record_bounce(mask)
+
+    def _check_paddles(self, live: np.ndarray, start_x: np.ndarray, start_y: np.ndarray, dt: float):
+        """
+        Colisión barrida y rebote con las naves (PlayState._check_collisions).
+
+        Args:
+            live: Partidas en juego
+            start_x, start_y: Posición del meteorito al inicio del paso
+            dt: Paso de simulación
+        """
+        # Rectángulo del meteorito según el frame de rotación actual
+        frame = np.rint(self.ball_rotation / self.rotation_step).astype(np.int64) % len(self._ball_w)
+        ball_w = self._ball_w[frame]
+        ball_h = self._ball_h[frame]
+
+        for side in range(2):
+            ship_w = self.ship_w[side]
+            ship_h = self.ship_h[side]
+            ship_left = int(self.ship_x[side]) - ship_w // 2
+
+            paddle_left = ship_left + PADDLE_PADDING
+            paddle_w = ship_w - PADDLE_PADDING * 2
+            paddle_h = ship_h - PADDLE_PADDING * 2
+
+            # Descarte barato: solo las partidas cuyo recorrido en X pasa
+            # cerca de la nave (margen para el redondeo de los rects)
+            approaching = self.ball_vx < 0 if side == 0 else self.ball_vx > 0
+            reach = self._ball_w.max() // 2 + 2
+            near = (
+                live & approaching
+                & (np.minimum(start_x, self.ball_x) < paddle_left + paddle_w + reach)
+                & (np.maximum(start_x, self.ball_x) > paddle_left - reach)
+            )
+            idx = np.flatnonzero(near)
+            if idx.size == 0:
+                continue
+
+            sx, sy = start_x[idx], start_y[idx]
+            ex, ey = self.ball_x[idx], self.ball_y[idx]
+            w, h = ball_w[idx], ball_h[idx]
+
+            ball_left = np.trunc(ex).astype(np.int64) - w // 2
+            ball_top = np.trunc(ey).astype(np.int64) - h // 2
+            paddle_top = np.trunc(self.ship_y[side][idx]).astype(np.int64) - ship_h // 2 + PADDLE_PADDING
+
+            overlap = (
+                (ball_left < paddle_left + paddle_w) & (paddle_left < ball_left + w)
+                & (ball_top < paddle_top + paddle_h) & (paddle_top < ball_top + h)
+            )
+
+            # Barrido (CollisionSystem.sweep_ball_rect); si no hay contacto
+            # en el recorrido vale el solapamiento al final del paso
+            swept, t_enter = self._sweep(
+                sx, sy, ex, ey, w / 2, h / 2,
+                (paddle_left, paddle_left + paddle_w), (paddle_top, paddle_top + paddle_h)
+            )
+
+            hit = swept | overlap
+            if not hit.any():
+                continue
+
+            toi = np.where(swept, t_enter, 1.0)[hit]
+            idx = idx[hit]
+            self.ball_x[idx] = sx[hit] + (ex[hit] - sx[hit]) * toi
+            self.ball_y[idx] = sy[hit] + (ey[hit] - sy[hit]) * toi
+            self._bounce_off_paddle(idx, side, ship_left, ball_w)
+
+            # Resto del paso con la nueva velocidad
+            remaining = (1.0 - toi) * dt
+            self.ball_x[idx] += self.ball_vx[idx] * remaining
+            self.ball_y[idx] += self.ball_vy[idx] * remaining
+
+    @staticmethod
+    def _sweep(
+        start_x: np.ndarray, start_y: np.ndarray,
+        end_x: np.ndarray, end_y: np.ndarray,
+        half_w: np.ndarray, half_h: np.ndarray,
+        rect_x: tuple, rect_y: tuple
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        CollisionSystem.sweep_ball_rect vectorizado (método de los slabs).
+
+        Args:
+            start_x, start_y: Centro del meteorito al inicio del paso
+            end_x, end_y: Centro al final del paso
+            half_w, half_h: Semitamaños del meteorito
+            rect_x: (izquierda, derecha) del rectángulo de la nave
+            rect_y: (arriba, abajo) del rectángulo
+
+        Returns:
+            (máscara de contacto, fracción del paso al entrar)
+        """
+        t_enter = np.zeros(len(start_x))
+        t_exit = np.ones(len(start_x))
+        valid = np.ones(len(start_x), bool)
+
+        for start, end, low, high in (
+            (start_x, end_x, rect_x[0] - half_w, rect_x[1] + half_w),
+            (start_y, end_y, rect_y[0] - half_h, rect_y[1] + half_h)
+        ):
+            delta = end - start
+            still = delta == 0
+            valid &= ~still | ((low < start) & (start < high))
+
+            safe = np.where(still, 1.0, delta)
+            t1 = (low - start) / safe
+            t2 = (high - start) / safe
+            t_enter = np.where(still, t_enter, np.maximum(t_enter, np.minimum(t1, t2)))
+            t_exit = np.where(still, t_exit, np.minimum(t_exit, np.maximum(t1, t2)))
+
+        return valid & (t_enter < t_exit), t_enter
+
+    def _bounce_off_paddle(self, hit: np.ndarray, side: int, ship_left: int, ball_w: np.ndarray):
+        """
+        PhysicsSystem.bounce_off_paddle vectorizado.
+
+        Args:
+            hit: Índices de las partidas con colisión
+            side: Nave golpeada
+            ship_left: X izquierda del rectángulo de la nave
+            ball_w: Ancho del rectángulo del meteorito por partida
+        """
+        ship_h = self.ship_h[side]
+        relative_y = np.clip((self.ball_y[hit] - self.ship_y[side][hit]) / (ship_h / 2), -1, 1)
+        bounce_angle = relative_y * math.radians(MAX_BOUNCE_ANGLE)
+
+        new_speed = np.minimum(self.ball_speed[hit] * BALL_SPEED_INCREMENT, BALL_MAX_SPEED)
+        self.ball_speed[hit] = new_speed
+
+        direction = 1 if side == 0 else -1
+        vx = np.cos(bounce_angle) * new_speed * direction
+        vy = np.sin(bounce_angle) * new_speed
+
+        min_x_speed = new_speed * 0.3
+        vx = np.where(np.abs(vx) < min_x_speed, min_x_speed * direction, vx)
+        self.ball_vx[hit] = vx
+        self.ball_vy[hit] = vy
+
+        # Separar el meteorito de la nave
+        if side == 0:
+            self.ball_x[hit] = ship_left + self.ship_w[0] + ball_w[hit] // 2 + PADDLE_SEPARATION
+        else:
+            self.ball_x[hit] = ship_left - ball_w[hit] // 2 - PADDLE_SEPARATION
+
+        self.paddle_hits[hit] += 1
+        self._record_bounce(hit)
+
+    def _check_scoring(self, live: np.ndarray):
+        """Puntos, reinicio de ronda y ganador (PlayState._check_scoring)"""
+        out_left = live & (self.ball_x + BALL_SIZE < 0)
+        out_right = live & ~out_left & (self.ball_x - BALL_SIZE > SCREEN_WIDTH)
+
+        # Anota el jugador contrario al lado por el que sale; el meteorito
+        # se relanza hacia el que recibió el punto
+        for mask, scorer, towards in ((out_right, 0, 2), (out_left, 1, 1)):
+            if not mask.any():
+                continue
+            self.score[scorer][mask] += 1
+            self._reset_ships(mask)
+            self._reset_ball(mask, towards)
+
+        scored = out_left | out_right
+        if scored.any():
+            won_p1 = scored & (self.score[0] >= WINNING_SCORE)
+            won_p2 = scored & ~won_p1 & (self.score[1] >= WINNING_SCORE)
+            self.winner[won_p1] = 1
+            self.winner[won_p2] = 2
+            self.active[won_p1 | won_p2] = False
+
+    # -------------------------------------------------------------------------
+    # Ejecución
+    # -------------------------------------------------------------------------
+
+    def run(
+        self,
+        tick_rate: int = SIMULATION_TICK_RATE,
+        max_match_seconds: float = 600.0
+    ) -> BatchReport:
+        """
+        Simula todas las partidas hasta que terminen o se agote el tiempo.
+
+        Args:
+            tick_rate: Pasos de simulación por segundo
+            max_match_seconds: Tiempo simulado máximo por partida
+
+        Returns:
+            Reporte con resultados y rendimiento
+        """
+        dt = 1.0 / max(1, tick_rate)
+        max_steps = int(max_match_seconds / dt)
+
+        start = time.perf_counter()
+        for _ in range(max_steps):
+            if not self.active.any():
+                break
+            self.step(dt)
+        wall_seconds = time.perf_counter() - start
+
+        return self.report(dt, wall_seconds)
+
+    def report(self, dt: float, wall_seconds: float = 0.0) -> BatchReport:
+        """
+        Resume el estado actual de las partidas.
+
+        Args:
+            dt: Paso de simulación usado
+            wall_seconds: Tiempo real empleado
+
+        Returns:
+            Reporte de la simulación
+        """
+        finished = self.winner > 0
+        durations = self.steps * dt
+
+        return BatchReport(
+            matches=self.count,
+            wins=(int(np.count_nonzero(self.winner == 1)), int(np.count_nonzero(self.winner == 2))),
+            unfinished=int(np.count_nonzero(~finished)),
+            mean_match_seconds=float(durations[finished].mean()) if finished.any() else 0.0,
+            mean_paddle_hits=float(self.paddle_hits.mean()) if self.count else 0.0,
+            points=(int(self.score[0].sum()), int(self.score[1].sum())),
+            simulated_seconds=float(durations.sum()),
+            wall_seconds=wall_seconds
+        )
@@ -9,6 +9,16 @@ Todas las constantes del juego centralizadas
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FPS = 60
+SIMULATION_TICK_RATE = 120  # pasos de simulación por segundo (timestep fijo)
+MAX_SIMULATION_STEPS = 5  # máximo de pasos de recuperación por frame
+DIRTY_RECT_MAX_COVERAGE = 0.5  # fracción de pantalla sucia a partir de la cual se hace flip completo
+FRAME_SPIN_THRESHOLD = 0.002  # segundos finales de cada frame esperados con espera activa (sin vsync)
+FRAME_PACING_HISTORY = 240  # intervalos de frame guardados para medir el ritmo
+IDLE_STATIC_FPS = 10  # ritmo con pantalla estática (pausa, fin de partida)
+IDLE_INACTIVE_FPS = 5  # ritmo con la ventana sin foco o minimizada
+IDLE_ATTRACT_FPS = 30  # ritmo tras un rato sin input (menú o demo desatendidos)
+IDLE_INPUT_TIMEOUT = 60.0  # segundos sin input para considerar el juego desatendido
+IDLE_POLL_INTERVAL = 0.01  # cada cuánto se miran los eventos durante la espera en reposo
 GAME_TITLE = "Space Pong - Tenis Espacial"
 
 # =============================================================================
@@ -49,8 +59,11 @@ BALL_SPEED_INCREMENT = 1.05  # multiplicador por cada golpe (5% incremento)
 SHIP_WIDTH = 80
 SHIP_HEIGHT = 100
 BALL_SIZE = 40
+BALL_ROTATION_STEP = 2  # grados entre frames pre-rotados del meteorito
+BALL_TRAIL_LENGTH = 5  # posiciones guardadas para la estela del meteorito
 LASER_GRID_WIDTH = 10
 LASER_GRID_HEIGHT = SCREEN_HEIGHT
+LASER_PULSE_FRAMES = 16  # niveles de alpha pre-calculados para el pulso del láser
 
 # Posiciones
 SHIP_MARGIN = 50  # distancia del borde de pantalla
@@ -97,6 +110,61 @@ AI_DIFFICULTY = {
     }
 }
 
+# =============================================================================
+# MENU
+# =============================================================================
+MENU_STAR_COUNT = 100  # estrellas del fondo del menú (soporta 10k+ con NumPy)
+
+# =============================================================================
+# ASSET CACHE
+# =============================================================================
+TEXT_CACHE_MAX_BYTES = 4 * 1024 * 1024  # memoria máxima de textos renderizados
+ASSET_PRELOAD_BUDGET = 0.004  # segundos por frame del menú dedicados a precargar la partida
+
+# =============================================================================
+# DEBUG
+# =============================================================================
+PROFILER_CAPACITY = 300  # frames guardados en el buffer circular del profiler
+
+# =============================================================================
+# ADAPTIVE QUALITY
+# =============================================================================
+# Niveles de calidad, de mayor a menor coste de render
+QUALITY_LEVELS = [
+    {
+        'name': 'alta',
+        'laser_particles': True,
+        'simple_laser': False,
+        'trail_length': BALL_TRAIL_LENGTH,
+        'minimal_scoreboard': False
+    },
+    {
+        'name': 'media',
+        'laser_particles': False,
+        'simple_laser': False,
+        'trail_length': 2,
+        'minimal_scoreboard': False
+    },
+    {
+        'name': 'baja',
+        'laser_particles': False,
+        'simple_laser': False,
+        'trail_length': 0,  # meteorito sin estela
+        'minimal_scoreboard': True
+    },
+    {
+        'name': 'mínima',
+        'laser_particles': False,
+        'simple_laser': True,
+        'trail_length': 0,
+        'minimal_scoreboard': True
+    }
+]
+QUALITY_WINDOW_FRAMES = 30  # frames promediados antes de decidir
+QUALITY_DOWNGRADE_RATIO = 0.85  # bajar si el trabajo medio supera este % del presupuesto
+QUALITY_UPGRADE_RATIO = 0.5  # subir si queda por debajo de este % ...
+QUALITY_UPGRADE_WINDOWS = 4  # ... durante estas ventanas seguidas
+
 # =============================================================================
 # CONTROLS
 # =============================================================================
@@ -134,6 +202,7 @@ class GameState:
 class GameMode:
     PVP = 'pvp'  # Player vs Player
     PVE = 'pve'  # Player vs Bot
+    EVE = 'eve'  # Bot vs Bot (simulación headless)
 
 # =============================================================================
 # ASSET PATHS
@@ -0,0 +1,105 @@
+"""
+Space Pong - Dirty Rect Tracker
+Presentación parcial de pantalla: solo se restauran y actualizan las zonas que cambian
+"""
+
+import pygame
+from typing import Optional
+
+from .constants import DIRTY_RECT_MAX_COVERAGE
+
+
+class DirtyRectTracker:
+    """
+    Lleva la cuenta de las zonas dibujadas en cada frame.
+    Restaura el fondo estático solo donde se dibujó en el frame anterior y
+    presenta con pygame.display.update(rects). Si la zona sucia supera el
+    umbral, vuelve a pygame.display.flip().
+    """
+
+    def __init__(self, max_coverage: float = DIRTY_RECT_MAX_COVERAGE):
+        """
+        Inicializa el tracker.
+
+        Args:
+            max_coverage: Fracción de pantalla a partir de la cual se hace flip completo
+        """
+        self.max_coverage = max_coverage
+
+        # Rects dibujados en el frame anterior (None = pantalla desconocida)
+        self._previous: Optional[list[pygame.Rect]] = None
+        self._current: list[pygame.Rect] = []
+        self._full_frame = True
+
+        # Estadísticas
+        self.partial_frames = 0
+        self.full_frames = 0
+        self.last_coverage = 1.0
+
+    def reset(self):
+        """Fuerza un frame completo (cambio de estado, overlays, cambio de modo de video)"""
+        self._previous = None
+        self._current = []
+
+    def restore(self, screen: pygame.Surface, background: pygame.Surface):
+        """
+        Restaura el fondo sobre las zonas dibujadas en el frame anterior.
+
+        Args:
+            screen: Superficie de pantalla
+            background: Capa estática del tamaño de la pantalla
+        """
+        self._current = []
+
+        if self._previous is None:
+            screen.blit(background, (0, 0))
+            self._full_frame = True
+            return
+
+        self._full_frame = False
+        for rect in self._previous:
+            screen.blit(background, rect, rect)
+
+    def add(self, rect: Optional[pygame.Rect]):
+        """
+        Registra una zona dibujada en este frame.
+
+        Args:
+            rect: Rectángulo dibujado (se ignora si es None o vacío)
+        """
+        if rect and rect.width > 0 and rect.height > 0:
+            self._current.append(rect)
+
+    def add_all(self, rects: list[pygame.Rect]):
+        """Registra varias zonas dibujadas en este frame"""
+        for rect in rects:
+            self.add(rect)
+
+    def present(self, screen: pygame.Surface):
+        """
+        Presenta el frame actual.
+
+        Args:
+            screen: Superficie de pantalla
+        """
+        if self._full_frame:
+            pygame.display.flip()
+            self.full_frames += 1
+            self.last_coverage = 1.0
+        else:
+            screen_rect = screen.get_rect()
+            rects = [rect.clip(screen_rect) for rect in self._previous + self._current]
+            rects = [rect for rect in rects if rect.width > 0 and rect.height > 0]
+
+            covered = sum(rect.width * rect.height for rect in rects)
+            self.last_coverage = covered / (screen_rect.width * screen_rect.height)
+
+            if self.last_coverage > self.max_coverage:
+                pygame.display.flip()
+                self.full_frames += 1
+            else:
+                pygame.display.update(rects)
+                self.partial_frames += 1
+
+        self._previous = self._current
+        self._current = []
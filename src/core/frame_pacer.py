@@ -0,0 +1,196 @@
+"""
+Space Pong - Frame Pacer
+Ritmo de frames estable: vsync si está disponible, si no espera híbrida sleep + spin
+"""
+
+import math
+import time
+import statistics
+from collections import deque
+from typing import Callable, Optional
+
+from .constants import FRAME_SPIN_THRESHOLD, FRAME_PACING_HISTORY, IDLE_POLL_INTERVAL
+
+
+class FramePacer:
+    """
+    Controla el ritmo de los frames.
+
+    - Con vsync activo, la espera la hace el flip del display y aquí solo se mide.
+    - Sin vsync, cada frame tiene una fecha límite (deadline) en perf_counter:
+      se duerme con time.sleep hasta poco antes y el resto se espera activamente,
+      evitando la granularidad de milisegundos de pygame.time.Clock.tick.
+
+    Si con vsync los frames llegan bastante más rápido que el FPS objetivo
+    (driver que ignora el vsync o monitor de mayor frecuencia), se pasa a la
+    espera por software.
+    """
+
+    def __init__(
+        self,
+        target_fps: int,
+        spin_threshold: float = FRAME_SPIN_THRESHOLD,
+        history: int = FRAME_PACING_HISTORY
+    ):
+        """
+        Inicializa el pacer.
+
+        Args:
+            target_fps: FPS objetivo
+            spin_threshold: Segundos finales de cada frame esperados con espera activa
+            history: Intervalos guardados para las estadísticas
+        """
+        self.spin_threshold = spin_threshold
+        self.set_target_fps(target_fps)
+
+        self.vsync_active = False
+        self._vsync_checked = True
+
+        self._deadline: Optional[float] = None
+        self._last: Optional[float] = None
+        self._intervals: deque[float] = deque(maxlen=max(2, history))
+
+    def set_target_fps(self, target_fps: int):
+        """
+        Cambia el FPS objetivo.
+
+        Args:
+            target_fps: FPS objetivo
+        """
+        self.target_fps = max(1, target_fps)
+        self.period = 1.0 / self.target_fps
+
+    def set_vsync(self, active: bool):
+        """
+        Indica si el display se creó con vsync.
+
+        Args:
+            active: True si se pidió vsync y set_mode lo aceptó
+        """
+        self.vsync_active = active
+        self._vsync_checked = not active
+        self._deadline = None
+        self._intervals.clear()
+
+    def wait(self) -> float:
+        """
+        Espera hasta el inicio del siguiente frame.
+
+        Returns:
+            Segundos reales transcurridos desde el frame anterior
+        """
+        now = time.perf_counter()
+
+        if not self.vsync_active:
+            if self._deadline is None:
+                self._deadline = now
+
+            self._deadline += self.period
+
+            if self._deadline < now - self.period:
+                # Muy atrasados: no intentar recuperar con frames seguidos
+                self._deadline = now
+            else:
+                remaining = self._deadline - now
+                if remaining > self.spin_threshold:
+                    time.sleep(remaining - self.spin_threshold)
+                while time.perf_counter() < self._deadline:
+                    pass
+
+            now = time.perf_counter()
+
+        interval = 0.0 if self._last is None else now - self._last
+        self._last = now
+
+        if interval > 0:
+            self._intervals.append(interval)
+            if not self._vsync_checked:
+                self._check_vsync()
+
+        return interval
+
+    def wait_idle(
+        self,
+        target_fps: int,
+        wake: Callable[[], bool],
+        poll: float = IDLE_POLL_INTERVAL
+    ) -> float:
+        """
+        Espera en reposo: ritmo reducido, interrumpible por input.
+        Duerme en tramos cortos y retorna en cuanto wake() es True. No usa
+        el vsync (un frame sin presentar no bloquearía) y sus intervalos no
+        entran en las estadísticas.
+
+        Args:
+            target_fps: FPS del modo reposo
+            wake: Función que indica si hay que despertar (p.ej. eventos en cola)
+            poll: Segundos máximos entre comprobaciones de wake()
+
+        Returns:
+            Segundos reales transcurridos desde el frame anterior
+        """
+        now = time.perf_counter()
+        deadline = (self._last if self._last is not None else now) + 1.0 / max(1, target_fps)
+
+        while not wake():
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            time.sleep(min(poll, remaining))
+
+        now = time.perf_counter()
+        interval = 0.0 if self._last is None else now - self._last
+        self._last = now
+
+        # Al salir del reposo se empieza un ritmo nuevo, sin recuperar frames
+        self._deadline = None
+        return interval
+
+    def _check_vsync(self):
+        """Verifica que el vsync limite realmente el ritmo de frames"""
+        if len(self._intervals) < self._intervals.maxlen // 2:
+            return
+
+        self._vsync_checked = True
+        if statistics.fmean(self._intervals) < self.period * 0.8:
+            print("Aviso: el vsync no limita los FPS, usando espera por software")
+            self.vsync_active = False
+            self._deadline = None
+            self._intervals.clear()
+
+    def get_fps(self) -> float:
+        """Retorna los FPS medios de los últimos frames"""
+        if not self._intervals:
+            return 0.0
+        return 1.0 / statistics.fmean(self._intervals)
+
+    def get_stats(self) -> dict[str, float]:
+        """
+        Estadísticas del intervalo entre frames.
+
+        Returns:
+            Diccionario con mean_ms, stdev_ms, p99_ms, max_ms y fps
+        """
+        if len(self._intervals) < 2:
+            return {'mean_ms': 0.0, 'stdev_ms': 0.0, 'p99_ms': 0.0, 'max_ms': 0.0, 'fps': 0.0}
+
+        values = sorted(self._intervals)
+        mean = statistics.fmean(values)
+        p99 = values[min(len(values) - 1, int(math.ceil(0.99 * len(values))) - 1)]
+        return {
+            'mean_ms': mean * 1000,
+            'stdev_ms': statistics.pstdev(values, mean) * 1000,
+            'p99_ms': p99 * 1000,
+            'max_ms': values[-1] * 1000,
+            'fps': 1.0 / mean
+        }
+
+    def summary(self) -> str:
+        """Retorna un resumen legible del ritmo de frames"""
+        stats = self.get_stats()
+        mode = "vsync" if self.vsync_active else "software"
+        return (
+            f"Ritmo de frames ({mode}): {stats['mean_ms']:.2f} ms "
+            f"± {stats['stdev_ms']:.2f} ms, p99 {stats['p99_ms']:.2f} ms, "
+            f"máx {stats['max_ms']:.2f} ms"
+        )
@@ -3,14 +3,26 @@ Space Pong - Main Game Class
 Clase principal que controla el loop del juego
 """
 
+import os
 import sys
+import math
+import time
 import pygame
+from pathlib import Path
+from typing import Optional
 
 from .constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT, FPS, GAME_TITLE,
-    SPACE_BLACK, GameState
+    SPACE_BLACK, GameState, MAX_SIMULATION_STEPS, ASSET_PRELOAD_BUDGET,
+    IDLE_STATIC_FPS, IDLE_INACTIVE_FPS, IDLE_ATTRACT_FPS, IDLE_INPUT_TIMEOUT
 )
 from .settings import get_settings
+from .dirty_rects import DirtyRectTracker
+from .profiler import FrameProfiler, ProfilerOverlay
+from .quality import QualityGovernor
+from .frame_pacer import FramePacer
+from .input_latency import InputLatencyTracker
+from .startup import StartupProfile
 
 
 class Game:
@@ -19,51 +31,145 @@ class Game:
     Maneja el game loop, eventos y coordinación de estados.
     """
 
-    def __init__(self):
-        """Inicializa Pygame y todos los componentes del juego"""
-        # Inicializar Pygame
-        pygame.init()
-        pygame.mixer.init()
+    def __init__(
+        self,
+        headless: bool = False,
+        profile_csv: Optional[Path] = None,
+        measure_latency: bool = False,
+        low_latency_input: bool = False,
+        vsync: bool = False,
+        startup: Optional[StartupProfile] = None
+    ):
+        """
+        Inicializa Pygame y todos los componentes del juego.
+
+        Args:
+            headless: Si True, usa los drivers dummy de SDL (sin ventana ni audio)
+            profile_csv: Si se indica, guarda el perfil de frames en este CSV al salir
+            measure_latency: Medir la latencia input -> pantalla y reportarla al salir
+            low_latency_input: Forzar el modo de input de baja latencia en esta sesión
+            vsync: Forzar la ventana con vsync (renderer SCALED) en esta sesión
+            startup: Si se indica, mide las fases del arranque y las muestra tras el primer frame
+        """
+        self.headless = headless
+        self.profile_csv = profile_csv
+        self.startup = startup
+
+        # Los drivers deben elegirse antes de inicializar Pygame
+        if headless:
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+        # Inicializar solo lo que necesita el menú; pygame.init() abriría también
+        # el audio y otros subsistemas. El mixer se abre al cargar el primer sonido.
+        pygame.display.init()
+        pygame.font.init()
+        self._mark_startup('pygame (display + fuentes)')
 
         # Obtener configuración
         self.settings = get_settings()
 
+        # Presentación parcial (dirty rects), opcional
+        self.dirty_rects = DirtyRectTracker()
+
+        # Ritmo de frames (vsync o espera sleep + spin)
+        self.pacer = FramePacer(self.settings.video.fps)
+        self.vsync = vsync or self.settings.video.scaled_vsync
+
         # Crear ventana
         self._setup_display()
-
-        # Reloj para controlar FPS
-        self.clock = pygame.time.Clock()
+        self._mark_startup('ventana')
 
         # Estado del juego
         self.running = True
         self.current_state = GameState.MENU
 
-        # Delta time
+        # Delta time (paso fijo de simulación)
         self.dt = 0
 
+        # Timestep fijo: tiempo pendiente de simular e interpolación para el render
+        self.max_simulation_steps = MAX_SIMULATION_STEPS
+        self._accumulator = 0.0
+        self.render_alpha = 1.0
+
+        # Debug info
+        self.show_fps = not headless
+
+        # Profiler por fases (overlay F3 y volcado a CSV)
+        self.profiler = FrameProfiler(enabled=self.show_fps or profile_csv is not None)
+        self.profiler_overlay = ProfilerOverlay(
+            self.profiler, self.settings.video.fps,
+            status_lines=self._status_lines
+        )
+
+        # Input: modo baja latencia y medición input -> pantalla
+        self.low_latency_input = low_latency_input or self.settings.gameplay.low_latency_input
+        self.input_latency = InputLatencyTracker(enabled=measure_latency)
+
+        # Tiempo bloqueado en flip/update del frame (con vsync espera al refresco)
+        self._present_time = 0.0
+
+        # Reposo: ventana sin foco/minimizada, pantallas estáticas o juego desatendido
+        self.window_active = True
+        self.window_minimized = False
+        self._last_input = time.perf_counter()
+        self._needs_redraw = True
+
+        # Calidad adaptativa según el tiempo de frame
+        self.quality = QualityGovernor(
+            self.settings.video.fps,
+            enabled=self.settings.video.adaptive_quality and not headless
+        )
+
         # Managers
         self.state_manager = None
         self.asset_manager = None
         self.sound_manager = None
 
+        # Precarga de la partida repartida entre los frames del menú
+        self._warm_up_done = headless
+        self._warm_up_time = 0.0
+
         # Inicializar managers
         self._init_managers()
+        self._mark_startup('managers + menú')
 
-        # Debug info
-        self.show_fps = True
+    def _mark_startup(self, phase: str):
+        """
+        Cierra una fase del perfil de arranque (si está activo).
+
+        Args:
+            phase: Nombre de la fase
+        """
+        if self.startup is not None:
+            self.startup.mark(phase)
 
     def _setup_display(self):
         """Configura la ventana del juego"""
         display_flags = pygame.DOUBLEBUF
+        size = (self.settings.video.width, self.settings.video.height)
 
         if self.settings.video.fullscreen:
             display_flags |= pygame.FULLSCREEN
 
-        self.screen = pygame.display.set_mode(
-            (self.settings.video.width, self.settings.video.height),
-            display_flags
-        )
+        # Pygame solo aplica vsync con un renderer (SCALED u OPENGL). SCALED cambia
+        # el escalado de la ventana y la pantalla completa (se escala el lienzo en
+        # lugar de cambiar la resolución), por eso es opcional. F11 vuelve a crear
+        # la ventana con los mismos flags.
+        vsync = False
+        if self.vsync and not self.headless:
+            try:
+                self.screen = pygame.display.set_mode(size, display_flags | pygame.SCALED, vsync=1)
+                vsync = True
+            except pygame.error as e:
+                print(f"Aviso: vsync no disponible ({e}), usando espera por software")
+        if not vsync:
+            self.screen = pygame.display.set_mode(size, display_flags)
         pygame.display.set_caption(GAME_TITLE)
+        self.pacer.set_vsync(vsync)
+
+        # La pantalla nueva no conserva el contenido anterior
+        self.dirty_rects.reset()
 
     def _init_managers(self):
         """Inicializa los managers del juego"""
@@ -78,13 +184,12 @@ class Game:
         try:
             from ..managers.state_manager import StateManager
             from ..states.menu_state import MenuState
-            from ..states.play_state import PlayState
 
             self.state_manager = StateManager(self)
 
-            # Registrar estados
+            # Registrar estados (PlayState se construye al precargar o al entrar)
             self.state_manager.register_state(GameState.MENU, MenuState(self))
-            self.state_manager.register_state(GameState.PLAYING, PlayState(self))
+            self.state_manager.register_state_class(GameState.PLAYING, self._create_play_state)
 
             # Iniciar en el menú
             self.state_manager.change_state(GameState.MENU, immediate=True)
@@ -94,27 +199,150 @@ class Game:
             import traceback
             traceback.print_exc()
 
+    @staticmethod
+    def _create_play_state(game: 'Game'):
+        """Construye PlayState (importa el módulo solo cuando se necesita)"""
+        from ..states.play_state import PlayState
+        return PlayState(game)
+
+    def _warm_up(self, budget: float):
+        """
+        Prepara la partida en segundo plano mientras no se está jugando:
+        carga los assets por pasos y después construye PlayState.
+
+        Args:
+            budget: Segundos de trabajo máximos en este frame
+        """
+        if not self.state_manager or self.state_manager.is_state(GameState.PLAYING):
+            # Entrar a jugar ya completó la carga
+            self._warm_up_done = True
+            return
+
+        start = time.perf_counter()
+        if self.asset_manager and not self.asset_manager.preload_gameplay_assets(budget):
+            self._warm_up_time += time.perf_counter() - start
+            return
+
+        self.state_manager.get_state(GameState.PLAYING)
+        self._warm_up_time += time.perf_counter() - start
+        self._warm_up_done = True
+
+        if self.startup is not None:
+            print(
+                f"Precarga de la partida: {self._warm_up_time * 1000:.1f} ms de trabajo, "
+                f"lista a los {self.startup.elapsed() * 1000:.0f} ms del arranque"
+            )
+
     def run(self):
         """
         Loop principal del juego.
         Ejecuta hasta que self.running sea False.
         """
         while self.running:
-            # Calcular delta time (tiempo desde el último frame)
-            self.dt = self.clock.tick(self.settings.video.fps) / 1000.0
+            # Esperar al siguiente frame; retorna el tiempo real transcurrido.
+            # En reposo se baja el ritmo, pero cualquier evento despierta al instante.
+            idle_fps = self._get_idle_fps()
+            if idle_fps:
+                frame_time = self.pacer.wait_idle(idle_fps, pygame.event.peek)
+            else:
+                frame_time = self.pacer.wait()
+            work_start = time.perf_counter()
+            self._present_time = 0.0
+            profiler = self.profiler
+            profiler.begin_frame()
 
             # Procesar eventos
-            self._handle_events()
+            with profiler.section('events'):
+                self._handle_events()
 
-            # Actualizar lógica
-            self._update()
+            # Actualizar lógica en pasos fijos
+            with profiler.section('update'):
+                self._step_simulation(frame_time, idle_fps)
+
+            # Renderizar (un frame estático sin cambios no se vuelve a presentar)
+            with profiler.section('render'):
+                if self._should_render():
+                    self._render()
 
-            # Renderizar
-            self._render()
+            profiler.end_frame()
+
+            # Ajustar la calidad con el tiempo de trabajo (sin esperas de ritmo ni vsync);
+            # los frames en reposo no representan la carga del juego
+            if not idle_fps:
+                self.quality.record(time.perf_counter() - work_start - self._present_time)
+
+            if self.startup is not None and not self.startup.finished:
+                self.startup.finish('primer frame')
+
+            # Aprovechar el tiempo libre del frame para preparar la partida
+            if not self._warm_up_done:
+                self._warm_up(ASSET_PRELOAD_BUDGET)
 
         # Limpieza al salir
         self._quit()
 
+    def _get_idle_fps(self) -> Optional[int]:
+        """
+        Ritmo de reposo para el siguiente frame.
+
+        Returns:
+            FPS reducidos o None si se juega al ritmo normal
+        """
+        if self.headless:
+            return None
+
+        if not self.window_active or self.window_minimized:
+            return IDLE_INACTIVE_FPS
+
+        state = self.state_manager.current_state if self.state_manager else None
+        if state is not None and not state.is_animating():
+            return IDLE_STATIC_FPS
+
+        # Sin input un rato: solo en menú o demo, nunca con jugadores humanos
+        # (mantener una tecla o dejar jugar al bot no genera eventos nuevos)
+        if (
+            state is not None and state.is_attract_mode()
+            and time.perf_counter() - self._last_input > IDLE_INPUT_TIMEOUT
+        ):
+            return IDLE_ATTRACT_FPS
+
+        return None
+
+    def _should_render(self) -> bool:
+        """
+        Indica si hay que dibujar el frame.
+        Una pantalla estática solo se redibuja tras un evento o justo al dejar
+        de animarse; minimizada no se dibuja nada.
+
+        Returns:
+            True si hay que renderizar y presentar
+        """
+        if self.window_minimized:
+            return False
+
+        state = self.state_manager.current_state if self.state_manager else None
+        animating = state is None or state.is_animating()
+
+        render = animating or self._needs_redraw
+        self._needs_redraw = animating
+        return render
+
+    def _handle_window_event(self, event: pygame.event.Event):
+        """
+        Actualiza el estado de la ventana (foco y minimizado).
+
+        Args:
+            event: Evento de ventana
+        """
+        if event.type == pygame.WINDOWFOCUSLOST:
+            self.window_active = False
+        elif event.type == pygame.WINDOWFOCUSGAINED:
+            self.window_active = True
+        elif event.type == pygame.WINDOWMINIMIZED:
+            self.window_minimized = True
+        elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWMAXIMIZED, pygame.WINDOWSHOWN):
+            self.window_minimized = False
+
     def _handle_events(self):
         """Procesa todos los eventos de Pygame"""
         for event in pygame.event.get():
@@ -122,6 +350,12 @@ class Game:
                 self.running = False
                 return
 
+            # Cualquier evento puede cambiar lo que se ve (incluido WINDOWEXPOSED)
+            self._needs_redraw = True
+            if event.type in (pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN):
+                self._last_input = time.perf_counter()
+            self._handle_window_event(event)
+
             if event.type == pygame.KEYDOWN:
                 # Toggle fullscreen con F11
                 if event.key == pygame.K_F11:
@@ -131,12 +365,44 @@ class Game:
                 # Toggle FPS display con F3
                 if event.key == pygame.K_F3:
                     self.show_fps = not self.show_fps
+                    self.profiler.enabled = self.show_fps or self.profile_csv is not None
                     continue
 
             # Delegar eventos al state manager
             if self.state_manager:
                 self.state_manager.handle_event(event)
 
+    def _step_simulation(self, frame_time: float, idle_fps: Optional[int] = None):
+        """
+        Avanza la simulación en pasos fijos según el tiempo acumulado.
+        Limita los pasos por frame para evitar la espiral de la muerte.
+
+        Args:
+            frame_time: Tiempo real del frame en segundos
+            idle_fps: Ritmo de reposo del frame (permite los pasos que cubren un frame largo)
+        """
+        tick_rate = max(1, self.settings.gameplay.tick_rate)
+        step = 1.0 / tick_rate
+        self._accumulator += frame_time
+
+        max_steps = self.max_simulation_steps
+        if idle_fps:
+            max_steps = max(max_steps, math.ceil(tick_rate / idle_fps) + 1)
+
+        steps = 0
+        while self._accumulator >= step and steps < max_steps:
+            self.dt = step
+            self._update()
+            self._accumulator -= step
+            steps += 1
+
+        # Descartar el atraso que no se pudo recuperar
+        if self._accumulator >= step:
+            self._accumulator %= step
+
+        # Fracción del siguiente paso ya transcurrida (para interpolar el render)
+        self.render_alpha = self._accumulator / step
+
     def _update(self):
         """Actualiza la lógica del juego"""
         if self.state_manager:
@@ -144,12 +410,15 @@ class Game:
 
     def _render(self):
         """Dibuja el frame actual"""
+        if self.settings.video.dirty_rects and self._render_dirty():
+            return
+
         # Limpiar pantalla
         self.screen.fill(SPACE_BLACK)
 
         # Renderizar estado actual
         if self.state_manager:
-            self.state_manager.render(self.screen)
+            self.state_manager.render(self.screen, self.render_alpha)
         else:
             self._render_fallback_screen()
 
@@ -158,21 +427,83 @@ class Game:
             self._render_fps()
 
         # Actualizar display
-        pygame.display.flip()
+        self._present(pygame.display.flip)
+
+        # El siguiente frame parcial debe partir de una pantalla completa
+        self.dirty_rects.reset()
+
+    def _render_dirty(self) -> bool:
+        """
+        Dibuja el frame actual en modo dirty rects.
+
+        Returns:
+            False si el estado actual necesita un frame completo
+        """
+        if not self.state_manager:
+            return False
+
+        if not self.state_manager.render_dirty(self.screen, self.dirty_rects, self.render_alpha):
+            return False
+
+        if self.show_fps:
+            self.dirty_rects.add(self._render_fps())
+
+        self._present(self.dirty_rects.present, self.screen)
+        return True
+
+    def _present(self, present, *args):
+        """
+        Presenta el frame midiendo el tiempo bloqueado (espera de vsync).
+
+        Args:
+            present: Función de presentación (flip o DirtyRectTracker.present)
+            *args: Argumentos de la función
+        """
+        start = time.perf_counter()
+        present(*args)
+        self._present_time += time.perf_counter() - start
+
+        if self.input_latency.enabled:
+            self.input_latency.on_present(self.render_alpha)
+
+    def _status_lines(self) -> list[str]:
+        """Líneas de estado extra del overlay F3"""
+        lines = [self.pacer.summary()]
+        if self.input_latency.enabled:
+            lines.append(self.input_latency.summary())
+        return lines
 
     def _render_fallback_screen(self):
         """Pantalla de respaldo si no hay state manager"""
-        font = pygame.font.Font(None, 48)
-        text = font.render("Cargando...", True, (100, 150, 255))
+        text = self._render_text(48, "Cargando...", (100, 150, 255))
         rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         self.screen.blit(text, rect)
 
-    def _render_fps(self):
-        """Muestra el contador de FPS"""
-        fps = int(self.clock.get_fps())
-        font = pygame.font.Font(None, 30)
-        fps_text = font.render(f"FPS: {fps}", True, (255, 255, 0))
-        self.screen.blit(fps_text, (10, 10))
+    def _render_fps(self) -> pygame.Rect:
+        """Muestra el contador de FPS y el overlay del profiler"""
+        fps = int(self.pacer.get_fps())
+        label = f"FPS: {fps}"
+        if self.quality.level > 0:
+            label += f"  (calidad {self.quality.preset['name']})"
+        fps_text = self._render_text(30, label, (255, 255, 0))
+        rect = self.screen.blit(fps_text, (10, 10))
+        return rect.union(self.profiler_overlay.render(self.screen, (10, rect.bottom + 5)))
+
+    def _render_text(self, size: int, text: str, color: tuple) -> pygame.Surface:
+        """
+        Renderiza un texto, usando la caché del AssetManager si está disponible.
+
+        Args:
+            size: Tamaño de la fuente
+            text: Texto a renderizar
+            color: Color del texto
+
+        Returns:
+            Superficie con el texto
+        """
+        if self.asset_manager:
+            return self.asset_manager.render_text(None, size, text, color)
+        return pygame.font.Font(None, size).render(text, True, color)
 
     def _toggle_fullscreen(self):
         """Alterna entre pantalla completa y ventana"""
@@ -184,8 +515,15 @@ class Game:
         # Guardar configuración
         self.settings.save()
 
-        # Cerrar Pygame
-        pygame.mixer.quit()
+        print(self.pacer.summary())
+        if self.input_latency.enabled:
+            print(self.input_latency.summary())
+
+        # Volcar el perfil de frames
+        if self.profile_csv is not None:
+            self.profiler.dump_csv(self.profile_csv)
+
+        # Cerrar Pygame (también cierra el mixer si llegó a abrirse)
         pygame.quit()
         sys.exit()
 
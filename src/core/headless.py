@@ -0,0 +1,233 @@
+"""
+Space Pong - Headless Runner
+Simula partidas Bot vs Bot sin ventana ni render, tan rápido como permita la CPU
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .constants import GameState, GameMode
+from .game import Game
+
+
+@dataclass
+class MatchResult:
+    """Resultado de una partida headless"""
+    seed: Optional[int] = None
+    winner: int = 0  # 0 = sin terminar
+    score: tuple[int, int] = (0, 0)
+    paddle_hits: int = 0
+    steps: int = 0
+    simulated_seconds: float = 0.0
+    wall_seconds: float = 0.0
+
+    @property
+    def points(self) -> int:
+        """Puntos jugados en la partida"""
+        return self.score[0] + self.score[1]
+
+
+@dataclass
+class HeadlessReport:
+    """Resultado de una sesión de simulación headless"""
+    matches: int = 0
+    wins: dict[int, int] = field(default_factory=lambda: {1: 0, 2: 0})
+    unfinished: int = 0  # Partidas cortadas por exceder el tiempo máximo
+    points: dict[int, int] = field(default_factory=lambda: {1: 0, 2: 0})  # también de partidas sin terminar
+    paddle_hits: int = 0
+    simulated_seconds: float = 0.0
+    wall_seconds: float = 0.0
+    steps: int = 0
+    prediction_hits: int = 0  # consultas de la IA resueltas por InterceptCache
+    prediction_misses: int = 0
+
+    @property
+    def matches_per_second(self) -> float:
+        """Partidas simuladas por segundo real"""
+        return self.matches / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    @property
+    def steps_per_second(self) -> float:
+        """Pasos de simulación por segundo real"""
+        return self.steps / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    @property
+    def point_share_p1(self) -> float:
+        """Fracción de los puntos anotados por el jugador 1"""
+        total = self.points[1] + self.points[2]
+        return self.points[1] / total if total else 0.0
+
+    @property
+    def points_per_minute(self) -> float:
+        """Puntos por minuto de juego simulado"""
+        minutes = self.simulated_seconds / 60.0
+        return (self.points[1] + self.points[2]) / minutes if minutes > 0 else 0.0
+
+    @property
+    def hits_per_point(self) -> float:
+        """Golpes de nave por punto jugado (longitud media del rally)"""
+        total = self.points[1] + self.points[2]
+        return self.paddle_hits / total if total else 0.0
+
+    @property
+    def prediction_hit_rate(self) -> float:
+        """Fracción de predicciones de la IA servidas desde la caché"""
+        total = self.prediction_hits + self.prediction_misses
+        return self.prediction_hits / total if total else 0.0
+
+    def summary(self) -> str:
+        """Retorna un resumen legible del resultado"""
+        return "\n".join([
+            f"Partidas:            {self.matches}",
+            f"Victorias P1/P2:     {self.wins[1]}/{self.wins[2]}",
+            f"Sin terminar:        {self.unfinished}",
+            f"Puntos P1/P2:        {self.points[1]}/{self.points[2]} "
+            f"({self.point_share_p1:.1%} P1)",
+            f"Puntos/minuto:       {self.points_per_minute:.2f}",
+            f"Golpes de nave:      {self.paddle_hits} ({self.hits_per_point:.1f} por punto)",
+            f"Tiempo simulado:     {self.simulated_seconds:.1f} s",
+            f"Tiempo real:         {self.wall_seconds:.2f} s",
+            f"Partidas/segundo:    {self.matches_per_second:.2f}",
+            f"Pasos/segundo:       {self.steps_per_second:.0f}",
+            f"Caché predicción:    {self.prediction_hit_rate:.1%} aciertos "
+            f"({self.prediction_hits + self.prediction_misses} consultas)",
+        ])
+
+
+class HeadlessRunner:
+    """
+    Ejecuta partidas completas de PlayState sin render.
+    Usa el paso fijo de simulación del juego y no limita los FPS.
+    """
+
+    def __init__(
+        self,
+        difficulty: str = 'medium',
+        max_match_seconds: float = 600.0,
+        difficulty_p1: Optional[str] = None,
+        tick_rate: Optional[int] = None
+    ):
+        """
+        Inicializa el runner.
+
+        Args:
+            difficulty: Dificultad del bot derecho (y del izquierdo si no se indica)
+            max_match_seconds: Tiempo simulado máximo por partida
+            difficulty_p1: Dificultad del bot izquierdo (None = la misma)
+            tick_rate: Pasos de simulación por segundo (None = el de la configuración).
+                Con pocos pasos por segundo se avanza más rápido; las colisiones
+                barridas evitan que el meteorito atraviese las naves.
+        """
+        self.difficulty = difficulty
+        self.difficulty_p1 = difficulty_p1
+        self.max_match_seconds = max_match_seconds
+        self.tick_rate = tick_rate
+
+        self.game = Game(headless=True)
+        self.play_state = self.game.state_manager.get_state(GameState.PLAYING)
+
+    def start(self):
+        """Entra en PlayState en modo Bot vs Bot con las dificultades actuales"""
+        self.play_state.set_game_mode(GameMode.EVE, self.difficulty, self.difficulty_p1)
+        self.game.state_manager.change_state(GameState.PLAYING, immediate=True)
+
+    def play_match(self, seed: Optional[int] = None) -> MatchResult:
+        """
+        Juega una partida completa (requiere haber llamado a start()).
+
+        Args:
+            seed: Semilla de la partida (None = aleatoria)
+
+        Returns:
+            Resultado de la partida
+        """
+        state = self.play_state
+        dt = 1.0 / max(1, self.tick_rate or self.game.settings.gameplay.tick_rate)
+        max_steps = int(self.max_match_seconds / dt)
+
+        start = time.perf_counter()
+        state.set_match_seed(seed)
+        state._reset_game()
+
+        steps = 0
+        while not state.game_over and steps < max_steps:
+            state.update(dt)
+            steps += 1
+
+        return MatchResult(
+            seed=seed,
+            winner=state.winner if state.game_over else 0,
+            score=(state.player1.score, state.player2.score),
+            paddle_hits=state.paddle_hits,
+            steps=steps,
+            simulated_seconds=steps * dt,
+            wall_seconds=time.perf_counter() - start
+        )
+
+    def run(self, matches: int, seed: Optional[int] = None) -> HeadlessReport:
+        """
+        Simula varias partidas seguidas.
+
+        Args:
+            matches: Número de partidas
+            seed: Semilla base; la partida i usa seed + i (None = aleatorias)
+
+        Returns:
+            Reporte con resultados y rendimiento
+        """
+        self.start()
+
+        report = HeadlessReport()
+        cache = self.play_state.intercept_cache
+        hits, misses = cache.hits, cache.misses
+        start = time.perf_counter()
+
+        for i in range(matches):
+            result = self.play_match(seed + i if seed is not None else None)
+
+            if result.winner:
+                report.wins[result.winner] += 1
+            else:
+                report.unfinished += 1
+
+            report.matches += 1
+            report.points[1] += result.score[0]
+            report.points[2] += result.score[1]
+            report.paddle_hits += result.paddle_hits
+            report.steps += result.steps
+            report.simulated_seconds += result.simulated_seconds
+
+        report.wall_seconds = time.perf_counter() - start
+        report.prediction_hits = cache.hits - hits
+        report.prediction_misses = cache.misses - misses
+        return report
+
+
+def run_headless(
+    matches: int,
+    difficulty: str = 'medium',
+    seed: Optional[int] = None,
+    tick_rate: Optional[int] = None
+) -> HeadlessReport:
+    """
+    Simula partidas Bot vs Bot sin display y muestra el resultado.
+
+    Args:
+        matches: Número de partidas
+        difficulty: Dificultad de ambos bots
+        seed: Semilla base para partidas reproducibles
+        tick_rate: Pasos de simulación por segundo (None = el de la configuración)
+
+    Returns:
+        Reporte de la sesión
+    """
+    runner = HeadlessRunner(difficulty, tick_rate=tick_rate)
+    report = runner.run(matches, seed)
+
+    print("=" * 50)
+    print("Space Pong - Simulación headless")
+    print("=" * 50)
+    print(report.summary())
+
+    return report
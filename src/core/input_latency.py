@@ -0,0 +1,109 @@
+"""
+Space Pong - Input Latency
+Mide la latencia entre una tecla de movimiento y el primer frame presentado que la refleja
+"""
+
+import math
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..entities.ship import Ship
+
+
+class InputLatencyTracker:
+    """
+    Mide la latencia input -> pantalla de las naves controladas por jugadores.
+
+    Cada tecla de movimiento se marca con perf_counter al procesar el evento.
+    Tras cada presentación (flip/update) se comprueba si la posición dibujada
+    de la nave ya se movió en la dirección pedida; el tiempo transcurrido es
+    una muestra de latencia.
+
+    Los eventos de pygame 2.6 no traen marca de tiempo, así que no se incluye
+    el tiempo que el evento esperó en la cola de SDL antes de leerse (como
+    mucho un frame, ya que la cola se lee justo después de la espera del frame).
+    """
+
+    def __init__(self, enabled: bool = False, timeout: float = 0.5):
+        """
+        Inicializa el medidor.
+
+        Args:
+            enabled: Si mide latencias
+            timeout: Segundos tras los que se descarta un input sin movimiento visible
+                (p.ej. nave contra el borde)
+        """
+        self.enabled = enabled
+        self.timeout = timeout
+
+        # Input pendiente por nave: (nave, dirección, instante, Y de partida)
+        self._pending: dict[int, tuple['Ship', int, float, float]] = {}
+        self._samples: list[float] = []
+        self.dropped = 0
+
+    def on_input(self, ship: 'Ship', direction: int):
+        """
+        Registra una tecla de movimiento.
+
+        Args:
+            ship: Nave que debe moverse
+            direction: -1 (arriba) o 1 (abajo)
+        """
+        pending = self._pending.get(ship.player_id)
+        if pending is not None and pending[1] == direction:
+            return  # Ya se está midiendo el primer input en esta dirección
+
+        self._pending[ship.player_id] = (ship, direction, time.perf_counter(), ship.position.y)
+
+    def on_present(self, alpha: float):
+        """
+        Comprueba los inputs pendientes tras presentar un frame.
+
+        Args:
+            alpha: Interpolación usada en el render del frame
+        """
+        if not self._pending:
+            return
+
+        now = time.perf_counter()
+        for player_id, (ship, direction, start, start_y) in list(self._pending.items()):
+            drawn_y = ship.get_interpolated_position(alpha).y
+            if (drawn_y - start_y) * direction > 0.5:
+                self._samples.append(now - start)
+                del self._pending[player_id]
+            elif now - start > self.timeout:
+                self.dropped += 1
+                del self._pending[player_id]
+
+    def get_stats(self) -> dict[str, float]:
+        """
+        Estadísticas de la sesión.
+
+        Returns:
+            Diccionario con count, p50_ms, p99_ms y max_ms
+        """
+        if not self._samples:
+            return {'count': 0, 'p50_ms': 0.0, 'p99_ms': 0.0, 'max_ms': 0.0}
+
+        values = sorted(self._samples)
+
+        def rank(p: float) -> float:
+            return values[min(len(values) - 1, int(math.ceil(p * len(values))) - 1)] * 1000
+
+        return {
+            'count': len(values),
+            'p50_ms': rank(0.50),
+            'p99_ms': rank(0.99),
+            'max_ms': values[-1] * 1000
+        }
+
+    def summary(self) -> str:
+        """Retorna un resumen legible de la latencia medida"""
+        stats = self.get_stats()
+        if not stats['count']:
+            return "Latencia de input: sin muestras"
+        return (
+            f"Latencia de input: p50 {stats['p50_ms']:.1f} ms, "
+            f"p99 {stats['p99_ms']:.1f} ms ({stats['count']} muestras)"
+        )
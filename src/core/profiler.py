@@ -0,0 +1,326 @@
+"""
+Space Pong - Frame Profiler
+Mide el tiempo de cada fase del frame y lo guarda en un buffer circular
+"""
+
+import csv
+import math
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+import pygame
+
+from .constants import PROFILER_CAPACITY
+
+
+class _Section:
+    """Sección medida reutilizable (evita crear objetos en cada frame)"""
+
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler: 'FrameProfiler', name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.add(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _NullSection:
+    """Sección vacía usada cuando el profiler está desactivado"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class FrameProfiler:
+    """
+    Profiler de tiempo por frame.
+    Las fases se nombran con puntos ('update', 'render.play.ball', ...).
+    Si una fase se ejecuta varias veces en un frame, se suman sus tiempos.
+    """
+
+    def __init__(self, capacity: int = PROFILER_CAPACITY, enabled: bool = True):
+        """
+        Inicializa el profiler.
+
+        Args:
+            capacity: Número de frames guardados en el buffer circular
+            enabled: Si mide tiempos
+        """
+        self.capacity = capacity
+        self.enabled = enabled
+
+        # Buffer circular: tiempo total y tiempo por fase (segundos, NaN = no ejecutada)
+        self._totals = [math.nan] * capacity
+        self._phases: dict[str, list[float]] = {}
+        self._index = 0
+        self._count = 0
+        self.frame_number = 0
+
+        # Frame en curso
+        self._frame_start = 0.0
+        self._current: dict[str, float] = {}
+        self._sections: dict[str, _Section] = {}
+
+    def section(self, name: str):
+        """
+        Retorna un context manager que mide una fase.
+
+        Args:
+            name: Nombre de la fase
+        """
+        if not self.enabled:
+            return _NULL_SECTION
+
+        section = self._sections.get(name)
+        if section is None:
+            section = _Section(self, name)
+            self._sections[name] = section
+        return section
+
+    def add(self, name: str, seconds: float):
+        """
+        Suma tiempo a una fase del frame actual.
+
+        Args:
+            name: Nombre de la fase
+            seconds: Duración en segundos
+        """
+        self._current[name] = self._current.get(name, 0.0) + seconds
+
+    def begin_frame(self):
+        """Marca el inicio de un frame"""
+        self._current.clear()
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """Cierra el frame y lo guarda en el buffer circular"""
+        if not self.enabled:
+            return
+
+        index = self._index
+        self._totals[index] = time.perf_counter() - self._frame_start
+
+        for name, samples in self._phases.items():
+            samples[index] = self._current.get(name, math.nan)
+
+        for name, seconds in self._current.items():
+            if name not in self._phases:
+                samples = [math.nan] * self.capacity
+                samples[index] = seconds
+                self._phases[name] = samples
+
+        self._index = (index + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        self.frame_number += 1
+
+    def get_frame_times(self) -> list[float]:
+        """Retorna los tiempos totales de frame, del más antiguo al más reciente"""
+        return self._ordered(self._totals)
+
+    def get_phase_names(self) -> list[str]:
+        """Retorna los nombres de fase registrados, ordenados"""
+        return sorted(self._phases)
+
+    def get_stats(self) -> dict[str, dict[str, float]]:
+        """
+        Calcula percentiles por fase sobre el buffer.
+
+        Returns:
+            {fase: {'p50', 'p95', 'p99', 'max'}} en milisegundos.
+            La fase 'frame' es el tiempo total. Se omiten las fases
+            sin muestras en el buffer (p.ej. de un estado anterior).
+        """
+        stats = {'frame': self._percentiles(self._totals)}
+        for name in self.get_phase_names():
+            samples = self._phases[name]
+            if any(not math.isnan(s) for s in samples):
+                stats[name] = self._percentiles(samples)
+        return stats
+
+    def _ordered(self, samples: list[float]) -> list[float]:
+        """Ordena cronológicamente las muestras del buffer"""
+        if self._count < self.capacity:
+            return samples[:self._count]
+        return samples[self._index:] + samples[:self._index]
+
+    @staticmethod
+    def _percentiles(samples: list[float]) -> dict[str, float]:
+        """Calcula p50/p95/p99/max (ms) ignorando frames sin muestra"""
+        values = sorted(s for s in samples if not math.isnan(s))
+        if not values:
+            return {'p50': 0.0, 'p95': 0.0, 'p99': 0.0, 'max': 0.0}
+
+        def rank(p: float) -> float:
+            return values[min(len(values) - 1, int(math.ceil(p * len(values))) - 1)] * 1000
+
+        return {
+            'p50': rank(0.50),
+            'p95': rank(0.95),
+            'p99': rank(0.99),
+            'max': values[-1] * 1000
+        }
+
+    def dump_csv(self, path: Path) -> bool:
+        """
+        Guarda el contenido del buffer en un CSV (una fila por frame, en ms).
+
+        Args:
+            path: Ruta del archivo
+
+        Returns:
+            True si se guardó correctamente
+        """
+        try:
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            names = self.get_phase_names()
+            totals = self._ordered(self._totals)
+            columns = [self._ordered(self._phases[name]) for name in names]
+            first_frame = self.frame_number - len(totals)
+
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(['frame', 'frame_ms'] + [f"{name}_ms" for name in names])
+                for row, total in enumerate(totals):
+                    writer.writerow(
+                        [first_frame + row, f"{total * 1000:.4f}"] +
+                        ["" if math.isnan(col[row]) else f"{col[row] * 1000:.4f}" for col in columns]
+                    )
+
+            print(f"Perfil de frames guardado en: {path}")
+            return True
+        except Exception as e:
+            print(f"Error guardando perfil de frames: {e}")
+            return False
+
+
+class ProfilerOverlay:
+    """
+    Overlay de depuración (F3): gráfica de tiempo de frame y percentiles por fase.
+    Se recompone cada pocos frames para que su propio coste sea bajo.
+    """
+
+    def __init__(
+        self,
+        profiler: FrameProfiler,
+        target_fps: int,
+        refresh_interval: int = 10,
+        max_phases: int = 20,
+        status_lines: Optional[Callable[[], list[str]]] = None
+    ):
+        """
+        Inicializa el overlay.
+
+        Args:
+            profiler: Profiler con los datos
+            target_fps: FPS objetivo (para la línea de presupuesto)
+            refresh_interval: Frames entre recomposiciones
+            max_phases: Máximo de fases listadas
+            status_lines: Función que retorna líneas extra a mostrar bajo la tabla
+        """
+        self.profiler = profiler
+        self.target_fps = target_fps
+        self.refresh_interval = refresh_interval
+        self.max_phases = max_phases
+        self.status_lines = status_lines
+
+        self.graph_size = (300, 80)
+        self._font: Optional[pygame.font.Font] = None
+        self._surface: Optional[pygame.Surface] = None
+        self._last_refresh = -refresh_interval
+
+    def render(self, screen: pygame.Surface, position: tuple[int, int]) -> pygame.Rect:
+        """
+        Dibuja el overlay.
+
+        Args:
+            screen: Superficie donde dibujar
+            position: Esquina superior izquierda
+
+        Returns:
+            Zona de pantalla cubierta
+        """
+        frame = self.profiler.frame_number
+        if self._surface is None or frame - self._last_refresh >= self.refresh_interval:
+            self._surface = self._compose()
+            self._last_refresh = frame
+
+        return screen.blit(self._surface, position)
+
+    def _compose(self) -> pygame.Surface:
+        """Construye la superficie del overlay con los datos actuales"""
+        if self._font is None:
+            self._font = pygame.font.Font(None, 20)
+
+        stats = self.profiler.get_stats()
+        names = list(stats)[:self.max_phases + 1]
+        extra = [
+            self._font.render(line, True, (150, 200, 255))
+            for line in (self.status_lines() if self.status_lines else [])
+        ]
+
+        line_height = 16
+        graph_w, graph_h = self.graph_size
+        width = max([graph_w, 410] + [line.get_width() for line in extra]) + 10
+        height = graph_h + 15 + line_height * (len(names) + len(extra) + 1) + 10
+
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 170))
+
+        # Gráfica de tiempo de frame (escala: 2x el presupuesto)
+        budget_ms = 1000 / max(1, self.target_fps)
+        scale_ms = budget_ms * 2
+        graph_rect = pygame.Rect(5, 5, graph_w, graph_h)
+        pygame.draw.rect(surface, (40, 40, 60), graph_rect)
+
+        budget_y = graph_rect.bottom - int(graph_h * budget_ms / scale_ms)
+        pygame.draw.line(surface, (255, 80, 80), (graph_rect.left, budget_y), (graph_rect.right - 1, budget_y))
+
+        times = self.profiler.get_frame_times()[-graph_w:]
+        if len(times) > 1:
+            points = []
+            x0 = graph_rect.right - len(times)
+            for i, t in enumerate(times):
+                ms = min(t * 1000, scale_ms)
+                points.append((x0 + i, graph_rect.bottom - 1 - int((graph_h - 1) * ms / scale_ms)))
+            pygame.draw.lines(surface, (100, 255, 150), False, points)
+
+        # Tabla de percentiles (ms), columnas con posición fija
+        columns = (('p50', 220), ('p95', 270), ('p99', 320), ('max', 370))
+        y = graph_rect.bottom + 8
+        surface.blit(self._font.render("fase (ms)", True, (200, 200, 200)), (5, y))
+        for label, x in columns:
+            surface.blit(self._font.render(label, True, (200, 200, 200)), (x, y))
+        y += line_height
+
+        for name in names:
+            s = stats[name]
+            color = (255, 255, 0) if name == 'frame' else (220, 220, 240)
+            surface.blit(self._font.render(name[:28], True, color), (5, y))
+            for label, x in columns:
+                surface.blit(self._font.render(f"{s[label]:.2f}", True, color), (x, y))
+            y += line_height
+
+        for line in extra:
+            surface.blit(line, (5, y))
+            y += line_height
+
+        return surface
@@ -0,0 +1,148 @@
+"""
+Space Pong - Adaptive Quality
+Ajusta la calidad de render según el tiempo de frame para sostener los FPS objetivo
+"""
+
+from .constants import (
+    QUALITY_LEVELS, QUALITY_WINDOW_FRAMES,
+    QUALITY_DOWNGRADE_RATIO, QUALITY_UPGRADE_RATIO, QUALITY_UPGRADE_WINDOWS
+)
+
+
+class QualityGovernor:
+    """
+    Gobernador de calidad.
+    Promedia el tiempo de trabajo (eventos + simulación + render, sin la espera
+    del reloj) por ventanas de frames y lo compara con el presupuesto del FPS
+    objetivo. Baja un nivel en cuanto una ventana se acerca al presupuesto y
+    solo sube tras varias ventanas holgadas seguidas (histéresis); si una
+    subida no se sostiene, la siguiente espera el doble.
+    """
+
+    def __init__(
+        self,
+        target_fps: int,
+        enabled: bool = True,
+        window: int = QUALITY_WINDOW_FRAMES,
+        downgrade_ratio: float = QUALITY_DOWNGRADE_RATIO,
+        upgrade_ratio: float = QUALITY_UPGRADE_RATIO,
+        upgrade_windows: int = QUALITY_UPGRADE_WINDOWS
+    ):
+        """
+        Inicializa el gobernador.
+
+        Args:
+            target_fps: FPS objetivo
+            enabled: Si False, se mantiene siempre la calidad máxima
+            window: Frames por ventana de medición
+            downgrade_ratio: Fracción del presupuesto que provoca bajar de nivel
+            upgrade_ratio: Fracción del presupuesto por debajo de la cual se puede subir
+            upgrade_windows: Ventanas holgadas seguidas necesarias para subir
+        """
+        self.enabled = enabled
+        self.window = max(1, window)
+        self.downgrade_ratio = downgrade_ratio
+        self.upgrade_ratio = upgrade_ratio
+        self.upgrade_windows = upgrade_windows
+        self.set_target_fps(target_fps)
+
+        self.level = 0
+        self._sum = 0.0
+        self._frames = 0
+        self._calm_windows = 0
+        self._required_calm = upgrade_windows
+        self._just_upgraded = False
+
+        # Estadísticas
+        self.downgrades = 0
+        self.upgrades = 0
+        self.last_average = 0.0
+
+    @property
+    def preset(self) -> dict:
+        """Opciones de render del nivel actual (ver QUALITY_LEVELS)"""
+        return QUALITY_LEVELS[self.level]
+
+    @property
+    def max_level(self) -> int:
+        """Nivel de menor calidad disponible"""
+        return len(QUALITY_LEVELS) - 1
+
+    def set_target_fps(self, target_fps: int):
+        """
+        Cambia el FPS objetivo.
+
+        Args:
+            target_fps: FPS objetivo
+        """
+        self.budget = 1.0 / max(1, target_fps)
+
+    def set_enabled(self, enabled: bool):
+        """
+        Activa o desactiva el ajuste. Al desactivar se vuelve a calidad máxima.
+
+        Args:
+            enabled: Nuevo estado
+        """
+        self.enabled = enabled
+        if not enabled:
+            self.level = 0
+        self._reset_window()
+        self._calm_windows = 0
+        self._required_calm = self.upgrade_windows
+        self._just_upgraded = False
+
+    def record(self, work_time: float) -> bool:
+        """
+        Registra el tiempo de trabajo de un frame.
+
+        Args:
+            work_time: Segundos de trabajo del frame (sin contar la espera)
+
+        Returns:
+            True si cambió el nivel de calidad
+        """
+        if not self.enabled:
+            return False
+
+        self._sum += work_time
+        self._frames += 1
+        if self._frames < self.window:
+            return False
+
+        average = self._sum / self._frames
+        self.last_average = average
+        self._reset_window()
+        just_upgraded = self._just_upgraded
+        self._just_upgraded = False
+
+        # Presupuesto excedido (o casi): bajar un nivel enseguida
+        if average > self.budget * self.downgrade_ratio:
+            self._calm_windows = 0
+            # Si la última subida no se sostuvo, esperar el doble antes de reintentar
+            if just_upgraded:
+                self._required_calm = min(self._required_calm * 2, self.upgrade_windows * 32)
+            if self.level < self.max_level:
+                self.level += 1
+                self.downgrades += 1
+                return True
+            return False
+
+        # Holgura sostenida: subir un nivel
+        if average < self.budget * self.upgrade_ratio and self.level > 0:
+            self._calm_windows += 1
+            if self._calm_windows >= self._required_calm:
+                self._calm_windows = 0
+                self._just_upgraded = True
+                self.level -= 1
+                self.upgrades += 1
+                return True
+        else:
+            self._calm_windows = 0
+
+        return False
+
+    def _reset_window(self):
+        """Empieza una ventana de medición nueva"""
+        self._sum = 0.0
+        self._frames = 0
@@ -9,7 +9,7 @@ from dataclasses import dataclass, field, asdict
 from typing import Optional
 
 from .constants import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, FPS,
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, SIMULATION_TICK_RATE,
     AI_DIFFICULTY, GameMode
 )
 
@@ -22,6 +22,9 @@ class VideoSettings:
     fullscreen: bool = False
     fps: int = FPS
     vsync: bool = True
+    scaled_vsync: bool = False  # ventana SCALED con vsync real (cambia escalado y pantalla completa)
+    dirty_rects: bool = False  # presentación parcial (útil con render por software)
+    adaptive_quality: bool = True  # bajar detalles automáticamente si no se llega a los FPS
 
 
 @dataclass
@@ -39,6 +42,8 @@ class GameplaySettings:
     winning_score: int = 10
     ai_difficulty: str = 'medium'
     game_mode: str = GameMode.PVE
+    tick_rate: int = SIMULATION_TICK_RATE  # pasos de simulación por segundo
+    low_latency_input: bool = False  # resolver el movimiento solo desde eventos, justo antes de simular
 
 
 @dataclass
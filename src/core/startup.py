@@ -0,0 +1,61 @@
+"""
+Space Pong - Startup Profile
+Tiempos del arranque por fase (--profile-startup)
+"""
+
+import time
+from typing import Optional
+
+
+class StartupProfile:
+    """
+    Cronómetro del arranque.
+    Cada marca registra el tiempo transcurrido desde la marca anterior.
+    """
+
+    def __init__(self, start: Optional[float] = None):
+        """
+        Inicializa el cronómetro.
+
+        Args:
+            start: Instante inicial en perf_counter (None = ahora)
+        """
+        self.start = start if start is not None else time.perf_counter()
+        self._last = self.start
+        self.phases: list[tuple[str, float]] = []
+        self.finished = False
+
+    def mark(self, phase: str):
+        """
+        Cierra una fase.
+
+        Args:
+            phase: Nombre de la fase
+        """
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+
+    def finish(self, phase: str):
+        """
+        Cierra la última fase del arranque y muestra el desglose.
+
+        Args:
+            phase: Nombre de la fase
+        """
+        self.mark(phase)
+        self.finished = True
+        print(self.report())
+
+    def elapsed(self) -> float:
+        """Segundos desde el inicio del arranque"""
+        return time.perf_counter() - self.start
+
+    def report(self) -> str:
+        """Retorna el desglose del arranque"""
+        lines = ["Arranque:"]
+        for phase, seconds in self.phases:
+            lines.append(f"  {phase:<28} {seconds * 1000:8.1f} ms")
+        total = self._last - self.start
+        lines.append(f"  {'total':<28} {total * 1000:8.1f} ms")
+        return "\n".join(lines)
@@ -9,10 +9,12 @@ import random
 from typing import Optional
 
 from .base_entity import Entity
+from .ball_trail import BallTrail
 from ..core.constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT,
     BALL_SIZE, BALL_INITIAL_SPEED, BALL_MAX_SPEED,
-    BALL_SPEED_INCREMENT, MAX_BOUNCE_ANGLE, WALL_BOUNCE_VARIATION
+    BALL_SPEED_INCREMENT, MAX_BOUNCE_ANGLE, WALL_BOUNCE_VARIATION,
+    BALL_ROTATION_STEP, BALL_TRAIL_LENGTH
 )
 
 
@@ -26,7 +28,10 @@ class Ball(Entity):
         self,
         x: Optional[float] = None,
         y: Optional[float] = None,
-        sprite: Optional[pygame.Surface] = None
+        sprite: Optional[pygame.Surface] = None,
+        rotation_frames: Optional[list[pygame.Surface]] = None,
+        rotation_step: float = BALL_ROTATION_STEP,
+        rng: Optional[random.Random] = None
     ):
         """
         Inicializa el meteorito.
@@ -35,6 +40,9 @@ class Ball(Entity):
             x: Posición X inicial (None = centro)
             y: Posición Y inicial (None = centro)
             sprite: Sprite del meteorito
+            rotation_frames: Frames pre-rotados del sprite (None = generarlos)
+            rotation_step: Separación en grados entre frames pre-rotados
+            rng: Generador aleatorio de simulación (None = uno propio)
         """
         # Posición inicial en el centro
         if x is None:
@@ -44,6 +52,9 @@ class Ball(Entity):
 
         super().__init__(x, y, sprite)
 
+        # Aleatoriedad de simulación (inyectable para partidas deterministas)
+        self.rng = rng if rng is not None else random.Random()
+
         # Velocidad
         self.speed = BALL_INITIAL_SPEED
         self.max_speed = BALL_MAX_SPEED
@@ -59,14 +70,26 @@ class Ball(Entity):
         self.is_active = True
         self.last_hit_by = None  # 1 o 2 (jugador)
 
+        # Estela (historial real de posiciones)
+        self.trail = BallTrail(BALL_TRAIL_LENGTH)
+
         # Si no hay sprite, crear placeholder
         if self.sprite is None:
             self._create_placeholder_sprite()
             self.original_sprite = self.sprite.copy()
 
+        # Frames pre-rotados (evita rotar el sprite en cada frame)
+        self.rotation_step = rotation_step
+        self.rotation_frames = rotation_frames
+        if not self.rotation_frames:
+            self._build_rotation_frames()
+
         # Iniciar con dirección aleatoria
         self._set_random_direction()
 
+        # Estado en el último cambio de trayectoria (clave de InterceptCache)
+        self.record_bounce()
+
     def _create_placeholder_sprite(self):
         """Crea un sprite placeholder del meteorito"""
         size = BALL_SIZE
@@ -100,10 +123,10 @@ class Ball(Entity):
     def _set_random_direction(self):
         """Establece una dirección inicial aleatoria"""
         # Ángulo aleatorio entre -45 y 45 grados
-        angle = random.uniform(-math.pi / 4, math.pi / 4)
+        angle = self.rng.uniform(-math.pi / 4, math.pi / 4)
 
         # Dirección horizontal aleatoria
-        direction = random.choice([-1, 1])
+        direction = self.rng.choice([-1, 1])
 
         self.velocity.x = math.cos(angle) * self.speed * direction
         self.velocity.y = math.sin(angle) * self.speed
@@ -137,10 +160,26 @@ class Ball(Entity):
         # Verificar colisiones con paredes (arriba/abajo)
         self._check_wall_collision()
 
+        # Registrar posición para la estela
+        self.trail.push(self.position.x, self.position.y)
+
+    def _build_rotation_frames(self):
+        """Pre-renderiza el sprite original en todos los ángulos"""
+        if self.original_sprite is None:
+            self.rotation_frames = None
+            return
+
+        frame_count = max(1, round(360 / self.rotation_step))
+        self.rotation_frames = [
+            pygame.transform.rotate(self.original_sprite, -i * self.rotation_step)
+            for i in range(frame_count)
+        ]
+
     def _update_rotated_sprite(self):
-        """Actualiza el sprite con la rotación actual"""
-        if self.original_sprite:
-            self.sprite = pygame.transform.rotate(self.original_sprite, -self.rotation)
+        """Actualiza el sprite con el frame pre-rotado más cercano"""
+        if self.rotation_frames:
+            index = round(self.rotation / self.rotation_step) % len(self.rotation_frames)
+            self.sprite = self.rotation_frames[index]
             # Mantener el centro
             old_center = self.rect.center
             self.rect = self.sprite.get_rect(center=old_center)
@@ -154,14 +193,28 @@ class Ball(Entity):
             self.position.y = half_size
             self.velocity.y = abs(self.velocity.y)
             # Pequeña variación aleatoria
-            self.velocity.y += random.uniform(-WALL_BOUNCE_VARIATION, WALL_BOUNCE_VARIATION)
+            self.velocity.y += self.rng.uniform(-WALL_BOUNCE_VARIATION, WALL_BOUNCE_VARIATION)
+            self.record_bounce()
 
         # Pared inferior
         elif self.position.y + half_size >= SCREEN_HEIGHT:
             self.position.y = SCREEN_HEIGHT - half_size
             self.velocity.y = -abs(self.velocity.y)
             # Pequeña variación aleatoria
-            self.velocity.y += random.uniform(-WALL_BOUNCE_VARIATION, WALL_BOUNCE_VARIATION)
+            self.velocity.y += self.rng.uniform(-WALL_BOUNCE_VARIATION, WALL_BOUNCE_VARIATION)
+            self.record_bounce()
+
+    def record_bounce(self):
+        """
+        Registra el estado actual como inicio de una trayectoria nueva.
+        Llamar tras cualquier cambio de dirección (rebotes, reinicio): invalida
+        las predicciones de InterceptCache calculadas con el rebote anterior.
+        """
+        self.bounce_event: tuple[float, float, float, float, float] = (
+            self.position.x, self.position.y,
+            self.velocity.x, self.velocity.y,
+            self.speed
+        )
 
     def bounce_off_paddle(self, paddle_center_y: float, paddle_height: float, going_right: bool):
         """
@@ -193,13 +246,17 @@ class Ball(Entity):
         if abs(self.velocity.x) < min_x_speed:
             self.velocity.x = min_x_speed * direction
 
+        self.record_bounce()
+
     def bounce_horizontal(self):
         """Rebota horizontalmente (invierte dirección X)"""
         self.velocity.x *= -1
+        self.record_bounce()
 
     def bounce_vertical(self):
         """Rebota verticalmente (invierte dirección Y)"""
         self.velocity.y *= -1
+        self.record_bounce()
 
     def reset(self, towards_player: Optional[int] = None):
         """
@@ -214,16 +271,19 @@ class Ball(Entity):
         self.rotation = 0
         self.is_active = True
         self.last_hit_by = None
+        self.trail.clear()
 
         # Establecer dirección
         if towards_player is None:
             self._set_random_direction()
         else:
-            angle = random.uniform(-math.pi / 4, math.pi / 4)
+            angle = self.rng.uniform(-math.pi / 4, math.pi / 4)
             direction = -1 if towards_player == 1 else 1
             self.velocity.x = math.cos(angle) * self.speed * direction
             self.velocity.y = math.sin(angle) * self.speed
 
+        self.record_bounce()
+
     def is_out_left(self) -> bool:
         """Verifica si salió por la izquierda"""
         return self.position.x + BALL_SIZE < 0
@@ -278,7 +338,15 @@ class Ball(Entity):
         # Dibujar sprite rotado
         screen.blit(self.sprite, self.rect)
 
-    def render_with_trail(self, screen: pygame.Surface, trail_length: int = 5):
+    def get_dirty_rect(self) -> pygame.Rect:
+        """Retorna la zona cubierta por el meteorito y su estela"""
+        rect = self.rect.copy()
+        trail_rect = self.trail.get_rect()
+        if trail_rect:
+            rect.union_ip(trail_rect)
+        return rect
+
+    def render_with_trail(self, screen: pygame.Surface, trail_length: int = BALL_TRAIL_LENGTH):
         """
         Renderiza el meteorito con efecto de estela.
 
@@ -287,28 +355,7 @@ class Ball(Entity):
             trail_length: Longitud de la estela
         """
         # Dibujar estela
-        if self.velocity.length() > 0:
-            trail_dir = -self.velocity.normalize()
-            for i in range(trail_length):
-                alpha = int(150 * (1 - i / trail_length))
-                size = int(BALL_SIZE * (1 - i * 0.15))
-
-                trail_pos = (
-                    int(self.position.x + trail_dir.x * i * 8),
-                    int(self.position.y + trail_dir.y * i * 8)
-                )
-
-                trail_surface = pygame.Surface((size, size), pygame.SRCALPHA)
-                pygame.draw.circle(
-                    trail_surface,
-                    (255, 150, 50, alpha),
-                    (size // 2, size // 2),
-                    size // 2
-                )
-                screen.blit(
-                    trail_surface,
-                    (trail_pos[0] - size // 2, trail_pos[1] - size // 2)
-                )
+        self.trail.render(screen, trail_length)
 
         # Dibujar meteorito
         self.render(screen)
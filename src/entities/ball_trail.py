@@ -0,0 +1,122 @@
+"""
+Space Pong - Ball Trail
+Estela del meteorito basada en su historial real de posiciones
+"""
+
+import pygame
+from typing import Optional
+
+from ..core.constants import BALL_SIZE, BALL_TRAIL_LENGTH
+
+
+class BallTrail:
+    """
+    Estela del meteorito.
+    Guarda las últimas posiciones en un buffer circular de tamaño fijo y
+    dibuja discos pre-renderizados con una sola llamada a Surface.blits.
+    """
+
+    def __init__(self, length: int = BALL_TRAIL_LENGTH, color: tuple = (255, 150, 50)):
+        """
+        Inicializa la estela.
+
+        Args:
+            length: Número máximo de posiciones guardadas
+            color: Color RGB de los discos
+        """
+        self.length = max(1, length)
+        self.color = color
+
+        # Buffer circular de posiciones pasadas
+        self._xs = [0.0] * self.length
+        self._ys = [0.0] * self.length
+        self._head = 0  # Próxima posición a escribir
+        self._count = 0
+        self._rendered = 0  # Discos dibujados en el último render
+
+        # Discos pre-renderizados (uno por edad) y su offset al centro
+        self._discs: list[pygame.Surface] = []
+        self._offsets: list[int] = []
+        self._create_discs()
+
+        # Secuencia de blits reutilizada entre frames. Los prefijos comparten
+        # las mismas entradas, así que basta actualizar las coordenadas.
+        self._blit_sequence = [[disc, [0, 0]] for disc in self._discs]
+        self._prefixes = [self._blit_sequence[:n] for n in range(self.length + 1)]
+
+    def _create_discs(self):
+        """Pre-renderiza un disco por cada paso de tamaño y alpha"""
+        for i in range(self.length):
+            alpha = int(150 * (1 - i / self.length))
+            size = max(2, int(BALL_SIZE * (1 - i * 0.15)))
+
+            disc = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(
+                disc,
+                (*self.color, alpha),
+                (size // 2, size // 2),
+                size // 2
+            )
+
+            self._discs.append(disc)
+            self._offsets.append(size // 2)
+
+    def push(self, x: float, y: float):
+        """
+        Registra una nueva posición del meteorito.
+
+        Args:
+            x: Posición X
+            y: Posición Y
+        """
+        self._xs[self._head] = x
+        self._ys[self._head] = y
+        self._head = (self._head + 1) % self.length
+        if self._count < self.length:
+            self._count += 1
+
+    def clear(self):
+        """Vacía el historial (p.ej. al reiniciar el meteorito)"""
+        self._head = 0
+        self._count = 0
+        self._rendered = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def render(self, screen: pygame.Surface, trail_length: int = BALL_TRAIL_LENGTH):
+        """
+        Dibuja la estela, de la posición más reciente a la más antigua.
+
+        Args:
+            screen: Superficie donde dibujar
+            trail_length: Número de discos a dibujar
+        """
+        count = max(0, min(trail_length, self._count))
+        self._rendered = count
+        if count <= 0:
+            return
+
+        for i in range(count):
+            index = (self._head - 1 - i) % self.length
+            offset = self._offsets[i]
+            dest = self._blit_sequence[i][1]
+            dest[0] = int(self._xs[index]) - offset
+            dest[1] = int(self._ys[index]) - offset
+
+        screen.blits(self._prefixes[count], doreturn=False)
+
+    def get_rect(self) -> Optional[pygame.Rect]:
+        """
+        Retorna la zona cubierta por el último render.
+
+        Returns:
+            Rectángulo que engloba los discos dibujados, o None
+        """
+        if self._rendered <= 0:
+            return None
+
+        rect = self._discs[0].get_rect(topleft=self._blit_sequence[0][1])
+        for i in range(1, self._rendered):
+            rect.union_ip(self._discs[i].get_rect(topleft=self._blit_sequence[i][1]))
+        return rect
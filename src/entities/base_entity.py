@@ -30,6 +30,9 @@ class Entity:
         # Posición usando Vector2 para operaciones matemáticas
         self.position = pygame.math.Vector2(x, y)
 
+        # Posición al inicio del último paso de simulación (para interpolar el render)
+        self.previous_position = self.position.copy()
+
         # Velocidad
         self.velocity = pygame.math.Vector2(0, 0)
 
@@ -70,6 +73,37 @@ class Entity:
         # Dibujar sprite
         screen.blit(self.sprite, self.rect)
 
+    def get_dirty_rect(self) -> pygame.Rect:
+        """
+        Retorna la zona de pantalla que cubrió el último render.
+        Usado por el modo dirty rects.
+        """
+        return self.rect.copy()
+
+    def store_previous_position(self):
+        """Guarda la posición actual antes de avanzar un paso de simulación"""
+        self.previous_position.update(self.position)
+
+    def get_interpolated_position(
+        self,
+        alpha: float,
+        max_distance: float = 100.0
+    ) -> pygame.math.Vector2:
+        """
+        Interpola entre la posición del paso anterior y la actual.
+
+        Args:
+            alpha: Fracción del paso (0 = anterior, 1 = actual)
+            max_distance: Distancia a partir de la cual se considera un
+                teletransporte (reinicio) y no se interpola
+
+        Returns:
+            Posición para renderizar
+        """
+        if self.previous_position.distance_squared_to(self.position) > max_distance ** 2:
+            return self.position.copy()
+        return self.previous_position.lerp(self.position, alpha)
+
     def render_debug(self, screen: pygame.Surface):
         """
         Dibuja información de debug (hitbox, posición).
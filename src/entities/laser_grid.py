@@ -5,12 +5,13 @@ Representa la malla láser central que divide el campo
 
 import pygame
 import math
+import random
 from typing import Optional
 
 from .base_entity import Entity
 from ..core.constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT,
-    LASER_GRID_WIDTH, LASER_GRID_HEIGHT,
+    LASER_GRID_WIDTH, LASER_GRID_HEIGHT, LASER_PULSE_FRAMES,
     LASER_RED, LASER_GLOW
 )
 
@@ -21,12 +22,17 @@ class LaserGrid(Entity):
     Las naves no pueden tocarla sin penalización.
     """
 
-    def __init__(self, sprite: Optional[pygame.Surface] = None):
+    def __init__(
+        self,
+        sprite: Optional[pygame.Surface] = None,
+        rng: Optional[random.Random] = None
+    ):
         """
         Inicializa la malla láser.
 
         Args:
             sprite: Sprite del láser (opcional)
+            rng: Generador aleatorio cosmético para variar las partículas
         """
         # Posición central
         x = SCREEN_WIDTH // 2
@@ -43,6 +49,10 @@ class LaserGrid(Entity):
         self.pulse_speed = 2.0  # Velocidad del pulso
         self.glow_intensity = 1.0
 
+        # Rango de intensidad del pulso (ver update)
+        self.pulse_min = 0.4
+        self.pulse_max = 1.0
+
         # Colores
         self.base_color = LASER_RED
         self.glow_color = LASER_GLOW
@@ -67,6 +77,23 @@ class LaserGrid(Entity):
             SCREEN_HEIGHT
         )
 
+        # Frames del pulso pre-calculados (False = copiar el sprite cada frame)
+        self.use_pulse_frames = True
+        self.pulse_frames: list[pygame.Surface] = []
+        self._create_pulse_frames(LASER_PULSE_FRAMES)
+
+        # Partículas: RNG propio (no altera el random global) y atlas de discos
+        self.particles_enabled = True
+        self.particle_count = 10
+        self._particle_rng = random.Random()
+        self._particle_seed_base = rng.randrange(2 ** 32) if rng is not None else 0
+        self._particle_seed: Optional[int] = None
+        self._particle_layout: list[tuple[int, int]] = []  # (offset_x, size)
+        self._create_particle_atlas()
+
+        # Superficie del glow de render_simple (se crea al usarla)
+        self._simple_glow: Optional[pygame.Surface] = None
+
     def _create_sprite(self):
         """Crea el sprite del láser con efecto de glow"""
         # Superficie con alpha
@@ -114,6 +141,36 @@ class LaserGrid(Entity):
         # Actualizar rect del sprite
         self.rect = self.sprite.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
 
+    def _create_pulse_frames(self, frame_count: int):
+        """
+        Pre-calcula el sprite con cada nivel de intensidad del pulso.
+        El alpha se multiplica en los píxeles para que el blit no necesite
+        alpha de superficie.
+
+        Args:
+            frame_count: Número de niveles de intensidad
+        """
+        self.pulse_frames = []
+        if self.sprite is None:
+            return
+
+        frame_count = max(2, frame_count)
+        for i in range(frame_count):
+            intensity = self.pulse_min + (self.pulse_max - self.pulse_min) * i / (frame_count - 1)
+            alpha = int(255 * intensity)
+
+            frame = self.sprite.convert_alpha() if pygame.display.get_surface() else self.sprite.copy()
+            frame.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+            self.pulse_frames.append(frame)
+
+    def _get_pulse_frame(self) -> pygame.Surface:
+        """Retorna el frame pre-calculado más cercano a la intensidad actual"""
+        span = self.pulse_max - self.pulse_min
+        position = (self.glow_intensity - self.pulse_min) / span if span > 0 else 1.0
+        index = round(position * (len(self.pulse_frames) - 1))
+        index = max(0, min(len(self.pulse_frames) - 1, index))
+        return self.pulse_frames[index]
+
     def update(self, dt: float):
         """
         Actualiza la animación del láser.
@@ -139,13 +196,78 @@ class LaserGrid(Entity):
 
         # Crear versión con intensidad variable del sprite
         if self.sprite:
-            # Aplicar alpha basado en intensidad
-            temp_surface = self.sprite.copy()
-            temp_surface.set_alpha(int(255 * self.glow_intensity))
-            screen.blit(temp_surface, self.rect)
+            if self.use_pulse_frames and self.pulse_frames:
+                screen.blit(self._get_pulse_frame(), self.rect)
+            else:
+                # Aplicar alpha basado en intensidad
+                temp_surface = self.sprite.copy()
+                temp_surface.set_alpha(int(255 * self.glow_intensity))
+                screen.blit(temp_surface, self.rect)
 
             # Efecto de partículas en el láser
-            self._render_particles(screen)
+            if self.particles_enabled:
+                self._render_particles(screen)
+
+    def _create_particle_atlas(self, sizes: tuple = (2, 3, 4), alpha_levels: int = 8):
+        """
+        Pre-renderiza en una sola superficie los discos de partícula
+        para cada tamaño (columnas) y nivel de alpha (filas).
+
+        Args:
+            sizes: Radios de partícula posibles
+            alpha_levels: Número de niveles de alpha
+        """
+        self._particle_sizes = sizes
+        self._particle_alpha_levels = max(2, alpha_levels)
+
+        # Rango de alpha según la intensidad del pulso
+        self._particle_alpha_min = int(150 + 100 * self.pulse_min)
+        self._particle_alpha_max = int(150 + 100 * self.pulse_max)
+
+        cell = max(sizes) * 2
+        self._particle_atlas = pygame.Surface(
+            (cell * len(sizes), cell * self._particle_alpha_levels),
+            pygame.SRCALPHA
+        )
+        self._particle_areas: dict[tuple[int, int], pygame.Rect] = {}
+
+        for row in range(self._particle_alpha_levels):
+            alpha = self._particle_alpha_min + (
+                (self._particle_alpha_max - self._particle_alpha_min)
+                * row // (self._particle_alpha_levels - 1)
+            )
+            for col, size in enumerate(sizes):
+                x = col * cell
+                y = row * cell
+                pygame.draw.circle(
+                    self._particle_atlas,
+                    (255, 200, 200, alpha),
+                    (x + size, y + size),
+                    size
+                )
+                self._particle_areas[(size, row)] = pygame.Rect(x, y, size * 2, size * 2)
+
+        # Secuencia de blits reutilizada entre frames
+        self._particle_blits = [
+            [self._particle_atlas, [0, 0], self._particle_areas[(sizes[0], 0)]]
+            for _ in range(self.particle_count)
+        ]
+
+    def _update_particle_layout(self):
+        """
+        Recalcula desplazamientos y tamaños de las partículas.
+        Solo cambia cada décima de segundo, igual que la semilla.
+        """
+        seed = int(self.animation_time * 10)
+        if seed == self._particle_seed:
+            return
+
+        self._particle_seed = seed
+        self._particle_rng.seed(self._particle_seed_base + seed)
+        self._particle_layout = [
+            (self._particle_rng.randint(-5, 5), self._particle_rng.randint(2, 4))
+            for _ in range(self.particle_count)
+        ]
 
     def _render_particles(self, screen: pygame.Surface):
         """
@@ -154,34 +276,42 @@ class LaserGrid(Entity):
         Args:
             screen: Superficie donde dibujar
         """
-        import random
-
         center_x = SCREEN_WIDTH // 2
 
         # Semilla basada en tiempo para movimiento consistente
-        random.seed(int(self.animation_time * 10))
+        self._update_particle_layout()
 
-        for i in range(10):
+        # Alpha variable según el pulso, cuantizado a las filas del atlas
+        alpha = int(150 + 100 * self.glow_intensity)
+        alpha_span = self._particle_alpha_max - self._particle_alpha_min
+        row = round((alpha - self._particle_alpha_min) / alpha_span * (self._particle_alpha_levels - 1))
+        row = max(0, min(self._particle_alpha_levels - 1, row))
+
+        for i, (offset_x, size) in enumerate(self._particle_layout):
             # Posición Y que se mueve con el tiempo
-            base_y = (i * SCREEN_HEIGHT // 10 + int(self.animation_time * 100)) % SCREEN_HEIGHT
-            offset_x = random.randint(-5, 5)
-
-            # Tamaño y alpha variable
-            size = random.randint(2, 4)
-            alpha = int(150 + 100 * self.glow_intensity)
-
-            # Dibujar partícula
-            particle_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(
-                particle_surface,
-                (255, 200, 200, alpha),
-                (size, size),
-                size
-            )
-            screen.blit(
-                particle_surface,
-                (center_x + offset_x - size, base_y - size)
-            )
+            base_y = (i * SCREEN_HEIGHT // self.particle_count + int(self.animation_time * 100)) % SCREEN_HEIGHT
+
+            blit = self._particle_blits[i]
+            blit[1][0] = center_x + offset_x - size
+            blit[1][1] = base_y - size
+            blit[2] = self._particle_areas[(size, row)]
+
+        screen.blits(self._particle_blits, doreturn=False)
+
+    def get_dirty_rect(self) -> pygame.Rect:
+        """Retorna la zona cubierta por el láser y sus partículas"""
+        if self.sprite:
+            rect = pygame.Rect(self.rect.topleft, self.sprite.get_size())
+        else:
+            rect = self.rect.copy()
+
+        # Partículas: desplazamiento máximo de 5 px más el radio mayor
+        reach = 5 + max(self._particle_sizes)
+        rect.union_ip(pygame.Rect(SCREEN_WIDTH // 2 - reach, 0, reach * 2, SCREEN_HEIGHT))
+
+        # Glow de render_simple
+        rect.union_ip(pygame.Rect(SCREEN_WIDTH // 2 - self.width * 3 // 2, 0, self.width * 3, SCREEN_HEIGHT))
+        return rect
 
     def render_simple(self, screen: pygame.Surface):
         """
@@ -192,11 +322,13 @@ class LaserGrid(Entity):
         """
         center_x = SCREEN_WIDTH // 2
 
-        # Glow
+        # Glow (superficie reutilizada entre frames)
         glow_alpha = int(100 * self.glow_intensity)
-        glow_surface = pygame.Surface((self.width * 3, SCREEN_HEIGHT), pygame.SRCALPHA)
-        pygame.draw.rect(
-            glow_surface,
+        if self._simple_glow is None:
+            self._simple_glow = pygame.Surface((self.width * 3, SCREEN_HEIGHT), pygame.SRCALPHA)
+        glow_surface = self._simple_glow
+        glow_surface.fill((0, 0, 0, 0))
+        glow_surface.fill(
             (*self.glow_color[:3], glow_alpha),
             (self.width, 0, self.width, SCREEN_HEIGHT)
         )
@@ -3,13 +3,29 @@ Space Pong - Asset Manager
 Gestiona la carga y caché de todos los recursos del juego
 """
 
+import time
 import pygame
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from ..core.constants import (
     ASSETS_DIR, IMAGES_DIR, SOUNDS_DIR, FONTS_DIR,
-    SHIPS_DIR, BALL_DIR, EFFECTS_DIR, BACKGROUNDS_DIR
+    SHIPS_DIR, BALL_DIR, EFFECTS_DIR, BACKGROUNDS_DIR,
+    BALL_ROTATION_STEP, TEXT_CACHE_MAX_BYTES
+)
+
+# Imágenes de la partida (el menú no usa imágenes)
+GAMEPLAY_IMAGES = (
+    ('ship_crystal', SHIPS_DIR / 'ship_crystal.png'),
+    ('ship_ufo', SHIPS_DIR / 'ship_ufo.png'),
+    ('meteorite', BALL_DIR / 'meteorite.png'),
+    ('laser_grid', EFFECTS_DIR / 'laser_grid.png'),
+    ('star_tile', BACKGROUNDS_DIR / 'star_tile.png'),
+    ('star_tile_dense', BACKGROUNDS_DIR / 'star_tile_dense.png'),
+    ('star_tile_sparse', BACKGROUNDS_DIR / 'star_tile_sparse.png'),
+    ('star_tile_nebula', BACKGROUNDS_DIR / 'star_tile_nebula.png'),
+    ('star_tile_cluster', BACKGROUNDS_DIR / 'star_tile_cluster.png'),
 )
 
 
@@ -39,33 +55,70 @@ class AssetManager:
         self._images: dict[str, pygame.Surface] = {}
         self._sounds: dict[str, pygame.mixer.Sound] = {}
         self._fonts: dict[tuple[str, int], pygame.font.Font] = {}
+        self._rotations: dict[tuple[str, float], list[pygame.Surface]] = {}
 
-        # Pre-cargar assets esenciales
-        self._preload_essential_assets()
+        # Estadísticas de frames pre-rotados
+        self._rotation_build_time = 0.0  # segundos
 
-    def _preload_essential_assets(self):
-        """Carga los assets esenciales al inicio"""
-        print("Cargando assets...")
+        # Caché LRU de textos renderizados
+        self._texts: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        self._text_cache_bytes = 0
+        self._text_cache_limit = TEXT_CACHE_MAX_BYTES
+        self._text_hits = 0
+        self._text_misses = 0
 
-        # Cargar naves
-        self.load_image('ship_crystal', SHIPS_DIR / 'ship_crystal.png')
-        self.load_image('ship_ufo', SHIPS_DIR / 'ship_ufo.png')
+        # Carga diferida de los assets de la partida (ver preload_gameplay_assets)
+        self._gameplay_loader: Optional[Iterator[None]] = self._load_gameplay_assets()
+        self._gameplay_load_time = 0.0  # segundos
 
-        # Cargar meteorito
-        self.load_image('meteorite', BALL_DIR / 'meteorite.png')
+    def _load_gameplay_assets(self) -> Iterator[None]:
+        """
+        Carga los assets de la partida por pasos.
+        Cede el control tras cada imagen y cada bloque de frames rotados.
+        """
+        print("Cargando assets...")
 
-        # Cargar efectos
-        self.load_image('laser_grid', EFFECTS_DIR / 'laser_grid.png')
+        for name, path in GAMEPLAY_IMAGES:
+            self.load_image(name, path)
+            yield
 
-        # Cargar fondos - todos los tiles de estrellas
-        self.load_image('star_tile', BACKGROUNDS_DIR / 'star_tile.png')
-        self.load_image('star_tile_dense', BACKGROUNDS_DIR / 'star_tile_dense.png')
-        self.load_image('star_tile_sparse', BACKGROUNDS_DIR / 'star_tile_sparse.png')
-        self.load_image('star_tile_nebula', BACKGROUNDS_DIR / 'star_tile_nebula.png')
-        self.load_image('star_tile_cluster', BACKGROUNDS_DIR / 'star_tile_cluster.png')
+            if name == 'meteorite':
+                yield from self._build_rotation_frames('meteorite', BALL_ROTATION_STEP)
 
         print(f"Assets cargados: {len(self._images)} imágenes")
 
+    def preload_gameplay_assets(self, budget: Optional[float] = None) -> bool:
+        """
+        Avanza la carga de los assets de la partida.
+        Permite repartirla entre frames del menú; PlayState la completa al entrar.
+
+        Args:
+            budget: Segundos de trabajo máximos en esta llamada (None = hasta terminar).
+                Siempre se completa al menos un paso.
+
+        Returns:
+            True si ya están todos cargados
+        """
+        if self._gameplay_loader is None:
+            return True
+
+        start = time.perf_counter()
+        try:
+            while True:
+                next(self._gameplay_loader)
+                if budget is not None and time.perf_counter() - start >= budget:
+                    break
+        except StopIteration:
+            self._gameplay_loader = None
+
+        self._gameplay_load_time += time.perf_counter() - start
+        return self._gameplay_loader is None
+
+    @property
+    def gameplay_assets_ready(self) -> bool:
+        """True si los assets de la partida ya están cargados"""
+        return self._gameplay_loader is None
+
     def load_image(
         self,
         name: str,
@@ -157,6 +210,10 @@ class AssetManager:
                 print(f"  AVISO: No se encontró sonido: {path}")
                 return None
 
+            # El mixer no se abre al arrancar: se inicializa al cargar el primer sonido
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+
             sound = pygame.mixer.Sound(str(path))
             self._sounds[name] = sound
             return sound
@@ -206,6 +263,67 @@ class AssetManager:
             print(f"Error cargando fuente: {e}")
             return pygame.font.Font(None, size)
 
+    def render_text(
+        self,
+        font_key: Optional[str],
+        size: int,
+        text: str,
+        color: tuple,
+        antialias: bool = True
+    ) -> pygame.Surface:
+        """
+        Renderiza un texto reutilizando superficies ya generadas.
+        La superficie devuelta es compartida: no debe modificarse.
+
+        Args:
+            font_key: Nombre del archivo de fuente (None para fuente por defecto)
+            size: Tamaño de la fuente
+            text: Texto a renderizar
+            color: Color del texto
+            antialias: Si se suavizan los bordes
+
+        Returns:
+            pygame.Surface con el texto
+        """
+        cache_key = (font_key, size, text, tuple(color), antialias)
+
+        surface = self._texts.get(cache_key)
+        if surface is not None:
+            self._texts.move_to_end(cache_key)
+            self._text_hits += 1
+            return surface
+
+        self._text_misses += 1
+        surface = self.get_font(font_key, size).render(text, antialias, color)
+
+        self._texts[cache_key] = surface
+        self._text_cache_bytes += self._surface_bytes(surface)
+        self._trim_text_cache()
+
+        return surface
+
+    def set_text_cache_limit(self, max_bytes: int):
+        """
+        Cambia la memoria máxima de la caché de textos.
+
+        Args:
+            max_bytes: Límite en bytes
+        """
+        self._text_cache_limit = max(0, max_bytes)
+        self._trim_text_cache()
+
+    def _trim_text_cache(self):
+        """Descarta los textos menos usados hasta respetar el límite"""
+        # Siempre se conserva la entrada más reciente
+        while self._text_cache_bytes > self._text_cache_limit and len(self._texts) > 1:
+            _, surface = self._texts.popitem(last=False)
+            self._text_cache_bytes -= self._surface_bytes(surface)
+
+    @staticmethod
+    def _surface_bytes(surface: pygame.Surface) -> int:
+        """Retorna la memoria aproximada de una superficie"""
+        return surface.get_pitch() * surface.get_height()
+
     def create_scaled_image(
         self,
         name: str,
@@ -256,23 +374,111 @@ class AssetManager:
         self._images[new_name] = rotated
         return rotated
 
+    def create_rotation_frames(
+        self,
+        name: str,
+        step: float = BALL_ROTATION_STEP
+    ) -> Optional[list[pygame.Surface]]:
+        """
+        Pre-renderiza una imagen rotada a intervalos fijos de ángulo.
+        El frame i corresponde a una rotación de i * step grados
+        en sentido horario.
+
+        Args:
+            name: Nombre de la imagen original
+            step: Separación en grados entre frames
+
+        Returns:
+            Lista de frames rotados o None
+        """
+        for _ in self._build_rotation_frames(name, step):
+            pass
+        return self._rotations.get((name, step))
+
+    def _build_rotation_frames(self, name: str, step: float, chunk: int = 30) -> Iterator[None]:
+        """
+        Genera los frames rotados por bloques (ver create_rotation_frames).
+
+        Args:
+            name: Nombre de la imagen original
+            step: Separación en grados entre frames
+            chunk: Frames generados entre cada cesión de control
+        """
+        cache_key = (name, step)
+        if cache_key in self._rotations:
+            return
+
+        original = self.get_image(name)
+        if original is None:
+            return
+
+        frame_count = max(1, round(360 / step))
+        frames = []
+        for first in range(0, frame_count, chunk):
+            start = time.perf_counter()
+            frames.extend(
+                pygame.transform.rotate(original, -i * step)
+                for i in range(first, min(first + chunk, frame_count))
+            )
+            self._rotation_build_time += time.perf_counter() - start
+            if len(frames) < frame_count:
+                yield
+
+        self._rotations[cache_key] = frames
+
+    def get_rotation_frames(
+        self,
+        name: str,
+        step: float = BALL_ROTATION_STEP
+    ) -> Optional[list[pygame.Surface]]:
+        """
+        Obtiene los frames pre-rotados de una imagen, creándolos si es necesario.
+
+        Args:
+            name: Nombre de la imagen original
+            step: Separación en grados entre frames
+
+        Returns:
+            Lista de frames rotados o None
+        """
+        return self.create_rotation_frames(name, step)
+
     def unload_image(self, name: str):
         """Elimina una imagen de la caché"""
         if name in self._images:
             del self._images[name]
 
+        for cache_key in [key for key in self._rotations if key[0] == name]:
+            del self._rotations[cache_key]
+
     def clear_cache(self):
         """Limpia toda la caché de recursos"""
         self._images.clear()
         self._sounds.clear()
         self._fonts.clear()
+        self._rotations.clear()
+        self._rotation_build_time = 0.0
+        self._texts.clear()
+        self._text_cache_bytes = 0
+        self._gameplay_loader = self._load_gameplay_assets()
 
     def get_stats(self) -> dict:
         """Retorna estadísticas de recursos cargados"""
+        rotation_frames = [frame for frames in self._rotations.values() for frame in frames]
+
         return {
             'images': len(self._images),
             'sounds': len(self._sounds),
-            'fonts': len(self._fonts)
+            'fonts': len(self._fonts),
+            'rotation_frames': len(rotation_frames),
+            'rotation_bytes': sum(self._surface_bytes(f) for f in rotation_frames),
+            'rotation_build_ms': self._rotation_build_time * 1000,
+            'texts': len(self._texts),
+            'text_bytes': self._text_cache_bytes,
+            'text_hits': self._text_hits,
+            'text_misses': self._text_misses,
+            'gameplay_assets_ready': self.gameplay_assets_ready,
+            'gameplay_load_ms': self._gameplay_load_time * 1000
         }
 
 
@@ -4,13 +4,14 @@ Gestiona los estados del juego y las transiciones entre ellos
 """
 
 import pygame
-from typing import Optional, Dict, Type, TYPE_CHECKING
+from typing import Callable, Optional, Dict, TYPE_CHECKING
 
 from ..states.base_state import BaseState
 from ..core.constants import GameState
 
 if TYPE_CHECKING:
     from ..core.game import Game
+    from ..core.dirty_rects import DirtyRectTracker
 
 
 class StateManager:
@@ -31,6 +32,9 @@ class StateManager:
         # Diccionario de estados registrados
         self._states: Dict[str, BaseState] = {}
 
+        # Fábricas de estados aún no instanciados
+        self._factories: Dict[str, Callable[['Game'], BaseState]] = {}
+
         # Estado actual
         self._current_state: Optional[BaseState] = None
         self._current_state_name: str = ""
@@ -48,15 +52,32 @@ class StateManager:
         """
         self._states[name] = state
 
-    def register_state_class(self, name: str, state_class: Type[BaseState]):
+    def register_state_class(self, name: str, factory: Callable[['Game'], BaseState]):
         """
         Registra una clase de estado (se instanciará cuando se necesite).
 
         Args:
             name: Nombre identificador del estado
-            state_class: Clase del estado
+            factory: Clase del estado o función que la construye a partir del Game
+        """
+        self._factories[name] = factory
+
+    def get_state(self, name: str) -> Optional[BaseState]:
+        """
+        Retorna un estado registrado, instanciándolo si aún no existe.
+
+        Args:
+            name: Nombre identificador del estado
+
+        Returns:
+            Instancia del estado o None si no está registrado
         """
-        self._states[name] = state_class(self.game)
+        if name not in self._states:
+            factory = self._factories.pop(name, None)
+            if factory is None:
+                return None
+            self._states[name] = factory(self.game)
+        return self._states[name]
 
     def change_state(self, state_name: str, immediate: bool = False):
         """
@@ -66,7 +87,7 @@ class StateManager:
             state_name: Nombre del estado al que cambiar
             immediate: Si True, cambia inmediatamente; si False, al final del frame
         """
-        if state_name not in self._states:
+        if state_name not in self._states and state_name not in self._factories:
             print(f"AVISO: Estado '{state_name}' no registrado")
             return
 
@@ -87,7 +108,7 @@ class StateManager:
             self._current_state.exit()
 
         # Entrar al nuevo estado
-        self._current_state = self._states[state_name]
+        self._current_state = self.get_state(state_name)
         self._current_state_name = state_name
         self._current_state.enter()
 
@@ -119,15 +140,37 @@ class StateManager:
         if self._current_state:
             self._current_state.update(dt)
 
-    def render(self, screen: pygame.Surface):
+    def render(self, screen: pygame.Surface, alpha: float = 1.0):
         """
         Renderiza el estado actual.
 
         Args:
             screen: Superficie donde dibujar
+            alpha: Interpolación entre los dos últimos pasos de simulación (0-1)
+        """
+        if self._current_state:
+            self._current_state.render(screen, alpha)
+
+    def render_dirty(
+        self,
+        screen: pygame.Surface,
+        dirty: 'DirtyRectTracker',
+        alpha: float = 1.0
+    ) -> bool:
+        """
+        Renderiza el estado actual en modo dirty rects.
+
+        Args:
+            screen: Superficie donde dibujar
+            dirty: Tracker de zonas sucias
+            alpha: Interpolación entre los dos últimos pasos de simulación (0-1)
+
+        Returns:
+            False si el estado necesita un frame completo
         """
         if self._current_state:
-            self._current_state.render(screen)
+            return self._current_state.render_dirty(screen, dirty, alpha)
+        return False
 
     @property
     def current_state(self) -> Optional[BaseState]:
@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..core.game import Game
+    from ..core.dirty_rects import DirtyRectTracker
 
 
 class BaseState(ABC):
@@ -26,6 +27,18 @@ class BaseState(ABC):
         """
         self.game = game
 
+    def profile(self, name: str):
+        """
+        Mide una sub-fase del frame con el profiler del juego.
+
+        Args:
+            name: Nombre de la sub-fase ('update.play.ball', ...)
+
+        Returns:
+            Context manager de la sección medida
+        """
+        return self.game.profiler.section(name)
+
     def enter(self):
         """
         Llamado cuando se entra a este estado.
@@ -61,11 +74,55 @@ class BaseState(ABC):
         pass
 
     @abstractmethod
-    def render(self, screen: pygame.Surface):
+    def render(self, screen: pygame.Surface, alpha: float = 1.0):
         """
         Dibuja el estado en pantalla.
 
         Args:
             screen: Superficie donde dibujar
+            alpha: Interpolación entre los dos últimos pasos de simulación (0-1)
         """
         pass
+
+    def render_dirty(
+        self,
+        screen: pygame.Surface,
+        dirty: 'DirtyRectTracker',
+        alpha: float = 1.0
+    ) -> bool:
+        """
+        Dibuja el estado en modo dirty rects: restaura el fondo estático
+        y registra en el tracker cada zona dibujada.
+        Override en estados que lo soporten.
+
+        Args:
+            screen: Superficie donde dibujar
+            dirty: Tracker de zonas sucias
+            alpha: Interpolación entre los dos últimos pasos de simulación (0-1)
+
+        Returns:
+            False si el estado necesita un frame completo
+        """
+        return False
+
+    def is_animating(self) -> bool:
+        """
+        Indica si el estado cambia con el tiempo sin necesidad de input.
+        Si retorna False el loop baja el ritmo y no redibuja frames iguales.
+        Override en estados con pantallas estáticas.
+
+        Returns:
+            True si el estado se anima solo
+        """
+        return True
+
+    def is_attract_mode(self) -> bool:
+        """
+        Indica si el estado puede quedar desatendido sin que nadie juegue
+        (menú, demo Bot vs Bot). Solo en ese caso el loop baja el ritmo
+        tras un rato sin input; con jugadores humanos nunca.
+
+        Returns:
+            True si se puede limitar el ritmo por falta de input
+        """
+        return False
@@ -3,15 +3,23 @@ Space Pong - Menu State
 Menú principal del juego
 """
 
+import random
 import pygame
 from typing import TYPE_CHECKING, List
 
 from .base_state import BaseState
+from ..managers.asset_manager import get_asset_manager
 from ..core.constants import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, SPACE_BLACK,
+    SCREEN_WIDTH, SCREEN_HEIGHT, SPACE_BLACK, MENU_STAR_COUNT,
     GameState, GameMode, UI_PRIMARY, UI_HIGHLIGHT, UI_TEXT
 )
 
+# Campo de estrellas vectorizado (requiere NumPy)
+try:
+    from ..ui.starfield import Starfield
+except ImportError:
+    Starfield = None
+
 if TYPE_CHECKING:
     from ..core.game import Game
 
@@ -32,19 +40,20 @@ class MenuState(BaseState):
     Permite seleccionar modo de juego y configuraciones.
     """
 
-    def __init__(self, game: 'Game'):
+    def __init__(self, game: 'Game', star_count: int = MENU_STAR_COUNT):
         """
         Inicializa el estado del menú.
 
         Args:
             game: Referencia al juego principal
+            star_count: Número de estrellas del fondo
         """
         super().__init__(game)
 
-        # Fuentes
-        self.font_title = None
-        self.font_menu = None
-        self.font_hint = None
+        # Tamaños de fuente (los textos se cachean en el AssetManager)
+        self.font_title_size = 80
+        self.font_menu_size = 48
+        self.font_hint_size = 28
 
         # Items del menú
         self.menu_items: List[MenuItem] = []
@@ -55,17 +64,14 @@ class MenuState(BaseState):
         self.title_offset = 0
 
         # Fondo
-        self.stars = []
+        self.star_count = star_count
+        self.starfield = None
+        self.stars = []  # Solo si NumPy no está disponible
 
     def enter(self):
         """Inicializa el menú al entrar"""
         print("Entrando a MenuState")
 
-        # Inicializar fuentes
-        self.font_title = pygame.font.Font(None, 80)
-        self.font_menu = pygame.font.Font(None, 48)
-        self.font_hint = pygame.font.Font(None, 28)
-
         # Crear items del menú
         self._create_menu_items()
 
@@ -87,9 +93,12 @@ class MenuState(BaseState):
 
     def _generate_stars(self):
         """Genera estrellas aleatorias para el fondo"""
-        import random
+        if Starfield is not None:
+            self.starfield = Starfield(self.star_count)
+            return
+
         self.stars = []
-        for _ in range(100):
+        for _ in range(self.star_count):
             x = random.randint(0, SCREEN_WIDTH)
             y = random.randint(0, SCREEN_HEIGHT)
             size = random.choice([1, 1, 1, 2, 2, 3])
@@ -161,12 +170,16 @@ class MenuState(BaseState):
         """
         if self.game.state_manager:
             # Configurar el modo en PlayState
-            play_state = self.game.state_manager._states.get(GameState.PLAYING)
+            play_state = self.game.state_manager.get_state(GameState.PLAYING)
             if play_state and hasattr(play_state, 'set_game_mode'):
                 play_state.set_game_mode(mode)
 
             self.game.state_manager.change_state(GameState.PLAYING)
 
+    def is_attract_mode(self) -> bool:
+        """El menú puede quedar desatendido"""
+        return True
+
     def update(self, dt: float):
         """
         Actualiza la animación del menú.
@@ -181,36 +194,52 @@ class MenuState(BaseState):
         self.title_offset = math.sin(self.animation_time * 2) * 5
 
         # Mover estrellas
+        with self.profile('update.menu.stars'):
+            self._update_stars(dt)
+
+    def _update_stars(self, dt: float):
+        """Mueve las estrellas del fondo"""
+        if self.starfield:
+            self.starfield.update(dt)
+            return
+
         for star in self.stars:
             star['y'] += star['speed']
             if star['y'] > SCREEN_HEIGHT:
                 star['y'] = 0
-                star['x'] = pygame.time.get_ticks() % SCREEN_WIDTH
+                star['x'] = random.randint(0, SCREEN_WIDTH)
 
-    def render(self, screen: pygame.Surface):
+    def render(self, screen: pygame.Surface, alpha: float = 1.0):
         """
         Dibuja el menú.
 
         Args:
             screen: Superficie donde dibujar
+            alpha: Interpolación de simulación (no se usa en el menú)
         """
         # Fondo
         screen.fill(SPACE_BLACK)
 
         # Estrellas
-        self._render_stars(screen)
+        with self.profile('render.menu.stars'):
+            self._render_stars(screen)
 
-        # Título
-        self._render_title(screen)
+        with self.profile('render.menu.text'):
+            # Título
+            self._render_title(screen)
 
-        # Items del menú
-        self._render_menu_items(screen)
+            # Items del menú
+            self._render_menu_items(screen)
 
-        # Instrucciones
-        self._render_hints(screen)
+            # Instrucciones
+            self._render_hints(screen)
 
     def _render_stars(self, screen: pygame.Surface):
         """Renderiza las estrellas del fondo"""
+        if self.starfield:
+            self.starfield.render(screen)
+            return
+
         for star in self.stars:
             color = (star['brightness'],) * 3
             pygame.draw.circle(
@@ -222,21 +251,21 @@ class MenuState(BaseState):
     def _render_title(self, screen: pygame.Surface):
         """Renderiza el título del juego"""
         # Sombra
-        shadow = self.font_title.render("SPACE PONG", True, (50, 50, 100))
+        shadow = self._render_text(self.font_title_size, "SPACE PONG", (50, 50, 100))
         shadow_rect = shadow.get_rect(
             center=(SCREEN_WIDTH // 2 + 3, 120 + self.title_offset + 3)
         )
         screen.blit(shadow, shadow_rect)
 
         # Título principal
-        title = self.font_title.render("SPACE PONG", True, UI_PRIMARY)
+        title = self._render_text(self.font_title_size, "SPACE PONG", UI_PRIMARY)
         title_rect = title.get_rect(
             center=(SCREEN_WIDTH // 2, 120 + self.title_offset)
         )
         screen.blit(title, title_rect)
 
         # Subtítulo
-        subtitle = self.font_hint.render("Tenis Espacial", True, (150, 150, 180))
+        subtitle = self._render_text(self.font_hint_size, "Tenis Espacial", (150, 150, 180))
         subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, 165))
         screen.blit(subtitle, subtitle_rect)
 
@@ -248,7 +277,7 @@ class MenuState(BaseState):
                 color = UI_HIGHLIGHT
 
                 # Indicador de selección
-                indicator = self.font_menu.render(">", True, UI_HIGHLIGHT)
+                indicator = self._render_text(self.font_menu_size, ">", UI_HIGHLIGHT)
                 ind_rect = indicator.get_rect(
                     right=SCREEN_WIDTH // 2 - 120,
                     centery=item.y_position
@@ -256,7 +285,7 @@ class MenuState(BaseState):
                 screen.blit(indicator, ind_rect)
 
                 # Fondo del item - ancho dinámico basado en el texto
-                text_surface = self.font_menu.render(item.text, True, color)
+                text_surface = self._render_text(self.font_menu_size, item.text, color)
                 item_width = text_surface.get_width() + 40
                 bg_rect = pygame.Rect(
                     SCREEN_WIDTH // 2 - item_width // 2 - 10,
@@ -270,7 +299,7 @@ class MenuState(BaseState):
                 color = UI_TEXT
 
             # Texto del item
-            text = self.font_menu.render(item.text, True, color)
+            text = self._render_text(self.font_menu_size, item.text, color)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, item.y_position))
             screen.blit(text, text_rect)
 
@@ -284,7 +313,21 @@ class MenuState(BaseState):
 
         y = SCREEN_HEIGHT - 80
         for hint in hints:
-            text = self.font_hint.render(hint, True, (120, 120, 150))
+            text = self._render_text(self.font_hint_size, hint, (120, 120, 150))
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, y))
             screen.blit(text, text_rect)
             y += 25
+
+    def _render_text(self, size: int, text: str, color: tuple) -> pygame.Surface:
+        """
+        Renderiza un texto usando la caché del AssetManager.
+
+        Args:
+            size: Tamaño de la fuente
+            text: Texto a renderizar
+            color: Color del texto
+
+        Returns:
+            Superficie con el texto (compartida, no modificar)
+        """
+        return get_asset_manager().render_text(None, size, text, color)
@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING, Optional
 from .base_state import BaseState
 from ..core.constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT, SPACE_BLACK,
-    GameState, GameMode, WINNING_SCORE
+    GameState, GameMode, WINNING_SCORE, SHIP_SPEED
 )
 from ..entities.ship import Ship
 from ..entities.ball import Ball
@@ -17,11 +17,14 @@ from ..entities.laser_grid import LaserGrid
 from ..systems.input_handler import InputHandler
 from ..systems.physics import PhysicsSystem
 from ..systems.collision import CollisionSystem
+from ..systems.intercept_cache import InterceptCache
+from ..systems.rng import MatchRNG
 from ..ui.scoreboard import Scoreboard
 from ..managers.asset_manager import get_asset_manager
 
 if TYPE_CHECKING:
     from ..core.game import Game
+    from ..core.dirty_rects import DirtyRectTracker
 
 
 class PlayState(BaseState):
@@ -49,10 +52,18 @@ class PlayState(BaseState):
         self.ball: Optional[Ball] = None
         self.laser_grid: Optional[LaserGrid] = None
 
+        # Aleatoriedad por partida (simulación y cosmética)
+        self.rng = MatchRNG()
+        self.match_seed: Optional[int] = None  # None = semilla nueva en cada partida
+
         # Sistemas
-        self.input_handler = InputHandler()
-        self.physics = PhysicsSystem()
+        self.input_handler = InputHandler(
+            low_latency=game.low_latency_input,
+            latency_tracker=game.input_latency
+        )
+        self.physics = PhysicsSystem(self.rng.simulation)
         self.collision = CollisionSystem()
+        self.intercept_cache = InterceptCache()  # predicciones compartidas por las IAs
 
         # UI
         self.scoreboard = Scoreboard()
@@ -61,6 +72,7 @@ class PlayState(BaseState):
         self.paused = False
         self.game_over = False
         self.winner = None
+        self.paddle_hits = 0  # golpes de nave en la partida (estadísticas)
 
         # Menú de pausa
         self.pause_menu_options = ["Continuar", "Salir al Menú"]
@@ -73,6 +85,8 @@ class PlayState(BaseState):
 
         # AI Controller (se inicializa si es necesario)
         self.ai_controller = None
+        self.ai_controller_p1 = None  # Solo en modo Bot vs Bot
+        self.ai_difficulty_p1: Optional[str] = None  # None = misma que el bot derecho
 
         # Sistema de niveles (solo en modo PVE)
         self.current_level = 1
@@ -87,31 +101,51 @@ class PlayState(BaseState):
         # Fondo - lista de tiles para variedad
         self.background_tiles = []
 
+        # Overlays cacheados y último frame completo mientras la escena está congelada
+        self._overlay_layers: dict[tuple, tuple[pygame.Surface, pygame.Rect]] = {}
+        self._scene_version = 0  # Cambia cada vez que la escena se actualiza
+        self._frozen_frame: Optional[pygame.Surface] = None
+        self._frozen_key: Optional[tuple] = None
+
+        # Caché del fondo pre-compuesto (False = tilear cada frame, para comparar)
+        self.use_background_cache = True
+        self._background_layer: Optional[pygame.Surface] = None
+        self._background_layer_key: Optional[tuple] = None
+
     def enter(self):
         """Inicializa el estado al entrar"""
         print("Entrando a PlayState")
 
-        # Cargar assets
+        # Cargar assets (completa la precarga si el menú no llegó a terminarla)
         asset_manager = get_asset_manager()
+        asset_manager.preload_gameplay_assets()
 
         # Crear jugadores
         ship1_sprite = asset_manager.get_image('ship_crystal')
         ship2_sprite = asset_manager.get_image('ship_ufo')
 
-        self.player1 = Ship(1, ship1_sprite, is_bot=False)
+        self.player1 = Ship(
+            1,
+            ship1_sprite,
+            is_bot=(self.game_mode == GameMode.EVE)
+        )
         self.player2 = Ship(
             2,
             ship2_sprite,
-            is_bot=(self.game_mode == GameMode.PVE)
+            is_bot=(self.game_mode in (GameMode.PVE, GameMode.EVE))
         )
 
         # Crear meteorito
         ball_sprite = asset_manager.get_image('meteorite')
-        self.ball = Ball(sprite=ball_sprite)
+        self.ball = Ball(
+            sprite=ball_sprite,
+            rotation_frames=asset_manager.get_rotation_frames('meteorite'),
+            rng=self.rng.simulation
+        )
 
         # Crear malla láser
         laser_sprite = asset_manager.get_image('laser_grid')
-        self.laser_grid = LaserGrid(sprite=laser_sprite)
+        self.laser_grid = LaserGrid(sprite=laser_sprite, rng=self.rng.cosmetic)
 
         # Configurar input handler
         self.input_handler.set_ships(self.player1, self.player2)
@@ -123,23 +157,41 @@ class PlayState(BaseState):
         self.background_tiles = [t for t in self.background_tiles if t is not None]
 
         # Inicializar AI si es necesario
-        if self.game_mode == GameMode.PVE:
+        self.ai_controller = None
+        self.ai_controller_p1 = None
+        if self.game_mode in (GameMode.PVE, GameMode.EVE):
             self._init_ai()
 
         # Resetear estado
         self._reset_game()
+        self._scene_version += 1
 
     def _init_ai(self):
         """Inicializa el controlador de IA"""
         try:
             from ..systems.ai_controller import AIController
-            self.ai_controller = AIController(self.ai_difficulty)
+            self.ai_controller = AIController(
+                self.ai_difficulty, self.rng.simulation, self.intercept_cache
+            )
+            if self.game_mode == GameMode.EVE:
+                self.ai_controller_p1 = AIController(
+                    self.ai_difficulty_p1 or self.ai_difficulty,
+                    self.rng.simulation, self.intercept_cache
+                )
         except ImportError:
             print("AVISO: AI Controller no disponible")
             self.ai_controller = None
+            self.ai_controller_p1 = None
 
     def _reset_game(self):
         """Reinicia el juego completamente"""
+        # Nueva partida: reiniciar la aleatoriedad desde la semilla de partida
+        self.rng.reseed(self.match_seed)
+
+        for ai in (self.ai_controller, self.ai_controller_p1):
+            if ai:
+                ai.reset()
+
         self.player1.reset_position()
         self.player1.reset_score()
 
@@ -153,6 +205,7 @@ class PlayState(BaseState):
         self.game_over = False
         self.winner = None
         self.reset_timer = 0
+        self.paddle_hits = 0
 
         # Resetear sistema de niveles
         self.current_level = 1
@@ -174,6 +227,13 @@ class PlayState(BaseState):
 
     def _apply_level_speeds(self):
         """Aplica las velocidades segun el nivel actual"""
+        # Bot vs Bot: sin niveles, cada nave usa la velocidad de su dificultad
+        if self.game_mode == GameMode.EVE:
+            for ship, ai in ((self.player1, self.ai_controller_p1), (self.player2, self.ai_controller)):
+                if ship and ai:
+                    ship.speed = SHIP_SPEED * ai.settings['speed_multiplier']
+            return
+
         if self.game_mode != GameMode.PVE:
             return
 
@@ -260,8 +320,19 @@ class PlayState(BaseState):
                 self._reset_game()
                 return
 
+        # Pausar al perder el foco si juega alguna persona (las teclas soltadas
+        # fuera de la ventana no llegan)
+        if event.type == pygame.WINDOWFOCUSLOST:
+            if self.game_mode != GameMode.EVE:
+                self.input_handler.clear()
+                if not self.paused and not self.game_over:
+                    self.paused = True
+                    self.pause_menu_selected = 0
+            return
+
         # Pasar eventos al input handler si no está pausado
-        if not self.paused and not self.game_over:
+        # (las teclas soltadas siempre, para que no queden activas tras la pausa)
+        if (not self.paused and not self.game_over) or event.type == pygame.KEYUP:
             self.input_handler.handle_event(event)
 
     def _handle_pause_menu_input(self, event: pygame.event.Event):
@@ -307,6 +378,14 @@ class PlayState(BaseState):
             # Salir al menú - mostrar confirmación
             self.show_exit_confirmation = True
 
+    def is_animating(self) -> bool:
+        """La pausa y el fin de partida son pantallas estáticas"""
+        return not (self.paused or self.game_over)
+
+    def is_attract_mode(self) -> bool:
+        """Solo Bot vs Bot se juega sin input"""
+        return self.game_mode == GameMode.EVE
+
     def update(self, dt: float):
         """
         Actualiza la lógica del juego.
@@ -317,6 +396,12 @@ class PlayState(BaseState):
         if self.paused or self.game_over:
             return
 
+        self._scene_version += 1
+
+        # Guardar posiciones del paso anterior para interpolar el render
+        for entity in (self.player1, self.player2, self.ball):
+            entity.store_previous_position()
+
         # Timer de reinicio después de punto
         if self.reset_timer > 0:
             self.reset_timer -= dt
@@ -326,41 +411,65 @@ class PlayState(BaseState):
         self.input_handler.update()
 
         # Actualizar IA si está activa
-        if self.ai_controller and self.player2.is_bot:
-            ai_direction = self.ai_controller.update(dt, self.ball, self.player2)
-            self.player2.set_movement(ai_direction)
-
-        # Actualizar entidades
-        self.player1.update(dt)
-        self.player2.update(dt)
-        self.ball.update(dt)
-        self.laser_grid.update(dt)
+        with self.profile('update.play.ai'):
+            if self.ai_controller and self.player2.is_bot:
+                ai_direction = self.ai_controller.update(dt, self.ball, self.player2)
+                self.player2.set_movement(ai_direction)
 
-        # Verificar colisiones
-        self._check_collisions()
+            if self.ai_controller_p1 and self.player1.is_bot:
+                ai_direction = self.ai_controller_p1.update(dt, self.ball, self.player1)
+                self.player1.set_movement(ai_direction)
 
-        # Verificar puntuación
-        self._check_scoring()
+        # Actualizar entidades
+        with self.profile('update.play.ships'):
+            self.player1.update(dt)
+            self.player2.update(dt)
+        with self.profile('update.play.ball'):
+            self.ball.update(dt)
+        with self.profile('update.play.laser'):
+            self.laser_grid.update(dt)
+
+        # Verificar colisiones y puntuación
+        with self.profile('update.play.collisions'):
+            self._check_collisions(dt)
+            self._check_scoring()
 
         # Actualizar UI
-        self.scoreboard.update(dt)
+        with self.profile('update.play.ui'):
+            self.scoreboard.update(dt)
+
+    def _check_collisions(self, dt: float):
+        """
+        Verifica todas las colisiones.
 
-    def _check_collisions(self):
-        """Verifica todas las colisiones"""
+        Args:
+            dt: Paso de simulación (para rebotar en el instante de impacto)
+        """
         if not self.ball:
             return
 
+        # Barrido desde la posición al inicio del paso: sin atravesar naves
+        start = self.ball.previous_position
+
         # Colisión con nave 1
         if self.ball.velocity.x < 0:  # Va hacia la izquierda
-            result = self.collision.check_ball_ship_collision(self.ball, self.player1)
+            result = self.collision.check_ball_ship_collision(self.ball, self.player1, start)
             if result.collided:
-                PhysicsSystem.bounce_off_paddle(self.ball, self.player1)
+                PhysicsSystem.bounce_off_paddle_at(
+                    self.ball, self.player1, result.impact_point,
+                    (1.0 - result.time_of_impact) * dt
+                )
+                self.paddle_hits += 1
 
         # Colisión con nave 2
         if self.ball.velocity.x > 0:  # Va hacia la derecha
-            result = self.collision.check_ball_ship_collision(self.ball, self.player2)
+            result = self.collision.check_ball_ship_collision(self.ball, self.player2, start)
             if result.collided:
-                PhysicsSystem.bounce_off_paddle(self.ball, self.player2)
+                PhysicsSystem.bounce_off_paddle_at(
+                    self.ball, self.player2, result.impact_point,
+                    (1.0 - result.time_of_impact) * dt
+                )
+                self.paddle_hits += 1
 
         # Colisión de naves con láser
         laser_rect = self.laser_grid.get_collision_rect()
@@ -433,43 +542,213 @@ class PlayState(BaseState):
             self.game_over = True
             self.winner = winner
 
-    def render(self, screen: pygame.Surface):
+    def render(self, screen: pygame.Surface, alpha: float = 1.0):
         """
         Dibuja el estado de juego.
 
         Args:
             screen: Superficie donde dibujar
+            alpha: Interpolación entre los dos últimos pasos de simulación (0-1)
         """
+        # Con pausa o fin de juego la escena no cambia: reutilizar el último frame
+        overlay_key = self._get_overlay_key()
+        if overlay_key is not None:
+            frozen_key = (overlay_key, self._scene_version, screen.get_size())
+            if self._frozen_frame is not None and self._frozen_key == frozen_key:
+                screen.blit(self._frozen_frame, (0, 0))
+                return
+        else:
+            self._frozen_frame = None
+            self._frozen_key = None
+
+        quality = self.game.quality.preset
+
         # Fondo
-        self._render_background(screen)
+        with self.profile('render.play.background'):
+            self._render_background(screen)
 
         # Entidades
-        if self.laser_grid:
-            self.laser_grid.render(screen)
+        with self.profile('render.play.laser'):
+            self._render_laser(screen, quality)
 
-        if self.player1:
-            self.player1.render(screen)
+        interpolated = self._begin_interpolation(alpha)
 
-        if self.player2:
-            self.player2.render(screen)
+        with self.profile('render.play.ships'):
+            if self.player1:
+                self.player1.render(screen)
 
-        if self.ball:
-            self.ball.render_with_trail(screen)
+            if self.player2:
+                self.player2.render(screen)
+
+        with self.profile('render.play.ball'):
+            self._render_ball(screen, quality)
+
+        self._end_interpolation(interpolated)
 
         # UI
+        with self.profile('render.play.ui'):
+            self._render_scoreboard(screen, quality)
+
+            # Marcador de nivel (solo en PVE)
+            if self.game_mode == GameMode.PVE:
+                self._render_level_indicator(screen)
+
+        # Overlays de pausa y fin de juego
+        with self.profile('render.play.overlay'):
+            if self.paused:
+                self._render_pause_overlay(screen)
+
+            if self.game_over:
+                self._render_game_over(screen)
+
+        if overlay_key is not None:
+            self._frozen_frame = screen.copy()
+            self._frozen_key = frozen_key
+
+    def render_dirty(
+        self,
+        screen: pygame.Surface,
+        dirty: 'DirtyRectTracker',
+        alpha: float = 1.0
+    ) -> bool:
+        """
+        Dibuja el estado en modo dirty rects.
+        Los overlays de pausa y fin de juego requieren frame completo.
+
+        Args:
+            screen: Superficie donde dibujar
+            dirty: Tracker de zonas sucias
+            alpha: Interpolación entre los dos últimos pasos de simulación (0-1)
+
+        Returns:
+            False si se necesita un frame completo
+        """
+        if self.paused or self.game_over:
+            return False
+
+        quality = self.game.quality.preset
+
+        # Restaurar el fondo donde se dibujó el frame anterior
+        with self.profile('render.play.background'):
+            dirty.restore(screen, self._get_background_layer(screen.get_size()))
+
+        # Entidades
+        with self.profile('render.play.laser'):
+            dirty.add(self._render_laser(screen, quality))
+
+        interpolated = self._begin_interpolation(alpha)
+
+        with self.profile('render.play.ships'):
+            for ship in (self.player1, self.player2):
+                if ship:
+                    ship.render(screen)
+                    dirty.add(ship.get_dirty_rect())
+
+        with self.profile('render.play.ball'):
+            dirty.add(self._render_ball(screen, quality))
+
+        self._end_interpolation(interpolated)
+
+        # UI
+        with self.profile('render.play.ui'):
+            dirty.add_all(self._render_scoreboard(screen, quality))
+
+            if self.game_mode == GameMode.PVE:
+                dirty.add(self._render_level_indicator(screen))
+
+        return True
+
+    def _render_laser(self, screen: pygame.Surface, quality: dict) -> Optional[pygame.Rect]:
+        """
+        Dibuja el láser según el nivel de calidad.
+
+        Args:
+            screen: Superficie donde dibujar
+            quality: Opciones de calidad (ver QUALITY_LEVELS)
+
+        Returns:
+            Zona de pantalla que puede haber cambiado
+        """
+        if not self.laser_grid:
+            return None
+
+        if quality['simple_laser']:
+            self.laser_grid.render_simple(screen)
+        else:
+            self.laser_grid.particles_enabled = quality['laser_particles']
+            self.laser_grid.render(screen)
+        return self.laser_grid.get_dirty_rect()
+
+    def _render_ball(self, screen: pygame.Surface, quality: dict) -> Optional[pygame.Rect]:
+        """
+        Dibuja el meteorito con la estela que permita el nivel de calidad.
+
+        Args:
+            screen: Superficie donde dibujar
+            quality: Opciones de calidad (ver QUALITY_LEVELS)
+
+        Returns:
+            Zona de pantalla dibujada
+        """
+        if not self.ball:
+            return None
+
+        # Con longitud 0 solo se dibuja el meteorito (Ball.render)
+        self.ball.render_with_trail(screen, quality['trail_length'])
+        return self.ball.get_dirty_rect()
+
+    def _render_scoreboard(self, screen: pygame.Surface, quality: dict) -> list[pygame.Rect]:
+        """
+        Dibuja el marcador completo o su versión mínima.
+
+        Args:
+            screen: Superficie donde dibujar
+            quality: Opciones de calidad (ver QUALITY_LEVELS)
+
+        Returns:
+            Zonas de pantalla dibujadas
+        """
+        if quality['minimal_scoreboard']:
+            # En PVE el indicador de nivel ocupa el centro superior
+            center_y = 115 if self.game_mode == GameMode.PVE else 40
+            return [self.scoreboard.render_minimal(screen, center_y)]
+
         self.scoreboard.render(screen)
+        return self.scoreboard.get_dirty_rects()
 
-        # Marcador de nivel (solo en PVE)
-        if self.game_mode == GameMode.PVE:
-            self._render_level_indicator(screen)
+    def _begin_interpolation(self, alpha: float) -> list[tuple]:
+        """
+        Coloca temporalmente las entidades móviles en su posición interpolada
+        para dibujarlas entre dos pasos de simulación.
 
-        # Overlay de pausa
-        if self.paused:
-            self._render_pause_overlay(screen)
+        Args:
+            alpha: Fracción del paso actual (0-1)
 
-        # Overlay de fin de juego
-        if self.game_over:
-            self._render_game_over(screen)
+        Returns:
+            Posiciones reales a restaurar con _end_interpolation
+        """
+        saved = []
+        if alpha >= 1.0:
+            return saved
+
+        for entity in (self.player1, self.player2, self.ball):
+            if entity:
+                saved.append((entity, entity.position.copy()))
+                entity.position.update(entity.get_interpolated_position(alpha))
+                entity.rect.center = (int(entity.position.x), int(entity.position.y))
+
+        return saved
+
+    def _end_interpolation(self, saved: list[tuple]):
+        """
+        Restaura las posiciones reales tras dibujar.
+
+        Args:
+            saved: Valor retornado por _begin_interpolation
+        """
+        for entity, position in saved:
+            entity.position.update(position)
+            entity.rect.center = (int(position.x), int(position.y))
 
     def _render_background(self, screen: pygame.Surface):
         """
@@ -478,30 +757,75 @@ class PlayState(BaseState):
         Args:
             screen: Superficie donde dibujar
         """
+        if self.use_background_cache:
+            screen.blit(self._get_background_layer(screen.get_size()), (0, 0))
+        else:
+            self._compose_background(screen)
+
+    def _compose_background(self, target: pygame.Surface):
+        """
+        Tilea el fondo completo sobre una superficie.
+
+        Args:
+            target: Superficie donde componer el fondo
+        """
         import random
-        screen.fill(SPACE_BLACK)
+        target.fill(SPACE_BLACK)
 
         # Tilear el fondo con tiles aleatorios
         if self.background_tiles:
             tile_w = self.background_tiles[0].get_width()
             tile_h = self.background_tiles[0].get_height()
+            width, height = target.get_size()
 
             # Seed fijo para que el patron sea consistente entre frames
-            random.seed(12345)
-            for x in range(0, SCREEN_WIDTH, tile_w):
-                for y in range(0, SCREEN_HEIGHT, tile_h):
-                    tile = random.choice(self.background_tiles)
-                    screen.blit(tile, (x, y))
+            # (RNG propio para no alterar el random global)
+            rng = random.Random(12345)
+            for x in range(0, width, tile_w):
+                for y in range(0, height, tile_h):
+                    tile = rng.choice(self.background_tiles)
+                    target.blit(tile, (x, y))
+
+    def _get_background_layer(self, size: tuple[int, int]) -> pygame.Surface:
+        """
+        Obtiene el fondo pre-compuesto, reconstruyéndolo solo si cambiaron
+        los tiles o la resolución.
+
+        Args:
+            size: Tamaño (ancho, alto) de la pantalla
+
+        Returns:
+            Superficie con el fondo completo
+        """
+        key = (size, tuple(id(tile) for tile in self.background_tiles))
+
+        if self._background_layer is None or self._background_layer_key != key:
+            layer = pygame.Surface(size)
+            # Formato de display para que el blit por frame sea una copia directa
+            if pygame.display.get_surface() is not None:
+                layer = layer.convert()
+            self._compose_background(layer)
 
+            self._background_layer = layer
+            self._background_layer_key = key
 
-    def _render_level_indicator(self, screen: pygame.Surface):
-        """Renderiza el indicador de nivel en el centro superior"""
-        font_level = pygame.font.Font(None, 36)
-        font_progress = pygame.font.Font(None, 24)
+        return self._background_layer
 
+    def invalidate_background_cache(self):
+        """Fuerza la reconstrucción del fondo en el próximo frame"""
+        self._background_layer = None
+        self._background_layer_key = None
+
+    def _render_level_indicator(self, screen: pygame.Surface) -> pygame.Rect:
+        """
+        Renderiza el indicador de nivel en el centro superior.
+
+        Returns:
+            Zona de pantalla cubierta por el indicador
+        """
         # Texto del nivel
         level_text = f"NIVEL {self.current_level}"
-        level_surface = font_level.render(level_text, True, (100, 200, 255))
+        level_surface = self._render_text(36, level_text, (100, 200, 255))
         level_rect = level_surface.get_rect(center=(SCREEN_WIDTH // 2, 30))
 
         # Fondo del indicador
@@ -530,10 +854,69 @@ class PlayState(BaseState):
 
         # Texto de progreso
         progress_text = f"{self.level_points}/{self.points_for_next_level}"
-        progress_surface = font_progress.render(progress_text, True, (150, 150, 180))
+        progress_surface = self._render_text(24, progress_text, (150, 150, 180))
         progress_rect = progress_surface.get_rect(center=(SCREEN_WIDTH // 2, bar_y + bar_height + 12))
         screen.blit(progress_surface, progress_rect)
 
+        return bg_rect.union(progress_rect)
+
+    def _get_overlay_key(self) -> Optional[tuple]:
+        """
+        Identifica los overlays visibles y su contenido.
+
+        Returns:
+            Tupla que cambia cuando cambia el overlay, o None si no hay overlay
+        """
+        key = ()
+        if self.paused:
+            if self.show_exit_confirmation:
+                key += (('exit',),)
+            else:
+                key += (('pause', self.pause_menu_selected),)
+        if self.game_over:
+            key += (('game_over', self.winner),)
+        return key or None
+
+    def _darken(self, screen: pygame.Surface, alpha: int):
+        """
+        Oscurece la pantalla como un velo negro con el alpha dado,
+        sin reservar una superficie de pantalla completa.
+
+        Args:
+            screen: Superficie donde dibujar
+            alpha: Opacidad del velo (0-255)
+        """
+        level = 255 - alpha
+        screen.fill((level, level, level), special_flags=pygame.BLEND_MULT)
+
+    def _get_overlay_layer(self, key: tuple) -> tuple[pygame.Surface, pygame.Rect]:
+        """
+        Obtiene la capa cacheada de un overlay (textos y diálogo),
+        recortada a la zona con contenido.
+
+        Args:
+            key: Identificador del overlay (ver _get_overlay_key)
+
+        Returns:
+            Tupla (capa, posición en pantalla)
+        """
+        layer = self._overlay_layers.get(key)
+        if layer is None:
+            surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+
+            if key[0] == 'pause':
+                self._draw_pause_menu(surface)
+            elif key[0] == 'exit':
+                self._draw_exit_confirmation(surface)
+            else:
+                self._draw_game_over(surface)
+
+            rect = surface.get_bounding_rect()
+            layer = (surface.subsurface(rect).copy(), rect)
+            self._overlay_layers[key] = layer
+
+        return layer
+
     def _render_pause_overlay(self, screen: pygame.Surface):
         """
         Renderiza el overlay de pausa.
@@ -542,23 +925,28 @@ class PlayState(BaseState):
             screen: Superficie donde dibujar
         """
         # Oscurecer pantalla
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        screen.blit(overlay, (0, 0))
+        self._darken(screen, 150)
 
         # Si hay confirmación pendiente, mostrar ese diálogo
         if self.show_exit_confirmation:
-            self._render_exit_confirmation(screen)
-            return
+            layer, rect = self._get_overlay_layer(('exit',))
+        else:
+            layer, rect = self._get_overlay_layer(('pause', self.pause_menu_selected))
+        screen.blit(layer, rect)
 
+    def _draw_pause_menu(self, target: pygame.Surface):
+        """
+        Dibuja el menú de pausa con la opción seleccionada actual.
+
+        Args:
+            target: Superficie donde dibujar
+        """
         # Texto de pausa
-        font_title = pygame.font.Font(None, 74)
-        title = font_title.render("PAUSA", True, (255, 255, 255))
+        title = self._render_text(74, "PAUSA", (255, 255, 255))
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 80))
-        screen.blit(title, title_rect)
+        target.blit(title, title_rect)
 
         # Opciones del menú
-        font_option = pygame.font.Font(None, 48)
         start_y = SCREEN_HEIGHT // 2
 
         for i, option in enumerate(self.pause_menu_options):
@@ -570,22 +958,21 @@ class PlayState(BaseState):
                 color = (200, 200, 200)
                 prefix = "  "
 
-            text = font_option.render(prefix + option, True, color)
+            text = self._render_text(48, prefix + option, color)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, start_y + i * 50))
-            screen.blit(text, text_rect)
+            target.blit(text, text_rect)
 
         # Instrucciones
-        font_hint = pygame.font.Font(None, 28)
-        hint = font_hint.render("Flechas/W/S: Navegar | ENTER: Seleccionar | ESC: Continuar", True, (150, 150, 150))
+        hint = self._render_text(28, "Flechas/W/S: Navegar | ENTER: Seleccionar | ESC: Continuar", (150, 150, 150))
         hint_rect = hint.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 130))
-        screen.blit(hint, hint_rect)
+        target.blit(hint, hint_rect)
 
-    def _render_exit_confirmation(self, screen: pygame.Surface):
+    def _draw_exit_confirmation(self, target: pygame.Surface):
         """
-        Renderiza el diálogo de confirmación de salida.
+        Dibuja el diálogo de confirmación de salida.
 
         Args:
-            screen: Superficie donde dibujar
+            target: Superficie donde dibujar
         """
         # Cuadro de diálogo
         dialog_width = 450
@@ -594,30 +981,25 @@ class PlayState(BaseState):
         dialog_y = (SCREEN_HEIGHT - dialog_height) // 2
 
         # Fondo del diálogo
-        dialog_bg = pygame.Surface((dialog_width, dialog_height), pygame.SRCALPHA)
-        dialog_bg.fill((30, 30, 50, 240))
-        screen.blit(dialog_bg, (dialog_x, dialog_y))
+        target.fill((30, 30, 50, 240), (dialog_x, dialog_y, dialog_width, dialog_height))
 
         # Borde
-        pygame.draw.rect(screen, (100, 150, 255), (dialog_x, dialog_y, dialog_width, dialog_height), 3)
+        pygame.draw.rect(target, (100, 150, 255), (dialog_x, dialog_y, dialog_width, dialog_height), 3)
 
         # Texto de confirmación
-        font_title = pygame.font.Font(None, 42)
-        title = font_title.render("¿Salir al menú principal?", True, (255, 255, 255))
+        title = self._render_text(42, "¿Salir al menú principal?", (255, 255, 255))
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, dialog_y + 50))
-        screen.blit(title, title_rect)
+        target.blit(title, title_rect)
 
         # Advertencia
-        font_warning = pygame.font.Font(None, 30)
-        warning = font_warning.render("Se perderá el progreso actual", True, (255, 200, 100))
+        warning = self._render_text(30, "Se perderá el progreso actual", (255, 200, 100))
         warning_rect = warning.get_rect(center=(SCREEN_WIDTH // 2, dialog_y + 90))
-        screen.blit(warning, warning_rect)
+        target.blit(warning, warning_rect)
 
         # Opciones
-        font_options = pygame.font.Font(None, 36)
-        options_text = font_options.render("[S] Sí, salir    [N] No, continuar", True, (150, 255, 150))
+        options_text = self._render_text(36, "[S] Sí, salir    [N] No, continuar", (150, 255, 150))
         options_rect = options_text.get_rect(center=(SCREEN_WIDTH // 2, dialog_y + 140))
-        screen.blit(options_text, options_rect)
+        target.blit(options_text, options_rect)
 
     def _render_game_over(self, screen: pygame.Surface):
         """
@@ -627,34 +1009,70 @@ class PlayState(BaseState):
             screen: Superficie donde dibujar
         """
         # Oscurecer pantalla
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
+        self._darken(screen, 180)
 
+        layer, rect = self._get_overlay_layer(('game_over', self.winner))
+        screen.blit(layer, rect)
+
+    def _draw_game_over(self, target: pygame.Surface):
+        """
+        Dibuja los textos de fin de juego.
+
+        Args:
+            target: Superficie donde dibujar
+        """
         # Texto de ganador
-        font = pygame.font.Font(None, 74)
         winner_text = f"JUGADOR {self.winner} GANA!"
-        text = font.render(winner_text, True, (100, 255, 100))
+        text = self._render_text(74, winner_text, (100, 255, 100))
         rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 30))
-        screen.blit(text, rect)
+        target.blit(text, rect)
 
         # Instrucciones
-        font_small = pygame.font.Font(None, 36)
-        hint = font_small.render(
+        hint = self._render_text(
+            36,
             "ESPACIO para jugar de nuevo | ESC para salir",
-            True,
             (200, 200, 200)
         )
         hint_rect = hint.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40))
-        screen.blit(hint, hint_rect)
+        target.blit(hint, hint_rect)
 
-    def set_game_mode(self, mode: str, difficulty: str = 'medium'):
+    def _render_text(self, size: int, text: str, color: tuple) -> pygame.Surface:
+        """
+        Renderiza un texto usando la caché del AssetManager.
+
+        Args:
+            size: Tamaño de la fuente
+            text: Texto a renderizar
+            color: Color del texto
+
+        Returns:
+            Superficie con el texto (compartida, no modificar)
+        """
+        return get_asset_manager().render_text(None, size, text, color)
+
+    def set_match_seed(self, seed: Optional[int]):
+        """
+        Fija la semilla de las próximas partidas.
+
+        Args:
+            seed: Semilla (None = una nueva aleatoria en cada partida)
+        """
+        self.match_seed = seed
+
+    def set_game_mode(
+        self,
+        mode: str,
+        difficulty: str = 'medium',
+        difficulty_p1: Optional[str] = None
+    ):
         """
         Configura el modo de juego.
 
         Args:
-            mode: GameMode.PVP o GameMode.PVE
+            mode: GameMode.PVP, GameMode.PVE o GameMode.EVE
             difficulty: Dificultad de la IA (si aplica)
+            difficulty_p1: Dificultad del bot izquierdo en Bot vs Bot (None = la misma)
         """
         self.game_mode = mode
         self.ai_difficulty = difficulty
+        self.ai_difficulty_p1 = difficulty_p1
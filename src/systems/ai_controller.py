@@ -5,12 +5,13 @@ Controla la nave del bot con diferentes niveles de dificultad
 
 import random
 import math
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from ..core.constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT,
     AI_DIFFICULTY, SHIP_HEIGHT
 )
+from .intercept_cache import InterceptCache
 
 if TYPE_CHECKING:
     from ..entities.ball import Ball
@@ -23,14 +24,23 @@ class AIController:
     Implementa predicción de trayectoria con imperfecciones configurables.
     """
 
-    def __init__(self, difficulty: str = 'medium'):
+    def __init__(
+        self,
+        difficulty: str = 'medium',
+        rng: Optional[random.Random] = None,
+        intercept_cache: Optional[InterceptCache] = None
+    ):
         """
         Inicializa el controlador de IA.
 
         Args:
             difficulty: 'easy', 'medium', o 'hard'
+            rng: Generador aleatorio de simulación (None = uno propio)
+            intercept_cache: Caché de predicciones compartida entre IAs (None = una propia)
         """
         self.difficulty = difficulty
+        self.rng = rng if rng is not None else random.Random()
+        self.intercept_cache = intercept_cache if intercept_cache is not None else InterceptCache()
         self.settings = AI_DIFFICULTY.get(difficulty, AI_DIFFICULTY['medium'])
 
         # Objetivo Y donde el bot quiere posicionarse
@@ -76,8 +86,12 @@ class AIController:
             # Forzar recálculo de predicción
             self.reaction_timer = 0
 
-        # Verificar si el meteorito viene hacia el bot (jugador 2, lado derecho)
-        ball_coming_to_bot = ball.velocity.x > 0
+        # Verificar si el meteorito viene hacia el bot
+        # (jugador 2 defiende el lado derecho, jugador 1 el izquierdo)
+        if ship.player_id == 1:
+            ball_coming_to_bot = ball.velocity.x < 0
+        else:
+            ball_coming_to_bot = ball.velocity.x > 0
 
         if ball_coming_to_bot:
             self.is_returning_to_center = False
@@ -89,8 +103,8 @@ class AIController:
                 self.reaction_timer = self.settings['reaction_delay']
 
                 # Posibilidad de cometer un error grande
-                if random.random() < self.settings['mistake_chance']:
-                    self.target_y += random.uniform(-100, 100)
+                if self.rng.random() < self.settings['mistake_chance']:
+                    self.target_y += self.rng.uniform(-100, 100)
 
         else:
             # Meteorito va hacia el oponente, volver gradualmente al centro
@@ -114,40 +128,9 @@ class AIController:
         Returns:
             Posición Y predicha
         """
-        # Simulación simple de trayectoria
-        sim_x = ball.position.x
-        sim_y = ball.position.y
-        sim_vx = ball.velocity.x
-        sim_vy = ball.velocity.y
-
-        # Tamaño del paso de simulación
-        step = 0.016  # ~60 FPS
-        max_iterations = 1000
-        iterations = 0
-
-        half_size = ball.rect.width // 2 if ball.rect else 20
-
-        while iterations < max_iterations:
-            # Avanzar simulación
-            sim_x += sim_vx * step
-            sim_y += sim_vy * step
-
-            # Simular rebotes en paredes
-            if sim_y - half_size <= 0:
-                sim_y = half_size
-                sim_vy = abs(sim_vy)
-            elif sim_y + half_size >= SCREEN_HEIGHT:
-                sim_y = SCREEN_HEIGHT - half_size
-                sim_vy = -abs(sim_vy)
-
-            # Verificar si llegó al objetivo
-            if sim_x >= target_x:
-                return sim_y
-
-            iterations += 1
-
-        # Si no se alcanzó, retornar posición actual
-        return sim_y
+        # Rebotes en paredes resueltos de forma analítica y memorizados
+        # hasta el siguiente rebote del meteorito
+        return self.intercept_cache.predict(ball, target_x)
 
     def _add_error(self) -> float:
         """
@@ -157,7 +140,7 @@ class AIController:
             Error en pixeles
         """
         error_range = self.settings['prediction_error']
-        return random.uniform(-error_range, error_range)
+        return self.rng.uniform(-error_range, error_range)
 
     def _update_drift(self, dt: float):
         """
@@ -179,10 +162,10 @@ class AIController:
             max_drift = SCREEN_HEIGHT * focus_drift * 0.5
 
             # Nuevo objetivo de drift aleatorio
-            self.drift_target = random.uniform(-max_drift, max_drift)
+            self.drift_target = self.rng.uniform(-max_drift, max_drift)
 
             # Resetear timer (intervalo aleatorio)
-            self.drift_timer = random.uniform(0.5, 2.0)
+            self.drift_timer = self.rng.uniform(0.5, 2.0)
 
         # Interpolar suavemente hacia el objetivo de drift
         drift_delta = self.drift_target - self.drift_offset
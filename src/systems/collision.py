@@ -19,6 +19,8 @@ class CollisionResult:
     collision_type: str = ""  # 'paddle', 'wall_top', 'wall_bottom', 'goal_left', 'goal_right', 'laser'
     hit_position: float = 0.0  # Posición relativa de impacto (-1 a 1)
     entity: Optional[object] = None  # Entidad con la que colisionó
+    time_of_impact: float = 1.0  # Fracción del paso en la que ocurre (0 a 1)
+    impact_point: Optional[Tuple[float, float]] = None  # Centro del meteorito al impactar
 
 
 class CollisionSystem:
@@ -75,25 +77,30 @@ class CollisionSystem:
 
         return results
 
-    def check_ball_ship_collision(self, ball: Ball, ship: Ship) -> CollisionResult:
+    def check_ball_ship_collision(
+        self,
+        ball: Ball,
+        ship: Ship,
+        start: Optional[pygame.math.Vector2] = None
+    ) -> CollisionResult:
         """
         Verifica colisión entre meteorito y nave.
 
+        Sin start solo se comprueba el solapamiento al final del paso. Con
+        start se barre el recorrido del meteorito durante el paso (de start a
+        su posición actual), así que a alta velocidad o con pasos largos no
+        atraviesa la nave sin chocar.
+
         Args:
             ball: Meteorito
             ship: Nave
+            start: Posición del meteorito al inicio del paso (opcional)
 
         Returns:
-            Resultado de la colisión
+            Resultado de la colisión (con instante y punto de impacto)
         """
         result = CollisionResult()
 
-        ball_rect = ball.get_rect()
-        ship_rect = ship.get_paddle_rect()
-
-        if not ball_rect.colliderect(ship_rect):
-            return result
-
         # Verificar que el meteorito viene en la dirección correcta
         # (evitar colisiones cuando el meteorito ya rebotó)
         if ship.player_id == 1 and ball.velocity.x > 0:
@@ -101,14 +108,88 @@ class CollisionSystem:
         if ship.player_id == 2 and ball.velocity.x < 0:
             return result  # El meteorito ya va hacia la izquierda
 
+        ball_rect = ball.get_rect()
+        ship_rect = ship.get_paddle_rect()
+
+        end_x, end_y = ball.position.x, ball.position.y
+        time_of_impact = None
+        if start is not None:
+            time_of_impact = self.sweep_ball_rect(
+                start.x, start.y, end_x, end_y,
+                ball_rect.width / 2, ball_rect.height / 2, ship_rect
+            )
+
+        if time_of_impact is None:
+            if not ball_rect.colliderect(ship_rect):
+                return result
+            time_of_impact = 1.0
+
         # Colisión válida
+        if start is not None:
+            impact_x = start.x + (end_x - start.x) * time_of_impact
+            impact_y = start.y + (end_y - start.y) * time_of_impact
+        else:
+            impact_x, impact_y = end_x, end_y
+
         result.collided = True
         result.collision_type = 'paddle'
-        result.hit_position = ship.get_relative_hit_position(ball.position.y)
+        result.hit_position = ship.get_relative_hit_position(impact_y)
         result.entity = ship
+        result.time_of_impact = time_of_impact
+        result.impact_point = (impact_x, impact_y)
 
         return result
 
+    @staticmethod
+    def sweep_ball_rect(
+        start_x: float, start_y: float,
+        end_x: float, end_y: float,
+        half_width: float, half_height: float,
+        rect: pygame.Rect
+    ) -> Optional[float]:
+        """
+        Calcula el instante de impacto de una caja en movimiento contra un
+        rectángulo fijo.
+
+        La caja (centro + semitamaños) se reduce a un punto agrandando el
+        rectángulo en sus semitamaños; el impacto es la entrada del segmento
+        start -> end en ese rectángulo (método de los slabs).
+
+        Args:
+            start_x, start_y: Centro al inicio del paso
+            end_x, end_y: Centro al final del paso
+            half_width, half_height: Semitamaños de la caja
+            rect: Rectángulo contra el que se barre
+
+        Returns:
+            Fracción del paso (0 a 1) en la que empieza el contacto,
+            0 si ya se solapaban al inicio, o None si no hay contacto
+        """
+        t_enter = 0.0
+        t_exit = 1.0
+
+        for start, end, low, high in (
+            (start_x, end_x, rect.left - half_width, rect.right + half_width),
+            (start_y, end_y, rect.top - half_height, rect.bottom + half_height)
+        ):
+            delta = end - start
+            if delta == 0:
+                if not low < start < high:
+                    return None
+                continue
+
+            t1 = (low - start) / delta
+            t2 = (high - start) / delta
+            if t1 > t2:
+                t1, t2 = t2, t1
+
+            t_enter = max(t_enter, t1)
+            t_exit = min(t_exit, t2)
+            if t_enter >= t_exit:
+                return None
+
+        return t_enter
+
     def check_ball_wall_collision(self, ball: Ball) -> CollisionResult:
         """
         Verifica colisión del meteorito con paredes.
@@ -4,25 +4,48 @@ Maneja la entrada del teclado para los jugadores
 """
 
 import pygame
-from typing import Optional
+from typing import Callable, Optional, TYPE_CHECKING
 
 from ..core.constants import CONTROLS
 from ..entities.ship import Ship
 
+if TYPE_CHECKING:
+    from ..core.input_latency import InputLatencyTracker
+
 
 class InputHandler:
     """
     Maneja la entrada del teclado y la traduce a acciones de juego.
     Soporta múltiples esquemas de control.
+
+    En modo baja latencia los eventos son la única fuente de verdad: no se
+    mueve la nave al procesarlos ni se consulta pygame.key.get_pressed; el
+    movimiento se resuelve una sola vez al inicio de cada paso de simulación,
+    y una pulsación más corta que un frame no se pierde.
     """
 
-    def __init__(self):
-        """Inicializa el handler de input"""
+    def __init__(
+        self,
+        low_latency: bool = False,
+        latency_tracker: Optional['InputLatencyTracker'] = None
+    ):
+        """
+        Inicializa el handler de input
+
+        Args:
+            low_latency: Resolver el movimiento solo desde los eventos, al simular
+            latency_tracker: Medidor de latencia input -> pantalla (opcional)
+        """
         self.controls = CONTROLS
+        self.low_latency = low_latency
+        self.latency_tracker = latency_tracker
 
         # Estado de teclas presionadas
         self._keys_pressed: set[int] = set()
 
+        # Teclas pulsadas desde el último paso (conserva pulsaciones cortas)
+        self._taps: set[int] = set()
+
         # Referencias a naves (se asignan externamente)
         self.player1_ship: Optional[Ship] = None
         self.player2_ship: Optional[Ship] = None
@@ -47,11 +70,33 @@ class InputHandler:
         """
         if event.type == pygame.KEYDOWN:
             self._keys_pressed.add(event.key)
-            self._on_key_down(event.key)
+            if self.latency_tracker and self.latency_tracker.enabled:
+                self._track_latency(event.key)
+
+            if self.low_latency:
+                self._taps.add(event.key)
+            else:
+                self._on_key_down(event.key)
 
         elif event.type == pygame.KEYUP:
             self._keys_pressed.discard(event.key)
-            self._on_key_up(event.key)
+            if not self.low_latency:
+                self._on_key_up(event.key)
+
+    def _track_latency(self, key: int):
+        """
+        Registra una tecla de movimiento en el medidor de latencia.
+
+        Args:
+            key: Código de tecla
+        """
+        for ship, scheme in ((self.player1_ship, 'player1'), (self.player2_ship, 'player2')):
+            if not ship or ship.is_bot:
+                continue
+            if key in self.controls[scheme]['up']:
+                self.latency_tracker.on_input(ship, -1)
+            elif key in self.controls[scheme]['down']:
+                self.latency_tracker.on_input(ship, 1)
 
     def _on_key_down(self, key: int):
         """
@@ -115,12 +160,26 @@ class InputHandler:
         Actualización continua basada en teclas presionadas.
         Alternativa al sistema de eventos para movimiento más fluido.
         """
+        if self.low_latency:
+            active = self._keys_pressed | self._taps
+            self._taps.clear()
+            self._apply_movement(active.__contains__)
+            return
+
         keys = pygame.key.get_pressed()
+        self._apply_movement(keys.__getitem__)
+
+    def _apply_movement(self, pressed: Callable[[int], bool]):
+        """
+        Fija el movimiento de las naves de jugador según las teclas activas.
 
+        Args:
+            pressed: Función que indica si una tecla está activa
+        """
         # Player 1
         if self.player1_ship and not self.player1_ship.is_bot:
-            p1_up = any(keys[k] for k in self.controls['player1']['up'])
-            p1_down = any(keys[k] for k in self.controls['player1']['down'])
+            p1_up = any(pressed(k) for k in self.controls['player1']['up'])
+            p1_down = any(pressed(k) for k in self.controls['player1']['down'])
 
             if p1_up and not p1_down:
                 self.player1_ship.move_up()
@@ -131,8 +190,8 @@ class InputHandler:
 
         # Player 2
         if self.player2_ship and not self.player2_ship.is_bot:
-            p2_up = any(keys[k] for k in self.controls['player2']['up'])
-            p2_down = any(keys[k] for k in self.controls['player2']['down'])
+            p2_up = any(pressed(k) for k in self.controls['player2']['up'])
+            p2_down = any(pressed(k) for k in self.controls['player2']['down'])
 
             if p2_up and not p2_down:
                 self.player2_ship.move_up()
@@ -173,6 +232,7 @@ class InputHandler:
     def clear(self):
         """Limpia el estado de teclas presionadas"""
         self._keys_pressed.clear()
+        self._taps.clear()
 
         if self.player1_ship:
             self.player1_ship.stop()
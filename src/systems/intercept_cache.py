@@ -0,0 +1,86 @@
+"""
+Space Pong - Intercept Cache
+Memoriza la Y de llegada del meteorito mientras su trayectoria no cambia
+"""
+
+from typing import TYPE_CHECKING
+
+from ..core.constants import BALL_SIZE
+from .physics import predict_intercept_y
+
+if TYPE_CHECKING:
+    from ..entities.ball import Ball
+
+
+class InterceptCache:
+    """
+    Caché de predicciones de trayectoria.
+
+    Entre dos rebotes la trayectoria del meteorito es fija, así que la
+    predicción solo depende del último rebote (Ball.bounce_event: posición,
+    velocidad y rapidez en ese momento) y de la X objetivo. Cuando el
+    meteorito registra un rebote nuevo (pared, nave o reinicio) las entradas
+    guardadas se descartan.
+
+    Una instancia se puede compartir entre varias IAs: la primera consulta
+    calcula y las demás con la misma X reutilizan el resultado.
+    """
+
+    def __init__(self):
+        """Inicializa la caché vacía"""
+        self._event: tuple = ()
+        self._intercepts: dict[float, float] = {}
+
+        # Estadísticas
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def predict(self, ball: 'Ball', target_x: float) -> float:
+        """
+        Retorna la Y a la que llegará el meteorito a target_x.
+
+        Args:
+            ball: Meteorito
+            target_x: Posición X objetivo
+
+        Returns:
+            Posición Y predicha
+        """
+        event = ball.bounce_event
+        if event != self._event:
+            if self._intercepts:
+                self.invalidations += 1
+                self._intercepts.clear()
+            self._event = event
+
+        y = self._intercepts.get(target_x)
+        if y is not None:
+            self.hits += 1
+            return y
+
+        self.misses += 1
+        x, y, vx, vy, _speed = event
+        y = predict_intercept_y(x, y, vx, vy, target_x, BALL_SIZE // 2)
+        self._intercepts[target_x] = y
+        return y
+
+    def clear(self):
+        """Descarta las predicciones guardadas (mantiene las estadísticas)"""
+        self._event = ()
+        self._intercepts.clear()
+
+    def get_stats(self) -> dict[str, float]:
+        """
+        Estadísticas de uso.
+
+        Returns:
+            Diccionario con hits, misses, invalidations y hit_rate
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'invalidations': self.invalidations,
+            'hit_rate': self.hits / total if total else 0.0
+        }
@@ -5,25 +5,83 @@ Sistema de física para movimiento y rebotes
 
 import pygame
 import math
-from typing import Optional
+import random
+from typing import Optional, TYPE_CHECKING
 
 from ..core.constants import (
-    SCREEN_WIDTH, SCREEN_HEIGHT,
+    SCREEN_WIDTH, SCREEN_HEIGHT, BALL_SIZE,
     MAX_BOUNCE_ANGLE, BALL_SPEED_INCREMENT, BALL_MAX_SPEED,
     WALL_BOUNCE_VARIATION
 )
 from ..entities.ball import Ball
 from ..entities.ship import Ship
 
+if TYPE_CHECKING:
+    from .intercept_cache import InterceptCache
+
+
+def predict_intercept_y(
+    x: float,
+    y: float,
+    vx: float,
+    vy: float,
+    target_x: float,
+    half_size: float,
+    height: float = SCREEN_HEIGHT
+) -> float:
+    """
+    Calcula en tiempo constante la Y a la que un cuerpo llega a target_x,
+    rebotando en las paredes superior e inferior.
+
+    Los rebotes se resuelven "desplegando" las paredes: se avanza en línea
+    recta por el tiempo que tarda en llegar a target_x y la posición se
+    pliega sobre el rango válido [half_size, height - half_size], cuyo
+    movimiento con rebotes es periódico con periodo 2 * alto del rango.
+
+    Args:
+        x: Posición X actual
+        y: Posición Y actual
+        vx: Velocidad X (px/s)
+        vy: Velocidad Y (px/s)
+        target_x: X objetivo
+        half_size: Mitad del tamaño del cuerpo
+        height: Alto del campo
+
+    Returns:
+        Y predicha (centro de la pantalla si no se mueve en X)
+    """
+    if vx == 0:
+        return height // 2
+
+    low = half_size
+    span = height - 2 * half_size
+    if span <= 0:
+        return height // 2
+
+    # Tiempo hasta el objetivo (0 si ya lo ha pasado)
+    t = max(0.0, (target_x - x) / vx)
+
+    # Posición sin paredes relativa a la pared superior, plegada al rango
+    offset = (min(max(y, low), low + span) - low + vy * t) % (2 * span)
+    if offset > span:
+        offset = 2 * span - offset
+
+    return low + offset
+
 
 class PhysicsSystem:
     """
     Sistema de física que maneja movimiento y rebotes.
     """
 
-    def __init__(self):
-        """Inicializa el sistema de física"""
-        pass
+    def __init__(self, rng: Optional[random.Random] = None):
+        """
+        Inicializa el sistema de física.
+
+        Args:
+            rng: Generador aleatorio de simulación (None = uno propio)
+        """
+        self.rng = rng if rng is not None else random.Random()
 
     def update(self, dt: float, ball: Ball, ships: list[Ship]):
         """
@@ -65,12 +123,14 @@ class PhysicsSystem:
             ball.position.y = half_size
             ball.velocity.y = abs(ball.velocity.y)
             self._add_bounce_variation(ball)
+            ball.record_bounce()
 
         # Pared inferior
         elif ball.position.y + half_size >= SCREEN_HEIGHT:
             ball.position.y = SCREEN_HEIGHT - half_size
             ball.velocity.y = -abs(ball.velocity.y)
             self._add_bounce_variation(ball)
+            ball.record_bounce()
 
     def _add_bounce_variation(self, ball: Ball):
         """
@@ -79,8 +139,7 @@ class PhysicsSystem:
         Args:
             ball: Meteorito
         """
-        import random
-        ball.velocity.y += random.uniform(-WALL_BOUNCE_VARIATION, WALL_BOUNCE_VARIATION)
+        ball.velocity.y += self.rng.uniform(-WALL_BOUNCE_VARIATION, WALL_BOUNCE_VARIATION)
 
     @staticmethod
     def bounce_off_paddle(ball: Ball, ship: Ship) -> bool:
@@ -125,16 +184,50 @@ class PhysicsSystem:
         else:
             ball.position.x = ship.rect.left - ball.rect.width // 2 - 5
 
+        # Trayectoria nueva: invalida las predicciones en caché
+        ball.record_bounce()
+
         # Registrar último golpe
         ball.last_hit_by = ship.player_id
 
         return True
 
+    @staticmethod
+    def bounce_off_paddle_at(
+        ball: Ball,
+        ship: Ship,
+        impact_point: tuple[float, float],
+        remaining_dt: float
+    ) -> bool:
+        """
+        Rebota el meteorito en el instante de impacto de un barrido.
+
+        Lleva el meteorito al punto de impacto, aplica el rebote (el ángulo
+        depende de esa Y) y avanza con la nueva velocidad el resto del paso.
+
+        Args:
+            ball: Meteorito
+            ship: Nave
+            impact_point: Centro del meteorito al impactar
+            remaining_dt: Tiempo del paso que queda tras el impacto
+
+        Returns:
+            True si se realizó el rebote
+        """
+        ball.position.update(impact_point)
+        PhysicsSystem.bounce_off_paddle(ball, ship)
+
+        ball.position.x += ball.velocity.x * remaining_dt
+        ball.position.y += ball.velocity.y * remaining_dt
+        ball.rect.center = (int(ball.position.x), int(ball.position.y))
+
+        return True
+
     @staticmethod
     def predict_ball_position(
         ball: Ball,
         target_x: float,
-        max_iterations: int = 1000
+        cache: Optional['InterceptCache'] = None
     ) -> float:
         """
         Predice la posición Y donde llegará el meteorito a una X dada.
@@ -143,48 +236,25 @@ class PhysicsSystem:
         Args:
             ball: Meteorito
             target_x: Posición X objetivo
-            max_iterations: Máximo de iteraciones de simulación
+            cache: Caché de predicciones compartida (opcional)
 
         Returns:
             Posición Y predicha
         """
-        # Simular movimiento
         sim_x = ball.position.x
-        sim_y = ball.position.y
         sim_vx = ball.velocity.x
-        sim_vy = ball.velocity.y
-
-        # Tamaño del paso de simulación
-        step = 0.016  # ~60 FPS
 
         # Si la pelota no va hacia el objetivo, no hay predicción válida
         if (target_x > sim_x and sim_vx <= 0) or (target_x < sim_x and sim_vx >= 0):
             return SCREEN_HEIGHT // 2
 
-        iterations = 0
-        half_size = ball.rect.width // 2
-
-        while iterations < max_iterations:
-            # Avanzar simulación
-            sim_x += sim_vx * step
-            sim_y += sim_vy * step
-
-            # Simular rebotes en paredes
-            if sim_y - half_size <= 0:
-                sim_y = half_size
-                sim_vy = abs(sim_vy)
-            elif sim_y + half_size >= SCREEN_HEIGHT:
-                sim_y = SCREEN_HEIGHT - half_size
-                sim_vy = -abs(sim_vy)
-
-            # Verificar si llegó al objetivo
-            if (sim_vx > 0 and sim_x >= target_x) or (sim_vx < 0 and sim_x <= target_x):
-                return sim_y
-
-            iterations += 1
+        if cache is not None:
+            return cache.predict(ball, target_x)
 
-        # Si no se alcanzó, retornar posición actual
-        return sim_y
+        return predict_intercept_y(
+            sim_x, ball.position.y, sim_vx, ball.velocity.y,
+            target_x, BALL_SIZE // 2
+        )
 
     @staticmethod
     def calculate_collision_normal(
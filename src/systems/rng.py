@@ -0,0 +1,53 @@
+"""
+Space Pong - Match RNG
+Servicio de números aleatorios por partida con streams separados
+"""
+
+import random
+from typing import Optional
+
+
+class MatchRNG:
+    """
+    Generadores aleatorios de una partida, derivados de una sola semilla.
+
+    - simulation: todo lo que afecta al resultado (dirección del meteorito,
+      rebotes, decisiones de la IA)
+    - cosmetic: efectos visuales que no deben alterar la simulación
+
+    Con la misma semilla y las mismas entradas, la simulación es idéntica
+    sin importar los FPS o el camino de render.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Inicializa los streams.
+
+        Args:
+            seed: Semilla de la partida (None = aleatoria)
+        """
+        self.simulation = random.Random()
+        self.cosmetic = random.Random()
+        self.seed = 0
+        self.reseed(seed)
+
+    def reseed(self, seed: Optional[int] = None) -> int:
+        """
+        Reinicia ambos streams a partir de una semilla.
+        Los objetos Random se conservan, así que las referencias
+        inyectadas siguen siendo válidas.
+
+        Args:
+            seed: Semilla de la partida (None = aleatoria)
+
+        Returns:
+            Semilla usada
+        """
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+
+        self.seed = seed
+        # Semillas de texto: derivación estable entre ejecuciones
+        self.simulation.seed(f"{seed}:simulation")
+        self.cosmetic.seed(f"{seed}:cosmetic")
+        return seed
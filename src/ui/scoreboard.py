@@ -10,6 +10,11 @@ from ..core.constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT,
     UI_PRIMARY, UI_TEXT, WINNING_SCORE
 )
+from ..managers.asset_manager import get_asset_manager
+
+LARGE_FONT_SIZE = 72
+SMALL_FONT_SIZE = 36
+LABEL_COLOR = (150, 150, 180)
 
 
 class Scoreboard:
@@ -24,13 +29,14 @@ class Scoreboard:
         Args:
             font: Fuente para el texto (None usa la por defecto)
         """
-        # Fuentes
+        # Fuentes (sin fuente propia los textos salen de la caché de textos)
+        self._custom_font = font is not None
         if font:
             self.font_large = font
         else:
-            self.font_large = pygame.font.Font(None, 72)
+            self.font_large = pygame.font.Font(None, LARGE_FONT_SIZE)
 
-        self.font_small = pygame.font.Font(None, 36)
+        self.font_small = pygame.font.Font(None, SMALL_FONT_SIZE)
 
         # Puntuaciones
         self.score_p1 = 0
@@ -48,8 +54,27 @@ class Scoreboard:
         # Animación
         self.p1_scale = 1.0
         self.p2_scale = 1.0
+        self.max_scale = 1.5
+        self.scale_steps = 10  # frames pre-escalados del pulso
         self.animation_time = 0
 
+        # Cachés (superficies convertidas al formato de pantalla):
+        # puntuaciones por (texto, color, paso de pulso) y textos fijos
+        self._scaled: dict[tuple[str, tuple, int], pygame.Surface] = {}
+        self._static: dict[str, pygame.Surface] = {}
+
+        # Elementos a dibujar (superficie, posición); se recalculan solo si
+        # cambia la puntuación, el color o el paso de animación
+        self._elements: list[tuple[pygame.Surface, pygame.Rect]] = []
+        self._elements_key: Optional[tuple] = None
+
+        # Zonas de pantalla con contenido visible (para dirty rects)
+        self._element_rects: list[pygame.Rect] = []
+
+        # Texto de render_minimal
+        self._minimal_surface: Optional[pygame.Surface] = None
+        self._minimal_key: Optional[tuple] = None
+
     def update(self, dt: float):
         """
         Actualiza animaciones del scoreboard.
@@ -75,9 +100,9 @@ class Scoreboard:
         """
         # Detectar cambios para animación
         if p1 > self.score_p1:
-            self.p1_scale = 1.5
+            self.p1_scale = self.max_scale
         if p2 > self.score_p2:
-            self.p2_scale = 1.5
+            self.p2_scale = self.max_scale
 
         self.score_p1 = p1
         self.score_p2 = p2
@@ -85,12 +110,12 @@ class Scoreboard:
     def add_point_p1(self):
         """Añade un punto al jugador 1"""
         self.score_p1 += 1
-        self.p1_scale = 1.5
+        self.p1_scale = self.max_scale
 
     def add_point_p2(self):
         """Añade un punto al jugador 2"""
         self.score_p2 += 1
-        self.p2_scale = 1.5
+        self.p2_scale = self.max_scale
 
     def reset(self):
         """Reinicia las puntuaciones"""
@@ -98,6 +123,7 @@ class Scoreboard:
         self.score_p2 = 0
         self.p1_scale = 1.0
         self.p2_scale = 1.0
+        self._scaled.clear()
 
     def get_winner(self) -> Optional[int]:
         """
@@ -112,6 +138,100 @@ class Scoreboard:
             return 2
         return None
 
+    def _render_text(self, text: str, color: tuple, large: bool = True) -> pygame.Surface:
+        """
+        Renderiza un texto completo (conserva el kerning de la fuente).
+
+        Args:
+            text: Texto a renderizar
+            color: Color del texto
+            large: Fuente grande (puntuaciones) o pequeña (etiquetas)
+
+        Returns:
+            Superficie con el texto convertida al formato de pantalla
+        """
+        if large and self._custom_font:
+            surface = self.font_large.render(text, True, color)
+        else:
+            size = LARGE_FONT_SIZE if large else SMALL_FONT_SIZE
+            surface = get_asset_manager().render_text(None, size, text, color)
+
+        # Blits más rápidos en el formato de la pantalla (si ya existe)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface
+
+    def _get_static(self, text: str, color: tuple, large: bool) -> pygame.Surface:
+        """Retorna un texto fijo (separador, etiquetas) renderizado una vez"""
+        surface = self._static.get(text)
+        if surface is None:
+            surface = self._render_text(text, color, large)
+            self._static[text] = surface
+        return surface
+
+    def _scale_step(self, scale: float) -> int:
+        """Cuantiza la escala del pulso a uno de los frames pre-escalados"""
+        if scale <= 1.0:
+            return 0
+        position = (scale - 1.0) / (self.max_scale - 1.0)
+        return max(0, min(self.scale_steps - 1, round(position * (self.scale_steps - 1))))
+
+    def _get_score_surface(self, score: int, color: tuple, step: int) -> pygame.Surface:
+        """
+        Retorna la puntuación renderizada con el frame de pulso indicado.
+
+        Args:
+            score: Puntuación
+            color: Color del texto
+            step: Paso de escala (0 = tamaño normal)
+
+        Returns:
+            Superficie con la puntuación
+        """
+        key = (str(score), color, step)
+        surface = self._scaled.get(key)
+        if surface is None:
+            surface = self._render_text(str(score), color)
+            if step > 0:
+                scale = 1.0 + (self.max_scale - 1.0) * step / (self.scale_steps - 1)
+                scaled_size = (
+                    int(surface.get_width() * scale),
+                    int(surface.get_height() * scale)
+                )
+                surface = pygame.transform.scale(surface, scaled_size)
+            self._scaled[key] = surface
+        return surface
+
+    def _layout(self, color_p1: tuple, color_p2: tuple, step_p1: int, step_p2: int):
+        """
+        Recalcula las superficies y posiciones de los elementos del marcador.
+
+        Args:
+            color_p1, color_p2: Colores de cada puntuación
+            step_p1, step_p2: Pasos de escala de cada puntuación
+        """
+        elements = []
+
+        # Puntuaciones
+        for score, color, step, pos in (
+            (self.score_p1, color_p1, step_p1, self.p1_pos),
+            (self.score_p2, color_p2, step_p2, self.p2_pos)
+        ):
+            text = self._get_score_surface(score, color, step)
+            elements.append((text, text.get_rect(center=pos)))
+
+        # Separador central
+        separator = self._get_static("-", self.color_normal, large=True)
+        elements.append((separator, separator.get_rect(center=(SCREEN_WIDTH // 2, 50))))
+
+        # Etiquetas de jugadores
+        for label_text, pos in (("P1", self.p1_pos), ("P2", self.p2_pos)):
+            label = self._get_static(label_text, LABEL_COLOR, large=False)
+            elements.append((label, label.get_rect(topleft=(pos[0] - label.get_width() // 2, 90))))
+
+        self._elements = elements
+        self._element_rects = [rect.copy() for _, rect in elements]
+
     def render(self, screen: pygame.Surface):
         """
         Renderiza el scoreboard.
@@ -132,51 +252,46 @@ class Scoreboard:
             color_p1 = self.color_highlight if self.p1_scale > 1.0 else self.color_normal
             color_p2 = self.color_highlight if self.p2_scale > 1.0 else self.color_normal
 
-        # Renderizar puntuación P1
-        p1_text = self.font_large.render(str(self.score_p1), True, color_p1)
-        if self.p1_scale != 1.0:
-            scaled_size = (
-                int(p1_text.get_width() * self.p1_scale),
-                int(p1_text.get_height() * self.p1_scale)
-            )
-            p1_text = pygame.transform.scale(p1_text, scaled_size)
-        p1_rect = p1_text.get_rect(center=self.p1_pos)
-        screen.blit(p1_text, p1_rect)
-
-        # Renderizar puntuación P2
-        p2_text = self.font_large.render(str(self.score_p2), True, color_p2)
-        if self.p2_scale != 1.0:
-            scaled_size = (
-                int(p2_text.get_width() * self.p2_scale),
-                int(p2_text.get_height() * self.p2_scale)
-            )
-            p2_text = pygame.transform.scale(p2_text, scaled_size)
-        p2_rect = p2_text.get_rect(center=self.p2_pos)
-        screen.blit(p2_text, p2_rect)
+        step_p1 = self._scale_step(self.p1_scale)
+        step_p2 = self._scale_step(self.p2_scale)
 
-        # Separador central
-        separator = self.font_large.render("-", True, self.color_normal)
-        sep_rect = separator.get_rect(center=(SCREEN_WIDTH // 2, 50))
-        screen.blit(separator, sep_rect)
+        # Recalcular solo si cambió la puntuación o el paso de animación
+        key = (self.score_p1, self.score_p2, color_p1, color_p2, step_p1, step_p2)
+        if key != self._elements_key:
+            self._layout(color_p1, color_p2, step_p1, step_p2)
+            self._elements_key = key
 
-        # Etiquetas de jugadores
-        p1_label = self.font_small.render("P1", True, (150, 150, 180))
-        p2_label = self.font_small.render("P2", True, (150, 150, 180))
-        screen.blit(p1_label, (self.p1_pos[0] - p1_label.get_width() // 2, 90))
-        screen.blit(p2_label, (self.p2_pos[0] - p2_label.get_width() // 2, 90))
+        screen.blits(self._elements, doreturn=False)
 
-    def render_minimal(self, screen: pygame.Surface):
+    def get_dirty_rects(self) -> list[pygame.Rect]:
+        """
+        Retorna las zonas con contenido visible del último render.
+        Usado por el modo dirty rects.
+        """
+        return self._element_rects
+
+    def render_minimal(self, screen: pygame.Surface, center_y: int = 40) -> pygame.Rect:
         """
         Renderiza una versión minimalista del scoreboard.
 
         Args:
             screen: Superficie donde dibujar
+            center_y: Altura del centro del texto
+
+        Returns:
+            Zona de pantalla dibujada
         """
-        # Solo números grandes
-        text = self.font_large.render(
-            f"{self.score_p1}  -  {self.score_p2}",
-            True,
-            self.color_normal
-        )
-        rect = text.get_rect(center=(SCREEN_WIDTH // 2, 40))
-        screen.blit(text, rect)
+        # Solo números grandes (el texto se re-renderiza solo si cambia la puntuación)
+        key = (self.score_p1, self.score_p2)
+        surface = self._minimal_surface
+        if surface is None or key != self._minimal_key:
+            surface = self.font_large.render(
+                f"{self.score_p1}  -  {self.score_p2}",
+                True,
+                self.color_normal
+            )
+            self._minimal_surface = surface
+            self._minimal_key = key
+
+        rect = surface.get_rect(center=(SCREEN_WIDTH // 2, center_y))
+        return screen.blit(surface, rect)
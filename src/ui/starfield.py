@@ -0,0 +1,150 @@
+"""
+Space Pong - Starfield
+Campo de estrellas animado con NumPy para fondos del menú
+"""
+
+import pygame
+import numpy as np
+from typing import Optional
+
+from ..core.constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, MENU_STAR_COUNT
+
+
+class Starfield:
+    """
+    Campo de estrellas que caen verticalmente.
+    El estado se guarda en arrays de NumPy (x, y, size, brightness, speed),
+    se actualiza en un solo paso vectorizado y se rasteriza con pygame.surfarray.
+    """
+
+    # Distribución de tamaños (radio en pixeles)
+    SIZES = (1, 1, 1, 2, 2, 3)
+
+    def __init__(
+        self,
+        count: int = MENU_STAR_COUNT,
+        width: int = SCREEN_WIDTH,
+        height: int = SCREEN_HEIGHT,
+        seed: Optional[int] = None
+    ):
+        """
+        Inicializa el campo de estrellas.
+
+        Args:
+            count: Número de estrellas
+            width: Ancho del área
+            height: Alto del área
+            seed: Semilla del generador (None = aleatoria)
+        """
+        self.count = count
+        self.width = width
+        self.height = height
+
+        self._rng = np.random.default_rng(seed)
+
+        # Forma de cada tamaño de estrella: offsets (dx, dy) de sus píxeles
+        self._masks = {size: self._circle_offsets(size) for size in set(self.SIZES)}
+
+        # Sprites para el camino alternativo con blits (superficies sin acceso a píxeles)
+        self._sprites: dict[tuple[int, int], pygame.Surface] = {}
+
+        self.generate()
+
+    @staticmethod
+    def _circle_offsets(radius: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Calcula los píxeles que pygame.draw.circle pinta para un radio.
+
+        Args:
+            radius: Radio del círculo
+
+        Returns:
+            Tupla (dx, dy) de offsets respecto al centro
+        """
+        size = radius * 2 + 1
+        surface = pygame.Surface((size, size))
+        pygame.draw.circle(surface, (255, 255, 255), (radius, radius), radius)
+        dx, dy = np.nonzero(pygame.surfarray.array2d(surface))
+        return dx - radius, dy - radius
+
+    def generate(self):
+        """Genera posiciones y propiedades aleatorias para todas las estrellas"""
+        n = self.count
+        self.x = self._rng.integers(0, self.width + 1, n).astype(np.float32)
+        self.y = self._rng.integers(0, self.height + 1, n).astype(np.float32)
+        self.size = self._rng.choice(self.SIZES, n).astype(np.int32)
+        self.brightness = self._rng.integers(100, 256, n).astype(np.uint8)
+        self.speed = self._rng.uniform(0.2, 1.0, n).astype(np.float32)
+
+    def update(self, dt: float):
+        """
+        Mueve todas las estrellas hacia abajo.
+
+        Args:
+            dt: Delta time en segundos
+        """
+        # La velocidad está expresada en pixeles por frame a FPS nominal
+        self.y += self.speed * (dt * FPS)
+
+        # Las que salen por abajo reaparecen arriba en una X aleatoria
+        wrapped = self.y > self.height
+        wrapped_count = int(np.count_nonzero(wrapped))
+        if wrapped_count:
+            self.y[wrapped] = 0
+            self.x[wrapped] = self._rng.integers(0, self.width, wrapped_count)
+
+    def render(self, screen: pygame.Surface):
+        """
+        Dibuja las estrellas.
+
+        Args:
+            screen: Superficie donde dibujar
+        """
+        try:
+            pixels = pygame.surfarray.pixels3d(screen)
+        except (ValueError, pygame.error):
+            self._render_blits(screen)
+            return
+
+        screen_w, screen_h = pixels.shape[0], pixels.shape[1]
+        xs = self.x.astype(np.int32)
+        ys = self.y.astype(np.int32)
+
+        for radius, (dx, dy) in self._masks.items():
+            selected = self.size == radius
+            if not selected.any():
+                continue
+
+            # Todas las combinaciones estrella x pixel de la forma
+            px = (xs[selected][:, None] + dx[None, :]).ravel()
+            py = (ys[selected][:, None] + dy[None, :]).ravel()
+            values = np.repeat(self.brightness[selected], dx.size)
+
+            inside = (px >= 0) & (px < screen_w) & (py >= 0) & (py < screen_h)
+            pixels[px[inside], py[inside]] = values[inside][:, None]
+
+        # Liberar el bloqueo de la superficie
+        del pixels
+
+    def _render_blits(self, screen: pygame.Surface):
+        """
+        Dibuja las estrellas con sprites pre-renderizados y un solo blits.
+
+        Args:
+            screen: Superficie donde dibujar
+        """
+        sequence = []
+        for x, y, radius, brightness in zip(
+            self.x.astype(np.int32).tolist(),
+            self.y.astype(np.int32).tolist(),
+            self.size.tolist(),
+            self.brightness.tolist()
+        ):
+            sprite = self._sprites.get((radius, brightness))
+            if sprite is None:
+                sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+                pygame.draw.circle(sprite, (brightness,) * 3, (radius, radius), radius)
+                self._sprites[(radius, brightness)] = sprite
+            sequence.append((sprite, (x - radius, y - radius)))
+
+        screen.blits(sequence, doreturn=False)
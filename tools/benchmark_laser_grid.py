@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Space Pong - Benchmark LaserGrid.render
+======================================
+
+Compara el coste por frame del pulso del láser:
+  - copia:  copia del sprite + set_alpha en cada frame (método anterior)
+  - frames: blit del frame pre-calculado más cercano
+
+Uso:
+    python tools/benchmark_laser_grid.py [iteraciones]
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+# Ejecutar sin ventana
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import pygame
+
+from src.core.constants import SCREEN_WIDTH, SCREEN_HEIGHT, EFFECTS_DIR
+from src.entities.laser_grid import LaserGrid
+
+
+def time_render(laser: LaserGrid, screen: pygame.Surface, iterations: int) -> float:
+    """
+    Mide el tiempo medio de LaserGrid.render.
+
+    Returns:
+        Microsegundos por frame
+    """
+    dt = 1 / 60
+    start = time.perf_counter()
+    for _ in range(iterations):
+        laser.update(dt)
+        laser.render(screen)
+    elapsed = time.perf_counter() - start
+    return elapsed / iterations * 1_000_000
+
+
+def main():
+    """Función principal"""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    sprite_path = EFFECTS_DIR / 'laser_grid.png'
+    sprite = pygame.image.load(str(sprite_path)).convert_alpha() if sprite_path.exists() else None
+
+    print("=" * 50)
+    print("Space Pong - Benchmark LaserGrid.render")
+    print("=" * 50)
+    print(f"Iteraciones: {iterations}")
+
+    results = {}
+    for label, use_frames in (('copia', False), ('frames', True)):
+        laser = LaserGrid(sprite=sprite)
+        laser.use_pulse_frames = use_frames
+        # Calentar
+        time_render(laser, screen, 100)
+        results[label] = time_render(laser, screen, iterations)
+        print(f"  {label:>8}: {results[label]:8.1f} us/frame")
+
+    if results['frames'] > 0:
+        print(f"  Mejora:   {results['copia'] / results['frames']:.2f}x")
+
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
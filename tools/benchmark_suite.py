@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Space Pong - Suite de micro-benchmarks
+======================================
+
+Mide de forma aislada el coste de update/render de entidades, UI y estados
+sobre el driver dummy de SDL, guarda los resultados en JSON y compara contra
+una línea base para detectar regresiones.
+
+Uso:
+    python tools/benchmark_suite.py run [-n ITERACIONES] [-o resultados.json] [-k FILTRO]
+    python tools/benchmark_suite.py compare base.json [actual.json] [--threshold 0.15]
+
+Si en 'compare' no se indica actual.json, se ejecuta la suite en el momento.
+El código de salida de 'compare' es 1 si hay alguna regresión.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import statistics
+from pathlib import Path
+from typing import Callable, Optional
+
+# Ejecutar sin ventana ni audio
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import pygame
+
+from src.core.constants import GameState, GameMode, SCREEN_WIDTH, SCREEN_HEIGHT
+from src.core.game import Game
+from src.systems.ai_controller import AIController
+
+DT = 1 / 120  # Paso fijo de simulación por defecto
+SEED = 1234
+
+
+def build_benchmarks(game: Game) -> dict[str, Callable[[], None]]:
+    """
+    Prepara los casos de prueba con entidades reales de una partida.
+
+    Args:
+        game: Juego headless ya inicializado
+
+    Returns:
+        {nombre: función que ejecuta una iteración}
+    """
+    screen = game.screen
+    menu = game.state_manager.get_state(GameState.MENU)
+    play = game.state_manager.get_state(GameState.PLAYING)
+
+    # Partida PVE con semilla fija para que cada ejecución sea comparable
+    play.set_game_mode(GameMode.PVE, 'medium')
+    play.set_match_seed(SEED)
+    game.state_manager.change_state(GameState.PLAYING, immediate=True)
+
+    ball = play.ball
+    ship = play.player2
+    laser = play.laser_grid
+    scoreboard = play.scoreboard
+
+    def ball_update():
+        ball.update(DT)
+        if ball.is_out_of_bounds()[0]:
+            ball.reset()
+
+    # Estela llena: el meteorito se mueve y deja historial
+    for _ in range(ball.trail.length):
+        ball_update()
+
+    def ball_render_with_trail():
+        ball.render_with_trail(screen)
+
+    def laser_render():
+        laser.update(DT)
+        laser.render(screen)
+
+    # Caso peor: nave pegada al láser, con el glow activo
+    effects_ship = play.player1
+    effects_ship.position.x = effects_ship.max_x
+    effects_ship.rect.center = (int(effects_ship.position.x), int(effects_ship.position.y))
+
+    def ship_render_with_effects():
+        effects_ship.render_with_effects(screen)
+
+    def scoreboard_render():
+        scoreboard.render(screen)
+
+    # Animación de punto: cada iteración cambia la escala y obliga a recomponer
+    scales = [1.0 + 0.05 * i for i in range(11)]
+    scale_index = [0]
+
+    def scoreboard_render_animated():
+        scale_index[0] = (scale_index[0] + 1) % len(scales)
+        scoreboard.p1_scale = scales[scale_index[0]]
+        scoreboard.render(screen)
+
+    def play_render_background():
+        play._render_background(screen)
+
+    def menu_render():
+        menu.render(screen)
+
+    # IA con el meteorito en camino hacia su lado
+    ai = AIController('hard', random.Random(SEED))
+    ai_ball = play.ball
+    ai_ship = play.player2
+
+    def ai_update():
+        ai_ball.velocity.x = abs(ai_ball.velocity.x) or 300
+        ai.update(DT, ai_ball, ai_ship)
+
+    return {
+        'Ball.update': ball_update,
+        'Ball.render_with_trail': ball_render_with_trail,
+        'LaserGrid.render': laser_render,
+        'Ship.render_with_effects': ship_render_with_effects,
+        'Scoreboard.render': scoreboard_render,
+        'Scoreboard.render[anim]': scoreboard_render_animated,
+        'PlayState._render_background': play_render_background,
+        'MenuState.render': menu_render,
+        'AIController.update': ai_update,
+    }
+
+
+def time_case(func: Callable[[], None], iterations: int, repeats: int) -> dict:
+    """
+    Mide una función varias veces.
+
+    Args:
+        func: Iteración a medir
+        iterations: Iteraciones por repetición
+        repeats: Número de repeticiones
+
+    Returns:
+        Estadísticas en microsegundos por iteración
+    """
+    # Calentar cachés (sprites, textos, frames pre-calculados)
+    for _ in range(min(200, iterations)):
+        func()
+
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        samples.append((time.perf_counter() - start) / iterations * 1_000_000)
+
+    return {
+        'median_us': statistics.median(samples),
+        'best_us': min(samples),
+        'worst_us': max(samples),
+        'iterations': iterations,
+        'repeats': repeats,
+    }
+
+
+def run_suite(iterations: int, repeats: int, name_filter: Optional[str] = None) -> dict:
+    """
+    Ejecuta la suite completa.
+
+    Args:
+        iterations: Iteraciones por repetición
+        repeats: Repeticiones por caso
+        name_filter: Subcadena para ejecutar solo algunos casos
+
+    Returns:
+        Documento con metadatos y resultados
+    """
+    game = Game(headless=True)
+    benchmarks = build_benchmarks(game)
+
+    results = {}
+    for name, func in benchmarks.items():
+        if name_filter and name_filter.lower() not in name.lower():
+            continue
+        results[name] = time_case(func, iterations, repeats)
+        stats = results[name]
+        print(f"  {name:<32} {stats['median_us']:9.2f} us  (mejor {stats['best_us']:.2f})")
+
+    pygame.quit()
+
+    return {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'platform': platform.platform(),
+            'screen': [SCREEN_WIDTH, SCREEN_HEIGHT],
+        },
+        'results': results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """
+    Compara dos ejecuciones caso por caso (mediana).
+
+    Args:
+        baseline: Resultados de referencia
+        current: Resultados actuales
+        threshold: Aumento relativo permitido (0.15 = 15%)
+
+    Returns:
+        Nombres de los casos con regresión
+    """
+    regressions = []
+    base_results = baseline.get('results', {})
+    current_results = current.get('results', {})
+
+    print(f"  {'caso':<32} {'base':>10} {'actual':>10} {'cambio':>9}")
+    for name in sorted(set(base_results) | set(current_results)):
+        if name not in base_results or name not in current_results:
+            print(f"  {name:<32} {'(solo en una de las ejecuciones)':>31}")
+            continue
+
+        base = base_results[name]['median_us']
+        now = current_results[name]['median_us']
+        change = (now - base) / base if base > 0 else 0.0
+
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESIÓN"
+            regressions.append(name)
+        elif change < -threshold:
+            flag = "  mejora"
+
+        print(f"  {name:<32} {base:10.2f} {now:10.2f} {change * 100:+8.1f}%{flag}")
+
+    return regressions
+
+
+def load_json(path: Path) -> dict:
+    """Carga un archivo de resultados"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_json(data: dict, path: Path):
+    """Guarda un archivo de resultados"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+    print(f"Resultados guardados en: {path}")
+
+
+def parse_args() -> argparse.Namespace:
+    """Procesa los argumentos de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Space Pong - Suite de micro-benchmarks")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = sub.add_parser('run', help="Ejecutar la suite y guardar JSON")
+    compare_parser = sub.add_parser('compare', help="Comparar contra una línea base")
+
+    for p in (run_parser, compare_parser):
+        p.add_argument('-n', '--iterations', type=int, default=2000,
+                       help="Iteraciones por repetición (default: 2000)")
+        p.add_argument('-r', '--repeats', type=int, default=5,
+                       help="Repeticiones por caso (default: 5)")
+        p.add_argument('-k', '--filter', default=None,
+                       help="Ejecutar solo los casos cuyo nombre contenga este texto")
+
+    run_parser.add_argument('-o', '--output', type=Path, default=Path('benchmark_results.json'),
+                            help="Archivo JSON de salida (default: benchmark_results.json)")
+
+    compare_parser.add_argument('baseline', type=Path, help="JSON de referencia")
+    compare_parser.add_argument('current', type=Path, nargs='?', default=None,
+                                help="JSON a comparar (default: ejecutar ahora)")
+    compare_parser.add_argument('--threshold', type=float, default=0.15,
+                                help="Aumento relativo que cuenta como regresión (default: 0.15)")
+
+    return parser.parse_args()
+
+
+def main():
+    """Función principal"""
+    args = parse_args()
+
+    print("=" * 50)
+    print("Space Pong - Suite de micro-benchmarks")
+    print("=" * 50)
+
+    if args.command == 'run':
+        data = run_suite(args.iterations, args.repeats, args.filter)
+        save_json(data, args.output)
+        return
+
+    baseline = load_json(args.baseline)
+    if args.current is not None:
+        current = load_json(args.current)
+    else:
+        current = run_suite(args.iterations, args.repeats, args.filter)
+
+    print()
+    regressions = compare(baseline, current, args.threshold)
+    print()
+    if regressions:
+        print(f"Regresiones ({len(regressions)}): {', '.join(regressions)}")
+        sys.exit(1)
+    print("Sin regresiones")
+
+
+if __name__ == '__main__':
+    main()
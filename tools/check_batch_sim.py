@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Space Pong - Verificación y benchmark del simulador por lotes
+=============================================================
+
+1. Equivalencia: juega N partidas Bot vs Bot con PlayState (camino de
+   objetos) y las mismas N con BatchMatchSimulator, partiendo del mismo
+   estado del meteorito, y compara ganador, marcador, duración y posición
+   final. Para que ambos caminos consuman el mismo azar, los dos usan un
+   generador que siempre devuelve el mismo valor. Los valores elegidos hacen
+   fallar a las IAs en todas las dificultades (errores grandes con valores
+   bajos, desenfoque extremo con valores altos), así que se comparan puntos,
+   reinicios de ronda y ganador; un caso sin puntos ni partidas terminadas
+   cuenta como fallo porque no cubriría esa parte.
+2. Rendimiento: simula muchas partidas con ruido real (por defecto fácil
+   contra media, con tope de 600 s para que terminen) y muestra resultados
+   (victorias, puntos por lado, puntos por minuto) y el ritmo.
+
+Uso:
+    python tools/check_batch_sim.py [--matches 12] [--seconds 120] [--batch 10000]
+                                    [--bench-seconds 600] [--bench-difficulty easy medium]
+"""
+
+import os
+import sys
+import math
+import time
+import random
+import argparse
+from pathlib import Path
+
+# Ejecutar sin ventana ni audio
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import numpy as np
+
+from src.core.constants import GameState, GameMode, SCREEN_WIDTH, SCREEN_HEIGHT
+from src.core.game import Game
+from src.core.batch_sim import BatchMatchSimulator
+
+DIFFICULTIES = ('easy', 'medium', 'hard')
+
+
+NOISE_VALUES = (0.005, 0.02, 0.04, 0.9)
+
+
+class ConstantRandom(random.Random):
+    """random.Random determinista: random() siempre retorna el mismo valor"""
+
+    value = 0.5
+
+    def random(self) -> float:
+        return self.value
+
+
+class ConstantGenerator:
+    """Equivalente para el simulador por lotes"""
+
+    def __init__(self, value: float):
+        self.value = value
+
+    def random(self, size: int) -> np.ndarray:
+        return np.full(size, self.value)
+
+
+def initial_states(count: int, seed: int) -> np.ndarray:
+    """Estados iniciales del meteorito: filas (x, y, vx, vy)"""
+    rng = np.random.default_rng(seed)
+    angle = rng.uniform(-math.radians(60), math.radians(60), count)
+    speed = rng.uniform(300, 600, count)
+    direction = rng.choice((-1, 1), count)
+    x = rng.uniform(SCREEN_WIDTH * 0.4, SCREEN_WIDTH * 0.6, count)
+    y = rng.uniform(100, SCREEN_HEIGHT - 100, count)
+    return np.stack([x, y, np.cos(angle) * speed * direction, np.sin(angle) * speed], axis=1)
+
+
+def run_objects(play, difficulty: str, states: np.ndarray, max_steps: int, dt: float) -> list[tuple]:
+    """Juega las partidas una a una con PlayState"""
+    play.set_game_mode(GameMode.EVE, difficulty)
+    play.game.state_manager.change_state(GameState.PLAYING, immediate=True)
+
+    results = []
+    for x, y, vx, vy in states:
+        play._reset_game()
+        ball = play.ball
+        ball.position.update(x, y)
+        ball.velocity.update(vx, vy)
+        ball.speed = float(np.hypot(vx, vy))
+        ball.record_bounce()
+
+        steps = 0
+        while not play.game_over and steps < max_steps:
+            play.update(dt)
+            steps += 1
+
+        results.append((
+            play.winner or 0, play.player1.score, play.player2.score,
+            steps, ball.position.x, ball.position.y
+        ))
+    return results
+
+
+def run_batch(
+    play, difficulty: str, states: np.ndarray,
+    max_steps: int, dt: float, noise: float
+) -> list[tuple]:
+    """Juega las mismas partidas con el simulador por lotes"""
+    sim = BatchMatchSimulator(
+        len(states), difficulty, difficulty,
+        rng=ConstantGenerator(noise),
+        ball_rect_sizes=[frame.get_size() for frame in play.ball.rotation_frames],
+        ship_sizes=[play.player1.rect.size, play.player2.rect.size]
+    )
+    sim.set_ball(states[:, 0], states[:, 1], states[:, 2], states[:, 3])
+
+    for _ in range(max_steps):
+        if not sim.active.any():
+            break
+        sim.step(dt)
+
+    return [
+        (int(sim.winner[i]), int(sim.score[0][i]), int(sim.score[1][i]),
+         int(sim.steps[i]), float(sim.ball_x[i]), float(sim.ball_y[i]))
+        for i in range(len(states))
+    ]
+
+
+def check(play, matches: int, seconds: float) -> bool:
+    """
+    Compara ambos caminos en cada dificultad.
+
+    Returns:
+        True si todas las partidas coinciden
+    """
+    dt = 1.0 / max(1, play.game.settings.gameplay.tick_rate)
+    max_steps = int(seconds / dt)
+    ok = True
+
+    for noise in NOISE_VALUES:
+        play.rng.simulation.value = noise
+        for index, difficulty in enumerate(DIFFICULTIES):
+            ok = check_case(play, difficulty, noise, matches, max_steps, dt, seed=index) and ok
+
+    return ok
+
+
+def check_case(
+    play, difficulty: str, noise: float,
+    matches: int, max_steps: int, dt: float, seed: int
+) -> bool:
+    """
+    Compara ambos caminos para una dificultad y un valor de azar.
+
+    Returns:
+        True si todas las partidas coinciden y hubo puntos o partidas terminadas
+    """
+    states = initial_states(matches, seed)
+    expected = run_objects(play, difficulty, states, max_steps, dt)
+    actual = run_batch(play, difficulty, states, max_steps, dt, noise)
+
+    mismatches = 0
+    for i, (e, a) in enumerate(zip(expected, actual)):
+        same = e[:4] == a[:4] and abs(e[4] - a[4]) < 1e-6 and abs(e[5] - a[5]) < 1e-6
+        if not same:
+            mismatches += 1
+            if mismatches <= 3:
+                print(f"  {difficulty} #{i}: objetos {e} / lotes {a}")
+
+    points = sum(e[1] + e[2] for e in expected)
+    finished = sum(1 for e in expected if e[0])
+
+    # Sin puntos ni ganadores no se ha comparado la puntuación: no vale como prueba
+    if mismatches:
+        status = f"{mismatches} distintas"
+    elif not points and not finished:
+        status = "SIN COBERTURA (ni puntos ni partidas terminadas)"
+    else:
+        status = "OK"
+
+    print(
+        f"azar {noise:<5} {difficulty:<7} {matches} partidas, {finished} terminadas, "
+        f"{points} puntos: {status}"
+    )
+    return status == "OK"
+
+
+def bench(play, count: int, seconds: float, difficulty_p1: str, difficulty_p2: str):
+    """Simula un lote grande con ruido real"""
+    print(f"{difficulty_p1} vs {difficulty_p2}, tope {seconds:.0f} s por partida")
+    sim = BatchMatchSimulator(
+        count, difficulty_p1, difficulty_p2, seed=1,
+        ball_rect_sizes=[frame.get_size() for frame in play.ball.rotation_frames],
+        ship_sizes=[play.player1.rect.size, play.player2.rect.size]
+    )
+    report = sim.run(max_match_seconds=seconds)
+    print(report.summary())
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Verifica el simulador por lotes")
+    parser.add_argument('--matches', type=int, default=12, help="Partidas por dificultad en la verificación")
+    parser.add_argument('--seconds', type=float, default=120.0, help="Tiempo simulado máximo por partida")
+    parser.add_argument('--batch', type=int, default=10000, help="Partidas del benchmark (0 = omitir)")
+    parser.add_argument(
+        '--bench-seconds', type=float, default=600.0,
+        help="Tiempo simulado máximo por partida en el benchmark"
+    )
+    parser.add_argument(
+        '--bench-difficulty', nargs=2, default=['easy', 'medium'], choices=DIFFICULTIES,
+        metavar=('P1', 'P2'), help="Dificultades del benchmark"
+    )
+    args = parser.parse_args()
+
+    game = Game(headless=True)
+    play = game.state_manager.get_state(GameState.PLAYING)
+    # Mismo azar en ambos caminos (antes de crear meteorito e IAs)
+    play.rng.simulation = ConstantRandom()
+
+    print("=" * 50)
+    print("Space Pong - Simulador por lotes")
+    print("=" * 50)
+    start = time.perf_counter()
+    ok = check(play, args.matches, args.seconds)
+    print(f"Verificación: {time.perf_counter() - start:.1f} s")
+
+    if args.batch:
+        print("-" * 50)
+        bench(play, args.batch, args.bench_seconds, *args.bench_difficulty)
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Space Pong - Verificación y benchmark de la predicción de trayectoria
+=====================================================================
+
+Compara predict_intercept_y (forma cerrada, rebotes plegados) con la
+simulación por pasos de 16 ms que usaban la IA y PhysicsSystem:
+  - corrección: casos aleatorios con tolerancia acorde al error del paso
+  - velocidad:  tiempo medio por predicción de cada versión
+
+La simulación por pasos tiene error propio: al llegar al objetivo se pasa
+hasta un paso en X, y cada rebote recorta hasta un paso en Y. La tolerancia
+es |vy| * paso * (rebotes + 1), más un margen de redondeo.
+
+Uso:
+    python tools/check_prediction.py [casos] [iteraciones]
+"""
+
+import sys
+import math
+import time
+import random
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.core.constants import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, BALL_SIZE, BALL_MAX_SPEED, SHIP_P1_X, SHIP_P2_X
+)
+from src.systems.physics import predict_intercept_y
+
+STEP = 0.016  # paso de la versión por pasos (~60 FPS)
+MAX_ITERATIONS = 1000
+
+
+def predict_stepping(
+    x: float, y: float, vx: float, vy: float,
+    target_x: float, half_size: float
+) -> tuple[float, int]:
+    """
+    Versión de referencia por pasos (la implementación anterior).
+
+    Returns:
+        (Y predicha, rebotes simulados)
+    """
+    bounces = 0
+    for _ in range(MAX_ITERATIONS):
+        x += vx * STEP
+        y += vy * STEP
+
+        if y - half_size <= 0:
+            y = half_size
+            vy = abs(vy)
+            bounces += 1
+        elif y + half_size >= SCREEN_HEIGHT:
+            y = SCREEN_HEIGHT - half_size
+            vy = -abs(vy)
+            bounces += 1
+
+        if (vx > 0 and x >= target_x) or (vx < 0 and x <= target_x):
+            break
+
+    return y, bounces
+
+
+def random_case(rng: random.Random) -> tuple[float, float, float, float, float, float]:
+    """Estado aleatorio del meteorito yendo hacia una de las naves"""
+    half_size = BALL_SIZE // 2
+    speed = rng.uniform(200, BALL_MAX_SPEED)
+    angle = rng.uniform(-1.3, 1.3)  # hasta ~75 grados: varios rebotes
+    direction = rng.choice((-1, 1))
+
+    vx = direction * speed * abs(math.cos(angle))
+    vy = speed * math.sin(angle)
+    x = rng.uniform(SCREEN_WIDTH * 0.3, SCREEN_WIDTH * 0.7)
+    y = rng.uniform(half_size, SCREEN_HEIGHT - half_size)
+    target_x = SHIP_P2_X if direction > 0 else SHIP_P1_X
+
+    return x, y, vx, vy, target_x, half_size
+
+
+def check(cases: int, rng: random.Random) -> bool:
+    """
+    Verifica la forma cerrada contra la simulación por pasos.
+
+    Returns:
+        True si todos los casos están dentro de tolerancia
+    """
+    worst_ratio = 0.0
+    failures = 0
+
+    for _ in range(cases):
+        x, y, vx, vy, target_x, half_size = random_case(rng)
+        expected, bounces = predict_stepping(x, y, vx, vy, target_x, half_size)
+        actual = predict_intercept_y(x, y, vx, vy, target_x, half_size)
+
+        tolerance = abs(vy) * STEP * (bounces + 1) + 1e-6
+        error = abs(actual - expected)
+        worst_ratio = max(worst_ratio, error / tolerance)
+
+        if error > tolerance:
+            failures += 1
+            if failures <= 5:
+                print(
+                    f"  FALLO: x={x:.1f} y={y:.1f} v=({vx:.1f}, {vy:.1f}) -> "
+                    f"{actual:.2f} vs {expected:.2f} (tolerancia {tolerance:.2f})"
+                )
+
+    print(f"Casos: {cases}, fallos: {failures}, peor error/tolerancia: {worst_ratio:.2f}")
+    return failures == 0
+
+
+def bench(iterations: int, rng: random.Random):
+    """Mide el tiempo medio por predicción de cada versión"""
+    cases = [random_case(rng) for _ in range(256)]
+
+    def run(predict) -> float:
+        start = time.perf_counter()
+        for i in range(iterations):
+            x, y, vx, vy, target_x, half_size = cases[i & 255]
+            predict(x, y, vx, vy, target_x, half_size)
+        return (time.perf_counter() - start) / iterations * 1_000_000
+
+    stepping = run(predict_stepping)
+    closed = run(predict_intercept_y)
+
+    print(f"Por pasos:      {stepping:8.2f} us/predicción")
+    print(f"Forma cerrada:  {closed:8.2f} us/predicción")
+    print(f"Mejora:         {stepping / closed:8.1f}x")
+
+
+def main():
+    """Función principal"""
+    cases = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+
+    rng = random.Random(42)
+
+    print("=" * 50)
+    print("Space Pong - Predicción de trayectoria")
+    print("=" * 50)
+    ok = check(cases, rng)
+    print("-" * 50)
+    bench(iterations, rng)
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
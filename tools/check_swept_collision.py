@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Space Pong - Verificación de la colisión barrida meteorito-nave
+===============================================================
+
+Lanza el meteorito a BALL_MAX_SPEED contra la nave izquierda (quieta) con
+distintos pasos de simulación y alturas de impacto dentro de la nave, y
+cuenta cuántos disparos detecta cada versión de la colisión:
+  - discreta: solapamiento al final del paso (la versión anterior)
+  - barrida:  CollisionSystem.check_ball_ship_collision con la posición
+              al inicio del paso
+
+Con pasos largos la discreta deja pasar el meteorito a través de la nave
+(tunneling); la barrida debe detectar el 100% en todos los pasos.
+
+Uso:
+    python tools/check_swept_collision.py [disparos]
+"""
+
+import os
+import sys
+import random
+from pathlib import Path
+
+# Ejecutar sin ventana ni audio
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.core.constants import GameState, GameMode, BALL_MAX_SPEED, SCREEN_WIDTH
+from src.core.game import Game
+from src.systems.collision import CollisionSystem
+
+TICK_RATES = (120, 60, 30, 10, 5, 4, 3)
+
+
+def shoot(play, collision: CollisionSystem, y: float, dt: float, swept: bool) -> bool:
+    """
+    Dispara el meteorito hacia la nave 1 y simula hasta que choca o la pasa.
+
+    Returns:
+        True si se detectó la colisión
+    """
+    ball = play.ball
+    ship = play.player1
+
+    ball.position.update(SCREEN_WIDTH // 2, y)
+    ball.velocity.update(-BALL_MAX_SPEED, 0)
+    ball.speed = BALL_MAX_SPEED
+    ball.get_rect()
+
+    while ball.position.x > ship.rect.left - ball.rect.width:
+        ball.store_previous_position()
+        ball.update(dt)
+        start = ball.previous_position if swept else None
+        if collision.check_ball_ship_collision(ball, ship, start).collided:
+            return True
+    return False
+
+
+def main():
+    """Función principal"""
+    shots = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    game = Game(headless=True)
+    play = game.state_manager.get_state(GameState.PLAYING)
+    play.set_game_mode(GameMode.PVP)
+    game.state_manager.change_state(GameState.PLAYING, immediate=True)
+
+    collision = CollisionSystem()
+    paddle = play.player1.get_paddle_rect()
+    rng = random.Random(42)
+    heights = [rng.uniform(paddle.top, paddle.bottom) for _ in range(shots)]
+
+    print("=" * 50)
+    print("Space Pong - Colisión barrida")
+    print("=" * 50)
+    print(f"{'Pasos/s':>8} {'px/paso':>8} {'Discreta':>10} {'Barrida':>10}")
+
+    ok = True
+    for tick_rate in TICK_RATES:
+        dt = 1.0 / tick_rate
+        discrete = sum(shoot(play, collision, y, dt, swept=False) for y in heights)
+        swept = sum(shoot(play, collision, y, dt, swept=True) for y in heights)
+        ok = ok and swept == shots
+        print(
+            f"{tick_rate:>8} {BALL_MAX_SPEED * dt:>8.0f} "
+            f"{discrete / shots:>10.1%} {swept / shots:>10.1%}"
+        )
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
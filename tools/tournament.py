@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Space Pong - Torneo de dificultades de la IA
+============================================
+
+Juega partidas Bot vs Bot headless para cada par de dificultades de
+AI_DIFFICULTY (incluido cada una contra sí misma) repartidas entre procesos
+con ProcessPoolExecutor, una partida por tarea.
+
+Cada proceso crea su propio HeadlessRunner una sola vez y reutiliza el
+juego entre tareas. La partida i de cada emparejamiento usa la semilla
+seed + i en ambos lados del campo, así que el resultado no depende del
+número de procesos ni del orden de ejecución: cada par juega las mismas
+partidas con los lados intercambiados para anular la ventaja de lado.
+
+La tabla muestra, desde el punto de vista de la dificultad A:
+victorias, partidas sin terminar, cuota de puntos, golpes por punto
+(longitud media del rally), puntos por minuto y duración media.
+
+Uso:
+    python tools/tournament.py [--matches 20] [--seconds 300] [--workers N]
+                               [--seed 0] [--difficulties easy medium hard]
+                               [-o resultados.json]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import itertools
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Optional
+
+# Ejecutar sin ventana ni audio
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.core.constants import AI_DIFFICULTY
+from src.core.headless import HeadlessRunner, MatchResult
+
+# Runner del proceso trabajador (uno por proceso)
+_runner: Optional[HeadlessRunner] = None
+
+
+@dataclass
+class PairStats:
+    """Resultados agregados de A contra B (ambos lados del campo)"""
+    a: str
+    b: str
+    matches: int = 0
+    wins_a: int = 0
+    wins_b: int = 0
+    unfinished: int = 0
+    points_a: int = 0
+    points_b: int = 0
+    paddle_hits: int = 0
+    simulated_seconds: float = 0.0
+    finished_seconds: float = 0.0  # solo partidas terminadas
+
+    def add(self, result: MatchResult, a_is_p1: bool):
+        """
+        Suma una partida.
+
+        Args:
+            result: Resultado de la partida
+            a_is_p1: True si A jugó en el lado izquierdo
+        """
+        side_a, side_b = (1, 2) if a_is_p1 else (2, 1)
+
+        self.matches += 1
+        self.points_a += result.score[side_a - 1]
+        self.points_b += result.score[side_b - 1]
+        self.paddle_hits += result.paddle_hits
+        self.simulated_seconds += result.simulated_seconds
+
+        if result.winner == side_a:
+            self.wins_a += 1
+        elif result.winner == side_b:
+            self.wins_b += 1
+        else:
+            self.unfinished += 1
+
+        if result.winner:
+            self.finished_seconds += result.simulated_seconds
+
+    @property
+    def points(self) -> int:
+        """Puntos jugados en total"""
+        return self.points_a + self.points_b
+
+    @property
+    def win_rate_a(self) -> float:
+        """Fracción de partidas ganadas por A"""
+        return self.wins_a / self.matches if self.matches else 0.0
+
+    @property
+    def point_share_a(self) -> float:
+        """Fracción de los puntos anotados por A"""
+        return self.points_a / self.points if self.points else 0.0
+
+    @property
+    def rally_length(self) -> float:
+        """Golpes de nave por punto jugado"""
+        return self.paddle_hits / self.points if self.points else float('inf')
+
+    @property
+    def points_per_minute(self) -> float:
+        """Puntos por minuto de juego simulado"""
+        minutes = self.simulated_seconds / 60.0
+        return self.points / minutes if minutes > 0 else 0.0
+
+    @property
+    def mean_match_seconds(self) -> float:
+        """Duración media de las partidas terminadas"""
+        finished = self.wins_a + self.wins_b
+        return self.finished_seconds / finished if finished else 0.0
+
+
+def _init_worker(max_match_seconds: float):
+    """Crea el runner del proceso (el juego se construye una sola vez)"""
+    global _runner
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        _runner = HeadlessRunner(max_match_seconds=max_match_seconds)
+        _runner.difficulty_p1 = _runner.difficulty
+        _runner.start()
+
+
+def _play_task(task: tuple[str, str, int]) -> tuple[tuple[str, str, int], MatchResult, float]:
+    """
+    Juega una partida en el proceso trabajador.
+
+    Args:
+        task: (dificultad izquierda, dificultad derecha, semilla)
+
+    Returns:
+        (tarea, resultado, segundos de CPU del proceso)
+    """
+    left, right, seed = task
+    runner = _runner
+    cpu_start = time.process_time()
+
+    # Reentrar en PlayState solo si cambia el emparejamiento
+    if (runner.difficulty_p1, runner.difficulty) != (left, right):
+        runner.difficulty_p1 = left
+        runner.difficulty = right
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+            runner.start()
+
+    result = runner.play_match(seed)
+    return task, result, time.process_time() - cpu_start
+
+
+def build_tasks(difficulties: list[str], matches: int, seed: int) -> list[tuple[str, str, int]]:
+    """
+    Genera las tareas del torneo agrupadas por emparejamiento.
+
+    Args:
+        difficulties: Dificultades participantes
+        matches: Partidas por emparejamiento y lado
+        seed: Semilla base
+
+    Returns:
+        Lista de (dificultad izquierda, dificultad derecha, semilla)
+    """
+    tasks = []
+    for left, right in itertools.product(difficulties, repeat=2):
+        tasks.extend((left, right, seed + i) for i in range(matches))
+    return tasks
+
+
+def run_tournament(
+    difficulties: list[str],
+    matches: int,
+    seconds: float,
+    workers: int,
+    seed: int
+) -> tuple[dict[tuple[str, str], PairStats], float, float]:
+    """
+    Ejecuta el torneo en paralelo.
+
+    Args:
+        difficulties: Dificultades participantes
+        matches: Partidas por emparejamiento y lado
+        seconds: Tiempo simulado máximo por partida
+        workers: Procesos trabajadores
+        seed: Semilla base
+
+    Returns:
+        (estadísticas por par, tiempo real, segundos de CPU de las partidas)
+    """
+    tasks = build_tasks(difficulties, matches, seed)
+    order = {name: i for i, name in enumerate(difficulties)}
+
+    stats: dict[tuple[str, str], PairStats] = {}
+    for a, b in itertools.combinations_with_replacement(difficulties, 2):
+        stats[(a, b)] = PairStats(a, b)
+
+    # Bloques pequeños: reparto equilibrado sin pagar IPC por cada partida
+    chunksize = max(1, len(tasks) // (workers * 8))
+    cpu_seconds = 0.0
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(seconds,)
+    ) as executor:
+        for (left, right, _seed), result, cpu in executor.map(_play_task, tasks, chunksize=chunksize):
+            a_is_p1 = order[left] <= order[right]
+            key = (left, right) if a_is_p1 else (right, left)
+            stats[key].add(result, a_is_p1)
+            cpu_seconds += cpu
+    wall_seconds = time.perf_counter() - start
+
+    return stats, wall_seconds, cpu_seconds
+
+
+def print_table(stats: dict[tuple[str, str], PairStats]):
+    """Muestra la tabla de resultados"""
+    header = (
+        f"{'A':<8} {'B':<8} {'Part.':>6} {'Vict.A':>7} {'Vict.B':>7} {'S/term':>7} "
+        f"{'%Ptos A':>8} {'Rally':>6} {'Ptos/min':>9} {'Dur.(s)':>8}"
+    )
+    print(header)
+    print("-" * len(header))
+    for s in stats.values():
+        rally = f"{s.rally_length:6.1f}" if s.points else f"{'-':>6}"
+        print(
+            f"{s.a:<8} {s.b:<8} {s.matches:>6} {s.win_rate_a:>7.1%} "
+            f"{s.wins_b / s.matches if s.matches else 0:>7.1%} {s.unfinished:>7} "
+            f"{s.point_share_a:>8.1%} {rally} {s.points_per_minute:>9.2f} "
+            f"{s.mean_match_seconds:>8.1f}"
+        )
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Torneo Bot vs Bot entre dificultades de la IA")
+    parser.add_argument('--matches', type=int, default=20, help="Partidas por emparejamiento y lado")
+    parser.add_argument('--seconds', type=float, default=300.0, help="Tiempo simulado máximo por partida")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Procesos trabajadores")
+    parser.add_argument('--seed', type=int, default=0, help="Semilla base")
+    parser.add_argument(
+        '--difficulties', nargs='+', default=list(AI_DIFFICULTY),
+        choices=list(AI_DIFFICULTY), help="Dificultades participantes"
+    )
+    parser.add_argument('-o', '--output', help="Guardar resultados en JSON")
+    args = parser.parse_args()
+
+    workers = max(1, args.workers)
+    stats, wall_seconds, cpu_seconds = run_tournament(
+        args.difficulties, args.matches, args.seconds, workers, args.seed
+    )
+    total = sum(s.matches for s in stats.values())
+
+    print("=" * 50)
+    print("Space Pong - Torneo de dificultades")
+    print("=" * 50)
+    print_table(stats)
+    print("-" * 50)
+    print(f"Partidas:            {total} ({workers} procesos)")
+    print(f"Tiempo real:         {wall_seconds:.2f} s")
+    print(f"Partidas/segundo:    {total / wall_seconds:.2f}")
+    # CPU de las partidas / (tiempo real * procesos): 100% = escalado lineal
+    print(f"Eficiencia paralela: {cpu_seconds / (wall_seconds * workers):.0%}")
+
+    if args.output:
+        data = {
+            'matches': args.matches,
+            'seconds': args.seconds,
+            'seed': args.seed,
+            'workers': workers,
+            'wall_seconds': wall_seconds,
+            'pairs': [
+                {**asdict(s), 'win_rate_a': s.win_rate_a, 'point_share_a': s.point_share_a,
+                 'rally_length': s.rally_length if s.points else None,
+                 'points_per_minute': s.points_per_minute}
+                for s in stats.values()
+            ]
+        }
+        with open(args.output, 'w') as f:
+            json.dump(data, f, indent=2)
+        print(f"Resultados guardados en {args.output}")
+
+
+if __name__ == '__main__':
+    main()